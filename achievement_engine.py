@@ -0,0 +1,110 @@
+import math
+from typing import Any, Callable, Dict, Iterable, List
+from config import *
+
+class CounterWatch:
+    """One counter in one scope, with the rules still waiting on it.
+
+    Values and thresholds are stored multiplied by sign, so "below" rules
+    use the same >= test as ordinary ones. next_threshold is the lowest
+    pending threshold, which makes an update that unlocks nothing a single
+    comparison.
+    """
+    __slots__ = ("scope", "counter", "sign", "value", "rules", "next_threshold")
+
+    def __init__(self, scope: str, counter: str, sign: int):
+        self.scope = scope
+        self.counter = counter
+        self.sign = sign
+        self.rules: List[tuple] = []  # (signed threshold, achievement id), lowest first
+        self.next_threshold = math.inf
+        self.clear()
+
+    def clear(self):
+        # A "below" counter with no value yet must not count as being under its threshold
+        self.value = 0 if self.sign == 1 else -math.inf
+
+    def sort_rules(self):
+        self.rules.sort()
+        self.next_threshold = self.rules[0][0] if self.rules else math.inf
+
+class AchievementEngine:
+    """Unlocks achievements declared as data in ACHIEVEMENT_RULES.
+
+    Rules are indexed by counter, so add() and set() only look at the
+    watches for the counter they change. Lifetime counters start from the
+    saved statistics; run and level counters start at zero and are cleared
+    with reset_scope(). Listeners are called with the id of each unlock.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]] = ACHIEVEMENT_RULES):
+        self.rules = list(rules)
+        self.watches: Dict[str, tuple] = {}  # counter -> its watches
+        self.listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, listener: Callable[[str], None]):
+        self.listeners.append(listener)
+
+    def arm(self, unlocked: Iterable[str], lifetime: Dict[str, Any]):
+        """Index the rules that are still locked; lifetime counters resume from the saved stats"""
+        unlocked = set(unlocked)
+        watches: Dict[tuple, CounterWatch] = {}
+        for rule in self.rules:
+            if rule["id"] in unlocked:
+                continue
+            sign = -1 if rule.get("compare") == "below" else 1
+            key = (rule["counter"], rule["scope"], sign)
+            if key not in watches:
+                watches[key] = CounterWatch(rule["scope"], rule["counter"], sign)
+            # "below" is strict, so its negated threshold moves one float towards zero
+            threshold = rule["threshold"] if sign == 1 else math.nextafter(-rule["threshold"], math.inf)
+            watches[key].rules.append((threshold, rule["id"]))
+
+        self.watches = {}
+        for watch in watches.values():
+            watch.sort_rules()
+            if watch.scope == "lifetime" and watch.counter in lifetime:
+                watch.value = lifetime[watch.counter] * watch.sign
+            self.watches[watch.counter] = self.watches.get(watch.counter, ()) + (watch,)
+
+        # Stats saved before a rule existed may already be past it
+        for watch in watches.values():
+            if watch.value >= watch.next_threshold:
+                self.unlock_reached(watch)
+
+    def add(self, counter: str, amount: int = 1):
+        for watch in self.watches.get(counter, ()):
+            watch.value += amount * watch.sign
+            if watch.value >= watch.next_threshold:
+                self.unlock_reached(watch)
+
+    def set(self, counter: str, value: float):
+        for watch in self.watches.get(counter, ()):
+            watch.value = value * watch.sign
+            if watch.value >= watch.next_threshold:
+                self.unlock_reached(watch)
+
+    def reset_scope(self, scope: str):
+        for watches in self.watches.values():
+            for watch in watches:
+                if watch.scope == scope:
+                    watch.clear()
+
+    def unlock_reached(self, watch: CounterWatch):
+        unlocked = []
+        while watch.rules and watch.value >= watch.rules[0][0]:
+            unlocked.append(watch.rules.pop(0)[1])
+        watch.next_threshold = watch.rules[0][0] if watch.rules else math.inf
+
+        # A finished watch drops out of the index so its counter costs nothing. The
+        # tuple is replaced rather than edited, so add() can keep iterating the old one
+        if not watch.rules:
+            watches = tuple(other for other in self.watches[watch.counter] if other is not watch)
+            if watches:
+                self.watches[watch.counter] = watches
+            else:
+                del self.watches[watch.counter]
+
+        for achievement_id in unlocked:
+            for listener in self.listeners:
+                listener(achievement_id)
@@ -0,0 +1,219 @@
+import os
+import mmap
+import time
+import struct
+import hashlib
+import pygame
+from typing import Callable, Dict, Generator, Optional, Set, Tuple
+from config import *
+from utils import write_file_atomic
+from save_writer import save_writer
+
+# magic, version, kind, has alpha, then width/height/0 or frequency/channels/format
+HEADER = struct.Struct("<4sBBBxIIi")
+MAGIC = b"STAC"
+KIND_IMAGE = 1
+KIND_SOUND = 2
+
+class AssetCache:
+    """On-disk cache of decoded images and sounds.
+
+    Entries are raw buffers: RGBA/RGB pixels from pygame.image.tobytes, or
+    PCM in the mixer's current format. Each entry is keyed by a hash of its
+    source file (or of a recipe string for procedural images), so editing an
+    asset invalidates it. Warm starts memory-map an entry and wrap it with
+    pygame.image.frombuffer or Sound(buffer=...) instead of decoding it.
+    New entries are written on the save writer thread.
+
+    Reading an image is split in two so a loader thread can do the file
+    work: read_image() is safe off the main thread, and finish_image() or
+    convert_in_strips() converts the result to the display format on the
+    main thread.
+    """
+
+    def __init__(self, directory: str = ASSET_CACHE_DIR, enabled: bool = ASSET_CACHE_ENABLED):
+        self.directory = directory
+        self.enabled = enabled
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.hash_seconds = 0.0
+
+    def hash_file(self, path: str) -> str:
+        start = time.perf_counter()
+        digest = hashlib.sha1(str(ASSET_CACHE_VERSION).encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self.hash_seconds += time.perf_counter() - start
+        return digest.hexdigest()
+
+    def get_entry_path(self, key: str) -> str:
+        self.used.add(key)
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def read_entry(self, key: str, kind: int) -> Optional[Tuple[tuple, memoryview, mmap.mmap]]:
+        path = self.get_entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        header = HEADER.unpack_from(data) if len(data) >= HEADER.size else None
+        if header is None or header[0] != MAGIC or header[1] != ASSET_CACHE_VERSION or header[2] != kind:
+            data.close()
+            return None
+        return header, memoryview(data)[HEADER.size:], data
+
+    def write_entry(self, key: str, header: bytes, payload: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        save_writer.submit_task(write_file_atomic, self.get_entry_path(key), header + payload)
+
+    # Images
+
+    def load_image(self, path: str, scale: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        return self.finish_image(self.read_image(path, scale))
+
+    def read_image(self, path: str, scale: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """Unconverted image; safe on any thread, and stores a fresh decode"""
+        if not self.enabled:
+            return self.decode_image(path, scale)
+
+        key = f"image_{self.hash_file(path)}"
+        if scale:
+            key += f"_{scale[0]}x{scale[1]}"
+        image = self.read_cached_image(key)
+        if image is None:
+            image = self.decode_image(path, scale)
+            self.write_image(key, image)
+        return image
+
+    def finish_image(self, image: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+        # Main thread only: display-format conversion needs the display
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+    def get_display_format(self, alpha: bool = True) -> Optional[tuple]:
+        """(flags, depth, masks) of finished images, or None without a display; main thread only"""
+        if pygame.display.get_surface() is None:
+            return None
+        probe = self.finish_image(pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0), alpha)
+        return probe.get_flags() & pygame.SRCALPHA, probe.get_bitsize(), probe.get_masks()
+
+    def get_strip_rows(self, image: pygame.Surface) -> int:
+        return max(1, ASSET_CONVERT_STRIP_PIXELS // max(1, image.get_width()))
+
+    def make_strip_target(self, image: pygame.Surface, display_format: Optional[tuple]) -> Optional[pygame.Surface]:
+        """Blank surface for convert_in_strips. Allocating a large one is slow but needs no display, so a loader thread can do it"""
+        if display_format is None or image.get_height() <= self.get_strip_rows(image):
+            return None
+        flags, depth, masks = display_format
+        return pygame.Surface(image.get_size(), flags, depth, masks)
+
+    def convert_in_strips(self, image: pygame.Surface, target: Optional[pygame.Surface] = None,
+                          alpha: bool = True) -> Generator[None, None, pygame.Surface]:
+        """finish_image a band of rows at a time, yielding after each band; returns the converted image"""
+        width, height = image.get_size()
+        rows = self.get_strip_rows(image)
+        if pygame.display.get_surface() is None or height <= rows:
+            return self.finish_image(image, alpha)
+
+        converted = target
+        for top in range(0, height, rows):
+            strip = self.finish_image(image.subsurface((0, top, width, min(rows, height - top))), alpha)
+            if converted is None:
+                # Made in the strip's pixel format, so the whole image is never converted at once
+                converted = pygame.Surface((width, height), strip.get_flags() & pygame.SRCALPHA, strip)
+            # MAX onto the transparent target copies every channel, alpha included
+            converted.blit(strip, (0, top), special_flags=pygame.BLEND_RGBA_MAX if alpha else 0)
+            yield
+        return converted
+
+    def decode_image(self, path: str, scale: Optional[Tuple[int, int]]) -> pygame.Surface:
+        image = pygame.image.load(path)
+        if scale:
+            image = pygame.transform.scale(image, scale)
+        return image
+
+    def read_procedural_image(self, recipe: str, draw: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Unconverted draw() result, drawn once per recipe and then read from the cache; safe on any thread"""
+        if not self.enabled:
+            return draw()
+
+        key = "procedural_" + hashlib.sha1(f"{ASSET_CACHE_VERSION}:{recipe}".encode()).hexdigest()
+        image = self.read_cached_image(key)
+        if image is None:
+            image = draw()
+            self.write_image(key, image)
+        return image
+
+    def read_cached_image(self, key: str) -> Optional[pygame.Surface]:
+        entry = self.read_entry(key, KIND_IMAGE)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        (_, _, _, alpha, width, height, _), pixels, data = entry
+        if len(pixels) != width * height * (4 if alpha else 3):
+            pixels.release()
+            data.close()
+            self.misses += 1
+            return None
+        # The copy owns its pixels, after which the mapping can go
+        wrapped = pygame.image.frombuffer(pixels, (width, height), "RGBA" if alpha else "RGB")
+        image = wrapped.copy()
+        del wrapped
+        pixels.release()
+        data.close()
+        self.hits += 1
+        return image
+
+    def write_image(self, key: str, image: pygame.Surface):
+        alpha = bool(image.get_flags() & pygame.SRCALPHA)
+        width, height = image.get_size()
+        payload = pygame.image.tobytes(image, "RGBA" if alpha else "RGB")
+        self.write_entry(key, HEADER.pack(MAGIC, ASSET_CACHE_VERSION, KIND_IMAGE, alpha, width, height, 0), payload)
+
+    # Sounds
+
+    def load_sound(self, path: str) -> pygame.mixer.Sound:
+        mixer_format = pygame.mixer.get_init()
+        if not self.enabled or mixer_format is None:
+            return pygame.mixer.Sound(path)
+
+        # PCM is stored in the mixer's format, so a different mixer setup is a different entry
+        frequency, size, channels = mixer_format
+        key = f"sound_{self.hash_file(path)}_{frequency}_{size}_{channels}"
+        entry = self.read_entry(key, KIND_SOUND)
+        if entry is None:
+            self.misses += 1
+            sound = pygame.mixer.Sound(path)
+            header = HEADER.pack(MAGIC, ASSET_CACHE_VERSION, KIND_SOUND, 0, frequency, channels, size)
+            self.write_entry(key, header, sound.get_raw())
+            return sound
+
+        _, samples, data = entry
+        sound = pygame.mixer.Sound(buffer=samples)  # Copies the samples; nothing is decoded
+        samples.release()
+        data.close()
+        self.hits += 1
+        return sound
+
+    def prune(self):
+        """Delete entries that nothing loaded this session, such as ones for edited files"""
+        if not self.enabled or not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            key, extension = os.path.splitext(filename)
+            if extension == ".bin" and key not in self.used:
+                os.remove(os.path.join(self.directory, filename))
+
+    def get_stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "hash_ms": self.hash_seconds * 1000}
+
+# Global asset cache instance
+asset_cache = AssetCache()
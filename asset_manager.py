@@ -1,39 +1,228 @@
 import pygame
 import os
-import math
-from typing import Dict, Optional, Tuple
+import time
+import queue
+import random
+import threading
+from functools import partial
+from typing import Callable, Dict, Generator, List, Optional, Tuple
 from config import ASSET_PATHS, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, RED, GREEN, BLUE, YELLOW, PURPLE, ORANGE, CYAN
+from config import PLACEHOLDER_SOUND, SYNTH_SOUNDS, ASSET_FINISH_BUDGET_MS
+from trace_recorder import trace_recorder
+from asset_cache import asset_cache
+from sound_synth import sound_synth
+
+# Flags for get_scaled_image
+IMAGE_SMOOTH = 1
+IMAGE_FLIP_X = 2
+IMAGE_FLIP_Y = 4
+
+# Background theme -> (fill color, star color)
+BACKGROUND_THEMES = {
+    "space": (BLACK, WHITE),
+    "nebula": (PURPLE, CYAN),
+    "asteroid": ((50, 50, 50), (150, 150, 150)),
+    "cyber": ((0, 50, 0), GREEN),
+    "solar": (ORANGE, YELLOW)
+}
+
+# Powerup type -> icon color
+POWERUP_COLORS = {
+    "shield": BLUE,
+    "gun_upgrade": GREEN,
+    "ultrakill": RED,
+    "health": (0, 255, 0),
+    "life": YELLOW,
+    "speed": CYAN,
+    "rapid_fire": ORANGE
+}
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+SOUND_EXTENSIONS = ('.wav', '.mp3', '.ogg')
 
 class AssetManager:
+    """Loads and owns every image, sound and font.
+
+    load_all_assets() loads everything at once. start_loading() instead
+    makes the menu's fonts and sounds on the spot and hands file reads,
+    decoding and procedural drawing to a loader thread; update_loading() is
+    then called every frame to convert what the thread has finished on the
+    main thread, a few milliseconds at a time.
+    """
+
     def __init__(self):
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.fonts: Dict[str, pygame.font.Font] = {}
         self.backgrounds: Dict[str, pygame.Surface] = {}
+        self.masks: Dict[Tuple[str, Tuple[int, int]], pygame.mask.Mask] = {}
+        self.animations: Dict[Tuple, List[pygame.Surface]] = {}
+        self.derived: Dict[Tuple[str, Tuple[int, int], int], pygame.Surface] = {}
+        self.load_times: Dict[str, float] = {}  # Startup stage -> milliseconds
+        self.load_total = 0.0  # Milliseconds from the start of loading until everything was ready
         self.loaded = False
+        self.menu_ready = False
+        self.loader: Optional[threading.Thread] = None
+        self.results: queue.Queue = queue.Queue()  # (kind, name, decoded asset or exception) from the loader
+        self.current_job: Optional[Generator] = None  # A loaded asset part way through conversion
+        self.display_formats: Dict[bool, Optional[tuple]] = {}  # alpha -> pixel format for large images
+        self.jobs_total = 0
+        self.jobs_done = 0
+        self.load_started = 0.0
     
     def load_all_assets(self):
         if self.loaded:
             return
         
-        self.load_images()
-        self.load_sounds()
-        self.load_fonts()
-        self.create_procedural_assets()
+        stages = [
+            ("images", "load_images", self.load_images),
+            ("sounds", "load_sounds", self.load_sounds),
+            ("fonts", "load_fonts", self.load_fonts),
+            ("procedural", "create_procedural_assets", self.create_procedural_assets)
+        ]
+        with trace_recorder.span("load_assets"):
+            for stage, span_name, load in stages:
+                start = time.perf_counter()
+                with trace_recorder.span(span_name):
+                    load()
+                self.load_times[stage] = (time.perf_counter() - start) * 1000
+        self.load_total = sum(self.load_times.values())
+        self.menu_ready = True
+        self.finish_startup()
+    
+    def finish_startup(self):
+        asset_cache.prune()
         self.loaded = True
+        print(self.get_startup_report())
+    
+    def get_startup_report(self) -> str:
+        stats = asset_cache.get_stats()
+        stages = ", ".join(f"{stage} {ms:.1f}" for stage, ms in self.load_times.items())
+        return (f"Assets loaded in {self.load_total:.1f} ms ({stages}; "
+                f"cache {stats['hits']} hits, {stats['misses']} misses, hashing {stats['hash_ms']:.1f})")
+    
+    # Background loading
+    
+    def start_loading(self):
+        if self.loaded or self.loader is not None:
+            return
+        
+        self.load_started = time.perf_counter()
+        # Everything the menu draws or plays is made here, so it works from the first frame
+        with trace_recorder.span("load_menu_assets"):
+            self.load_fonts()
+            self.create_synth_sounds()
+        self.load_times["menu"] = (time.perf_counter() - self.load_started) * 1000
+        self.load_times["main_thread"] = 0.0
+        self.menu_ready = True
+        
+        # (kind, name, read): read runs on the loader thread
+        jobs = [("image", name, partial(self.read_image_file, path))
+                for name, path in ASSET_PATHS.items() if path.endswith(IMAGE_EXTENSIONS)]
+        jobs += [("sound", name, partial(self.read_sound_file, path))
+                 for name, path in ASSET_PATHS.items() if path.endswith(SOUND_EXTENSIONS)]
+        jobs += [(kind, name, partial(self.read_procedural_image, draw))
+                 for kind, name, draw in self.get_procedural_jobs()]
+        self.display_formats = {alpha: asset_cache.get_display_format(alpha) for alpha in (True, False)}
+        self.jobs_total = len(jobs)
+        self.jobs_done = 0
+        self.loader = threading.Thread(target=self.run_loader, args=(jobs,), name="asset-loader", daemon=True)
+        self.loader.start()
+    
+    def run_loader(self, jobs: List[Tuple[str, str, Callable]]):
+        # Reads, decoding, drawing on plain surfaces and cache writes; nothing here touches the display
+        for kind, name, read in jobs:
+            with trace_recorder.span(f"read_{kind}", {"name": name}):
+                try:
+                    result = read()
+                except Exception as e:
+                    result = e
+            self.results.put((kind, name, result))
+    
+    def read_image_file(self, path: str) -> Optional[tuple]:
+        if not os.path.exists(path):
+            return None
+        return self.prepare_image(asset_cache.read_image(path), True)
+    
+    def read_sound_file(self, path: str) -> Optional[pygame.mixer.Sound]:
+        if not os.path.exists(path):
+            return None
+        return asset_cache.load_sound(path)
+    
+    def read_procedural_image(self, draw: Callable[[], pygame.Surface]) -> tuple:
+        image = draw()
+        return self.prepare_image(image, bool(image.get_flags() & pygame.SRCALPHA))
+    
+    def prepare_image(self, image: pygame.Surface, alpha: bool) -> tuple:
+        # The arguments for convert_in_strips, with a large image's target already allocated
+        return image, asset_cache.make_strip_target(image, self.display_formats[alpha]), alpha
+    
+    def update_loading(self, budget_ms: float = ASSET_FINISH_BUDGET_MS) -> bool:
+        """Finish decoded assets for up to budget_ms; True once everything is loaded"""
+        if self.loaded:
+            return True
+        if self.loader is None:
+            return False
+        
+        start = time.perf_counter()
+        deadline = start + budget_ms / 1000
+        # Small steps until the budget runs out; only the step that crosses the deadline runs over
+        with trace_recorder.span("update_loading"):
+            while self.jobs_done < self.jobs_total and time.perf_counter() < deadline:
+                if self.current_job is None:
+                    try:
+                        self.current_job = self.finish_job(*self.results.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    next(self.current_job)
+                except StopIteration:
+                    self.current_job = None
+                    self.jobs_done += 1
+        
+        self.load_times["main_thread"] += (time.perf_counter() - start) * 1000
+        if self.jobs_done == self.jobs_total:
+            self.load_total = (time.perf_counter() - self.load_started) * 1000
+            self.loader = None
+            self.finish_startup()
+        return self.loaded
+    
+    def finish_loading(self):
+        """Block until the loader is done, for callers that need every asset now"""
+        if not self.loaded and self.loader is None:
+            self.load_all_assets()
+        while not self.update_loading(float("inf")):
+            self.loader.join(0.001)
+    
+    def finish_job(self, kind: str, name: str, result) -> Generator[None, None, None]:
+        # A generator, so converting a large image can be spread over several frames
+        if isinstance(result, Exception):
+            print(f"Error loading {kind} {name}: {result}")
+            result = None
+        if kind == "sound":
+            if result is None:
+                self.create_placeholder_sound(name)
+            else:
+                self.sounds[name] = result
+        elif result is not None:
+            self.get_image_store(kind)[name] = yield from asset_cache.convert_in_strips(*result)
+        elif kind == "image":
+            self.create_placeholder_image(name)
+    
+    def get_load_progress(self) -> float:
+        if self.loaded:
+            return 1.0
+        return self.jobs_done / self.jobs_total if self.jobs_total else 0.0
     
     def load_images(self):
         for name, path in ASSET_PATHS.items():
-            if path.endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
+            if path.endswith(IMAGE_EXTENSIONS):
                 self.load_image(name, path)
     
     def load_image(self, name: str, path: str, scale: Optional[Tuple[int, int]] = None) -> bool:
         try:
             if os.path.exists(path):
-                image = pygame.image.load(path).convert_alpha()
-                if scale:
-                    image = pygame.transform.scale(image, scale)
-                self.images[name] = image
+                self.images[name] = asset_cache.load_image(path, scale)
                 return True
             else:
                 self.create_placeholder_image(name)
@@ -93,11 +282,11 @@ class AssetManager:
         surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         surface.fill(BLACK)
         
-        # Add stars
+        # Add stars. Assets may be made mid-session, so they never draw from the session's RNG
+        rng = random.Random("background")
         for _ in range(100):
-            import random
-            star_x = random.randint(0, SCREEN_WIDTH)
-            star_y = random.randint(0, SCREEN_HEIGHT)
+            star_x = rng.randint(0, SCREEN_WIDTH)
+            star_y = rng.randint(0, SCREEN_HEIGHT)
             pygame.draw.circle(surface, WHITE, (star_x, star_y), 1)
         
         return surface
@@ -109,14 +298,13 @@ class AssetManager:
     
     def load_sounds(self):
         for name, path in ASSET_PATHS.items():
-            if path.endswith(('.wav', '.mp3', '.ogg')):
+            if path.endswith(SOUND_EXTENSIONS):
                 self.load_sound(name, path)
     
     def load_sound(self, name: str, path: str) -> bool:
         try:
             if os.path.exists(path):
-                sound = pygame.mixer.Sound(path)
-                self.sounds[name] = sound
+                self.sounds[name] = asset_cache.load_sound(path)
                 return True
             else:
                 self.create_placeholder_sound(name)
@@ -127,19 +315,18 @@ class AssetManager:
             return False
     
     def create_placeholder_sound(self, name: str):
-        # Create a simple beep sound
-        sample_rate = 22050
-        duration = 0.1
-        frames = int(duration * sample_rate)
-        
-        arr = []
-        for i in range(frames):
-            time = float(i) / sample_rate
-            wave = 4096 * math.sin(2 * math.pi * 440 * time)
-            arr.append([int(wave), int(wave)])
-        
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
-        self.sounds[name] = sound
+        # A short synthesized beep stands in for the missing file
+        sound = sound_synth.create(PLACEHOLDER_SOUND)
+        if sound:
+            self.sounds[name] = sound
+    
+    def create_synth_sounds(self):
+        # Generated effects are kept in memory like loaded ones; a file of the same name wins
+        for name, recipe in SYNTH_SOUNDS.items():
+            if name not in self.sounds:
+                sound = sound_synth.create(recipe)
+                if sound:
+                    self.sounds[name] = sound
     
     def load_fonts(self):
         font_sizes = [12, 16, 18, 24, 32, 48, 64]
@@ -160,80 +347,82 @@ class AssetManager:
             pass
     
     def create_procedural_assets(self):
-        # Create shield effect
-        shield_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-        pygame.draw.circle(shield_surface, (0, 100, 255, 100), (30, 30), 30)
-        self.images["shield"] = shield_surface
+        for kind, name, draw in self.get_procedural_jobs():
+            image = draw()
+            self.get_image_store(kind)[name] = asset_cache.finish_image(
+                image, bool(image.get_flags() & pygame.SRCALPHA))
         
-        # Create enemy bullet
-        enemy_bullet_surface = pygame.Surface((5, 10), pygame.SRCALPHA)
-        pygame.draw.rect(enemy_bullet_surface, RED, (0, 0, 5, 10))
-        self.images["enemy_bullet"] = enemy_bullet_surface
+        # Synthesize generated sound effects
+        self.create_synth_sounds()
+    
+    def get_procedural_jobs(self) -> List[Tuple[str, str, Callable[[], pygame.Surface]]]:
+        # (kind, name, draw): draw only uses plain surfaces, so the loader thread can run it
+        jobs = [("image", "shield", self.draw_shield_image),
+                ("image", "enemy_bullet", self.draw_enemy_bullet_image)]
+        jobs += [("background", theme, partial(self.read_background_variation, theme, *colors))
+                 for theme, colors in BACKGROUND_THEMES.items()]
+        jobs += [("image", f"powerup_{powerup_type}", partial(self.draw_powerup_variation, powerup_type, color))
+                 for powerup_type, color in POWERUP_COLORS.items()]
+        return jobs
+    
+    def get_image_store(self, kind: str) -> Dict[str, pygame.Surface]:
+        return self.backgrounds if kind == "background" else self.images
+    
+    def draw_shield_image(self) -> pygame.Surface:
+        surface = pygame.Surface((60, 60), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (0, 100, 255, 100), (30, 30), 30)
+        return surface
+    
+    def draw_enemy_bullet_image(self) -> pygame.Surface:
+        surface = pygame.Surface((5, 10), pygame.SRCALPHA)
+        pygame.draw.rect(surface, RED, (0, 0, 5, 10))
+        return surface
+    
+    def read_background_variation(self, theme_name: str, bg_color: Tuple[int, int, int],
+                                  star_color: Tuple[int, int, int]) -> pygame.Surface:
+        # The star field is drawn once and then reused from the asset cache
+        recipe = f"background:{theme_name}:{bg_color}:{star_color}:{SCREEN_WIDTH}x{SCREEN_HEIGHT}"
+        return asset_cache.read_procedural_image(
+            recipe, lambda: self.draw_background_variation(bg_color, star_color, random.Random(recipe)))
+    
+    def draw_background_variation(self, bg_color: Tuple[int, int, int],
+                                  star_color: Tuple[int, int, int], rng: random.Random) -> pygame.Surface:
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(bg_color)
         
-        # Create different background variations
-        self.create_background_variations()
+        # Add themed stars/particles
+        for _ in range(80):
+            star_x = rng.randint(0, SCREEN_WIDTH)
+            star_y = rng.randint(0, SCREEN_HEIGHT)
+            size = pygame.math.Vector2(1, 3).length()
+            pygame.draw.circle(surface, star_color, (star_x, star_y), int(size))
         
-        # Create powerup variations
-        self.create_powerup_variations()
-    
-    def create_background_variations(self):
-        themes = {
-            "space": (BLACK, WHITE),
-            "nebula": (PURPLE, CYAN),
-            "asteroid": ((50, 50, 50), (150, 150, 150)),
-            "cyber": ((0, 50, 0), GREEN),
-            "solar": (ORANGE, YELLOW)
-        }
+        return surface
+    
+    def draw_powerup_variation(self, powerup_type: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (10, 10), 10)
+        pygame.draw.circle(surface, WHITE, (10, 10), 10, 2)
         
-        for theme_name, (bg_color, star_color) in themes.items():
-            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            surface.fill(bg_color)
-            
-            # Add themed stars/particles
-            for _ in range(80):
-                import random
-                star_x = random.randint(0, SCREEN_WIDTH)
-                star_y = random.randint(0, SCREEN_HEIGHT)
-                size = pygame.math.Vector2(1, 3).length()
-                pygame.draw.circle(surface, star_color, (star_x, star_y), int(size))
-            
-            self.backgrounds[theme_name] = surface
-    
-    def create_powerup_variations(self):
-        powerup_colors = {
-            "shield": BLUE,
-            "gun_upgrade": GREEN,
-            "ultrakill": RED,
-            "health": (0, 255, 0),
-            "life": YELLOW,
-            "speed": CYAN,
-            "rapid_fire": ORANGE
-        }
+        # Add type-specific symbol
+        if powerup_type == "shield":
+            pygame.draw.circle(surface, WHITE, (10, 10), 6, 2)
+        elif powerup_type == "gun_upgrade":
+            pygame.draw.rect(surface, WHITE, (8, 6, 4, 8))
+        elif powerup_type == "ultrakill":
+            pygame.draw.polygon(surface, WHITE, [(10, 5), (15, 15), (5, 15)])
+        elif powerup_type == "health":
+            pygame.draw.rect(surface, WHITE, (8, 10, 4, 6))
+            pygame.draw.rect(surface, WHITE, (6, 8, 8, 4))
+        elif powerup_type == "life":
+            pygame.draw.polygon(surface, WHITE, [(10, 6), (13, 10), (10, 14), (7, 10)])
+        elif powerup_type == "speed":
+            pygame.draw.polygon(surface, WHITE, [(6, 10), (10, 6), (14, 10), (10, 14)])
+        elif powerup_type == "rapid_fire":
+            for i in range(3):
+                pygame.draw.circle(surface, WHITE, (6 + i * 4, 10), 1)
         
-        for powerup_type, color in powerup_colors.items():
-            surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.circle(surface, color, (10, 10), 10)
-            pygame.draw.circle(surface, WHITE, (10, 10), 10, 2)
-            
-            # Add type-specific symbol
-            if powerup_type == "shield":
-                pygame.draw.circle(surface, WHITE, (10, 10), 6, 2)
-            elif powerup_type == "gun_upgrade":
-                pygame.draw.rect(surface, WHITE, (8, 6, 4, 8))
-            elif powerup_type == "ultrakill":
-                pygame.draw.polygon(surface, WHITE, [(10, 5), (15, 15), (5, 15)])
-            elif powerup_type == "health":
-                pygame.draw.rect(surface, WHITE, (8, 10, 4, 6))
-                pygame.draw.rect(surface, WHITE, (6, 8, 8, 4))
-            elif powerup_type == "life":
-                pygame.draw.polygon(surface, WHITE, [(10, 6), (13, 10), (10, 14), (7, 10)])
-            elif powerup_type == "speed":
-                pygame.draw.polygon(surface, WHITE, [(6, 10), (10, 6), (14, 10), (10, 14)])
-            elif powerup_type == "rapid_fire":
-                for i in range(3):
-                    pygame.draw.circle(surface, WHITE, (6 + i * 4, 10), 1)
-            
-            self.images[f"powerup_{powerup_type}"] = surface
+        return surface
     
     def get_image(self, name: str) -> Optional[pygame.Surface]:
         return self.images.get(name)
@@ -247,8 +436,44 @@ class AssetManager:
     def get_background(self, name: str) -> Optional[pygame.Surface]:
         return self.backgrounds.get(name, self.backgrounds.get("space"))
     
+    def get_mask(self, name: str, image: pygame.Surface) -> pygame.mask.Mask:
+        # One shared collision mask per (image, scale); callers must not mutate it
+        key = (name, image.get_size())
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            self.masks[key] = mask
+        return mask
+    
+    def get_animation_frames(self, key: Tuple, frame_count: int,
+                             draw_frame: Callable[[int], pygame.Surface]) -> List[pygame.Surface]:
+        # Effect animations depend only on their parameters, so each frame is drawn once
+        frames = self.animations.get(key)
+        if frames is None:
+            frames = [draw_frame(index) for index in range(frame_count)]
+            self.animations[key] = frames
+        return frames
+    
+    def get_scaled_image(self, name: str, size: Tuple[int, int], flags: int = 0) -> pygame.Surface:
+        # Every sprite of a kind shares one derived surface; callers must not draw on it
+        key = (name, size, flags)
+        image = self.derived.get(key)
+        if image is None:
+            if name not in self.images:
+                self.create_placeholder_image(name)
+            scale = pygame.transform.smoothscale if flags & IMAGE_SMOOTH else pygame.transform.scale
+            image = scale(self.images[name], size)
+            if flags & (IMAGE_FLIP_X | IMAGE_FLIP_Y):
+                image = pygame.transform.flip(image, bool(flags & IMAGE_FLIP_X), bool(flags & IMAGE_FLIP_Y))
+            self.derived[key] = image
+        return image
+    
     def reload_image(self, name: str, path: str, scale: Optional[Tuple[int, int]] = None):
         self.load_image(name, path, scale)
+        for key in [key for key in self.masks if key[0] == name]:
+            del self.masks[key]
+        for key in [key for key in self.derived if key[0] == name]:
+            del self.derived[key]
     
     def create_scaled_image(self, name: str, scale: Tuple[int, int]) -> Optional[pygame.Surface]:
         if name in self.images:
@@ -0,0 +1,74 @@
+import heapq
+from typing import Callable, Dict, List, Optional
+from config import *
+from session import game_clock
+
+class AudioTimeline:
+    """Time-ordered queue of audio actions, ticked once per simulation step.
+
+    An action is a callable taking the current time in milliseconds; it may
+    return a later time to run again, which is how volume ramps advance.
+    Actions scheduled with a tag replace any earlier pending action with the
+    same tag, so starting a new music fade cancels the running one. Times
+    come from the simulated game clock, so nothing here ever blocks.
+    """
+
+    def __init__(self):
+        self.queue: List[tuple] = []  # (time, sequence, tag, action)
+        self.sequence = 0
+        self.latest_tags: Dict[str, int] = {}
+
+    def schedule(self, delay_ms: float, action: Callable[[float], Optional[float]], tag: Optional[str] = None):
+        self.sequence += 1
+        if tag is not None:
+            self.latest_tags[tag] = self.sequence
+        heapq.heappush(self.queue, (game_clock.ticks + delay_ms, self.sequence, tag, action))
+
+    def call_later(self, delay_ms: float, callback: Callable[[], None], tag: Optional[str] = None):
+        def action(now):
+            callback()
+        self.schedule(delay_ms, action, tag)
+
+    def ramp(self, duration_ms: float, start: float, end: float, apply: Callable[[float], None],
+             on_done: Optional[Callable[[], None]] = None, tag: Optional[str] = None, delay_ms: float = 0):
+        """Move a value linearly from start to end, calling apply(value) every AUDIO_RAMP_STEP_MS"""
+        began = []
+
+        def action(now):
+            if not began:
+                began.append(now)
+            progress = 1.0 if duration_ms <= 0 else min(1.0, (now - began[0]) / duration_ms)
+            apply(start + (end - start) * progress)
+            if progress < 1.0:
+                return now + AUDIO_RAMP_STEP_MS
+            if on_done:
+                on_done()
+            return None
+        self.schedule(delay_ms, action, tag)
+
+    def cancel(self, tag: str):
+        # The queued entries stay in the heap and are skipped when they come up
+        self.latest_tags.pop(tag, None)
+
+    def update(self):
+        now = game_clock.ticks
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            _, sequence, tag, action = heapq.heappop(queue)
+            if tag is not None and self.latest_tags.get(tag) != sequence:
+                continue
+            next_time = action(now)
+            if next_time is not None:
+                heapq.heappush(queue, (max(next_time, now + 1e-3), sequence, tag, action))
+            elif tag is not None and self.latest_tags.get(tag) == sequence:
+                del self.latest_tags[tag]
+
+    def clear(self):
+        self.queue = []
+        self.latest_tags = {}
+
+    def get_pending_count(self) -> int:
+        return len(self.queue)
+
+# Global audio timeline instance
+audio_timeline = AudioTimeline()
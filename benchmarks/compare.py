@@ -0,0 +1,84 @@
+"""Compare two benchmark result files and flag frame-time regressions.
+
+Usage: python benchmarks/compare.py BASELINE.json CANDIDATE.json [--threshold 0.10]
+
+Exits with status 1 when any scenario percentile got slower than the
+threshold allows, so it can gate a CI job.
+"""
+import sys
+import json
+import argparse
+
+COMPARED_METRICS = ["frame_ms", "update_ms", "render_ms"]
+COMPARED_PERCENTILES = ["p50", "p95", "p99"]
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare_results(baseline, candidate, threshold, min_delta_ms):
+    """Return (rows, regressions); a row is (scenario, metric, old, new, change, flag)"""
+    rows = []
+    regressions = 0
+
+    for name, old_stats in baseline["scenarios"].items():
+        new_stats = candidate["scenarios"].get(name)
+        if new_stats is None:
+            rows.append((name, "-", None, None, None, "missing"))
+            continue
+
+        for metric in COMPARED_METRICS:
+            for key in COMPARED_PERCENTILES:
+                old = old_stats[metric][key]
+                new = new_stats[metric][key]
+                change = (new - old) / old if old > 0 else 0.0
+
+                # Sub-threshold and tiny absolute changes are noise
+                flag = ""
+                if change > threshold and new - old >= min_delta_ms:
+                    flag = "REGRESSION"
+                    regressions += 1
+                elif change < -threshold and old - new >= min_delta_ms:
+                    flag = "improved"
+                rows.append((name, f"{metric} {key}", old, new, change, flag))
+
+    for name in candidate["scenarios"]:
+        if name not in baseline["scenarios"]:
+            rows.append((name, "-", None, None, None, "new"))
+
+    return rows, regressions
+
+def print_rows(rows):
+    print(f"{'scenario':<20} {'metric':<14} {'baseline':>10} {'candidate':>10} {'change':>8}")
+    for name, metric, old, new, change, flag in rows:
+        if old is None:
+            print(f"{name:<20} {metric:<14} {'':>10} {'':>10} {'':>8}  {flag}")
+            continue
+        print(f"{name:<20} {metric:<14} {old:>10.3f} {new:>10.3f} {change:>+8.1%}  {flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two ShooTar benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown that counts as a regression (default 0.10)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.1,
+                        help="ignore changes smaller than this many milliseconds")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    if baseline["settings"]["frames"] != candidate["settings"]["frames"]:
+        print("Warning: the runs measured different frame counts")
+
+    rows, regressions = compare_results(baseline, candidate, args.threshold, args.min_delta_ms)
+    print_rows(rows)
+
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold:.0%}")
+        return 1
+    print("No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Run the stress scenarios headlessly and write frame-time statistics as JSON.
+
+Usage: python benchmarks/run_benchmarks.py [--frames N] [--warmup N]
+       [--only NAME[,NAME...]] [--output FILE]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+# Benchmarks run from the repo root so asset paths resolve
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAUNCH_DIR = os.getcwd()
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+from input_manager import input_manager
+from game_engine import GameEngine
+from save_writer import save_writer
+from effects import effect_manager, particle_emitter
+from sprite_groups import sprite_groups
+from projectile_field import projectile_field
+from scenarios import SCENARIOS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RESULTS_VERSION = 1
+
+def percentile(sorted_values, fraction):
+    # Linear interpolation between closest ranks
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        "mean": round(sum(ordered) / len(ordered), 4) if ordered else 0.0,
+        "p50": round(percentile(ordered, 0.50), 4),
+        "p95": round(percentile(ordered, 0.95), 4),
+        "p99": round(percentile(ordered, 0.99), 4),
+        "max": round(ordered[-1], 4) if ordered else 0.0
+    }
+
+def count_sprites():
+    # Everything drawn this frame: sprites plus batched bullets and particles
+    return (sprite_groups.get_sprite_count("all") + projectile_field.get_count() +
+            particle_emitter.get_count())
+
+def reset_world(engine):
+    input_manager.stop_playback()
+    sprite_groups.reset_all()
+    projectile_field.clear()
+    particle_emitter.clear()
+    effect_manager.screen_shake.duration = 0
+    effect_manager.screen_shake.offset = (0, 0)
+    engine.ui_manager.achievement_notifications.clear()
+
+def run_scenario(engine, scenario, frames, warmup):
+    steps = warmup + frames
+    reset_world(engine)
+    engine.running = True
+    engine.begin_session(scenario.seed)
+    engine.start_new_game()
+    scenario.setup(engine, steps)
+
+    update_times = []
+    render_times = []
+    sprite_counts = []
+    for step in range(steps):
+        scenario.step(engine)
+        # Keep long runs from writing save files in the middle of a measurement
+        engine.auto_save_timer.reset()
+
+        start = time.perf_counter()
+        engine.update()
+        updated = time.perf_counter()
+        engine.render()
+        rendered = time.perf_counter()
+
+        if step >= warmup:
+            update_times.append((updated - start) * 1000)
+            render_times.append((rendered - updated) * 1000)
+            sprite_counts.append(count_sprites())
+
+    scenario.finish(engine)
+    frame_times = [update + render for update, render in zip(update_times, render_times)]
+    return {
+        "description": scenario.description,
+        "seed": scenario.seed,
+        "frames": len(frame_times),
+        "frame_ms": summarize(frame_times),
+        "update_ms": summarize(update_times),
+        "render_ms": summarize(render_times),
+        "sprites_per_frame": {
+            "mean": round(sum(sprite_counts) / len(sprite_counts), 1) if sprite_counts else 0.0,
+            "max": max(sprite_counts, default=0)
+        },
+        "over_budget_frames": sum(1 for frame in frame_times if frame > 1000 / FPS)
+    }
+
+def run_benchmarks(frames, warmup, only=None):
+    scenarios = [scenario for scenario in SCENARIOS if not only or scenario.name in only]
+    # Without persistence every run starts from default settings and leaves the saves alone
+    engine = GameEngine(headless=True, persist=False)
+
+    results = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__ if np is not None else None,
+            "platform": platform.platform()
+        },
+        "settings": {
+            "frames": frames,
+            "warmup": warmup,
+            "numpy_collisions": engine.game_state.get_setting("numpy_collisions"),
+            "projectile_field": engine.game_state.get_setting("projectile_field"),
+            "dirty_rects": engine.game_state.get_setting("dirty_rects")
+        },
+        "scenarios": {}
+    }
+
+    for scenario in scenarios:
+        print(f"Running {scenario.name}: {scenario.description}")
+        stats = run_scenario(engine, scenario, frames, warmup)
+        results["scenarios"][scenario.name] = stats
+        frame_ms = stats["frame_ms"]
+        print(f"  p50 {frame_ms['p50']:.2f} ms  p95 {frame_ms['p95']:.2f} ms  "
+              f"p99 {frame_ms['p99']:.2f} ms  sprites {stats['sprites_per_frame']['mean']}")
+
+    save_writer.stop()
+    pygame.quit()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="ShooTar stress-scenario benchmarks")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured frames before each scenario")
+    parser.add_argument("--only", help="comma-separated scenario names: " +
+                        ", ".join(scenario.name for scenario in SCENARIOS))
+    parser.add_argument("--output", default="benchmark_results.json", help="results JSON file")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    unknown = only - {scenario.name for scenario in SCENARIOS} if only else set()
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(args.frames, args.warmup, only)
+    output = os.path.join(LAUNCH_DIR, args.output)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+
+if __name__ == "__main__":
+    main()
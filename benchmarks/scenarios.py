@@ -0,0 +1,183 @@
+from config import *
+from session import session_random, game_clock
+from input_manager import input_manager
+from enemies import Enemy
+from effects import effect_manager, Explosion
+from projectiles import Bullet, add_projectile_to_game
+from projectile_field import projectile_field
+from sprite_groups import sprite_groups
+
+class Scenario:
+    """A scripted stress situation run against a real GameEngine.
+
+    setup() runs once after a new game has started and is told how many steps
+    will follow; step() runs before every simulated frame and is not part of
+    the measured frame time.
+    """
+    name = "scenario"
+    description = ""
+    seed = 1
+
+    def setup(self, engine, steps):
+        pass
+
+    def step(self, engine):
+        pass
+
+    def finish(self, engine):
+        pass
+
+def hold_keys(keys, steps):
+    # Drive the engine's real input path with a synthetic replay of held keys
+    input_manager.start_playback({
+        "keys": list(keys),
+        "masks": [[(1 << len(keys)) - 1, steps]],
+        "events": [],
+        "steps": steps
+    })
+
+def freeze_level(engine, spawn_enemies=True):
+    # Keep the level from spawning its boss or completing mid-benchmark
+    level = engine.level_manager
+    level.enemies_killed = 0
+    level.level_timer.reset()
+    if not spawn_enemies:
+        level.enemies_spawned = level.total_enemies_for_level
+
+def protect_player(player):
+    player.protected = True
+    player.protected_timer = game_clock.get_ticks()
+
+def spawn_enemy(engine, enemy_type=EnemyType.BASIC):
+    enemy = Enemy(enemy_type, 1,
+                  session_random.randint(40, SCREEN_WIDTH - 40),
+                  session_random.randint(40, SCREEN_HEIGHT // 2))
+    enemy.target = engine.player
+    sprite_groups.add_sprite(enemy, ["all", "enemies"])
+    return enemy
+
+def spawn_boss(engine, health_fraction=1.0):
+    engine.level_manager.force_boss_spawn()
+    boss = sprite_groups.get_group("bosses").sprites()[0]
+    boss.rect.y = 50  # Skip the entry glide
+    boss.health = int(boss.max_health * health_fraction)
+    return boss
+
+class BulletsVsEnemies(Scenario):
+    name = "bullets_vs_enemies"
+    description = "500 player bullets against 15 enemies that soak the hits"
+    seed = 1001
+    bullets = 500
+    enemies = 15
+
+    def setup(self, engine, steps):
+        freeze_level(engine, spawn_enemies=False)
+        # Start with the stream already filling the screen
+        self.add_bullets(0, SCREEN_HEIGHT)
+
+    def add_bullets(self, top, bottom):
+        live_bullets = sprite_groups.get_sprite_count("bullets") + projectile_field.get_count("player")
+        for _ in range(self.bullets - live_bullets):
+            bullet = Bullet.acquire(session_random.randint(0, SCREEN_WIDTH),
+                                    session_random.randint(top, bottom))
+            add_projectile_to_game(bullet)
+
+    def step(self, engine):
+        freeze_level(engine, spawn_enemies=False)
+        protect_player(engine.player)
+
+        enemies = sprite_groups.get_group("enemies")
+        for _ in range(self.enemies - len(enemies)):
+            enemy = spawn_enemy(engine, session_random.choice([EnemyType.BASIC, EnemyType.FAST]))
+            # Tough enough to soak the stream, so the collision load stays constant
+            enemy.health = 10 ** 6
+
+        # Replace spent bullets from the bottom edge
+        self.add_bullets(SCREEN_HEIGHT - 20, SCREEN_HEIGHT)
+
+class BossSpiral(Scenario):
+    name = "boss_spiral"
+    description = "Phase-3 boss firing its spiral with minions"
+    seed = 1002
+
+    def setup(self, engine, steps):
+        self.boss = spawn_boss(engine, 0.2)
+        self.last_volley = self.boss.last_shot
+
+    def step(self, engine):
+        protect_player(engine.player)
+        # The boss must survive stray hits to stay in phase 3
+        self.boss.health = max(self.boss.health, int(self.boss.max_health * 0.2))
+
+        # Boss.update fires and discards its own volleys; put each one into the game
+        if self.boss.last_shot != self.last_volley:
+            self.last_volley = self.boss.last_shot
+            for bullet in self.boss.shoot():
+                add_projectile_to_game(bullet)
+
+class ExplosionStorm(Scenario):
+    name = "explosions"
+    description = "50 simultaneous explosions, replaced as they finish"
+    seed = 1003
+    explosions = 50
+
+    def step(self, engine):
+        freeze_level(engine, spawn_enemies=False)
+        protect_player(engine.player)
+
+        live = len(sprite_groups.get_sprites_by_type("effects", Explosion))
+        for _ in range(self.explosions - live):
+            effect_manager.create_explosion(session_random.randint(0, SCREEN_WIDTH),
+                                            session_random.randint(0, SCREEN_HEIGHT),
+                                            session_random.randint(20, 60),
+                                            session_random.choice(["normal", "enemy", "boss"]))
+
+class SpreadWeapon(Scenario):
+    name = "spread_weapon"
+    description = "Maxed SPREAD weapon held down against normal spawns"
+    seed = 1004
+
+    def setup(self, engine, steps):
+        engine.player.upgrade_weapon(WeaponType.SPREAD)
+        engine.player.rapid_fire(10 ** 9)
+        hold_keys([CONTROLS["shoot"]], steps)
+
+    def step(self, engine):
+        freeze_level(engine)
+        protect_player(engine.player)
+
+    def finish(self, engine):
+        input_manager.stop_playback()
+
+class FullHud(Scenario):
+    name = "full_hud"
+    description = "Every HUD element on screen with values changing each frame"
+    seed = 1005
+
+    def setup(self, engine, steps):
+        self.show_fps = engine.game_state.settings["show_fps"]
+        engine.game_state.settings["show_fps"] = True
+
+        player = engine.player
+        player.upgrade_weapon(WeaponType.SPREAD)
+        player.activate_shield(10 ** 9)
+        player.speed_boost(1.0, 10 ** 9)
+        player.rapid_fire(10 ** 9)
+
+        # A passive boss for the boss bar; without a target it never shoots
+        self.boss = spawn_boss(engine)
+        self.boss.target = None
+
+    def step(self, engine):
+        freeze_level(engine, spawn_enemies=False)
+        engine.game_state.score += 10
+        engine.player.health = 1 + engine.game_state.score // 10 % engine.player.max_health
+
+        if not engine.ui_manager.achievement_notifications:
+            for name in ("First Blood", "Sharpshooter", "Survivor"):
+                engine.ui_manager.add_achievement_notification(name, "Benchmark")
+
+    def finish(self, engine):
+        engine.game_state.settings["show_fps"] = self.show_fps
+
+SCENARIOS = [BulletsVsEnemies(), BossSpiral(), ExplosionStorm(), SpreadWeapon(), FullHud()]
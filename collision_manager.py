@@ -1,7 +1,69 @@
 import pygame
 import math
+import itertools
 from config import *
 from effects import Explosion, HitEffect, PowerUpEffect
+from projectile_field import projectile_field
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class SpatialHash:
+    """Uniform grid that buckets sprites by every cell their rect overlaps"""
+    
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        
+    def clear(self):
+        self.cells.clear()
+        
+    def cell_range(self, rect):
+        """Return the inclusive (x0, y0, x1, y1) cell span covered by a rect"""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.left, rect.right - 1) // size,
+            max(rect.top, rect.bottom - 1) // size
+        )
+        
+    def insert(self, sprite):
+        cells = self.cells
+        x0, y0, x1, y1 = self.cell_range(sprite.rect)
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    cells[(cell_x, cell_y)] = [sprite]
+                else:
+                    bucket.append(sprite)
+                    
+    def insert_group(self, group):
+        for sprite in group:
+            self.insert(sprite)
+            
+    def query(self, rect):
+        """Return the sprites sharing at least one cell with rect, without duplicates"""
+        cells = self.cells
+        x0, y0, x1, y1 = self.cell_range(rect)
+        
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), [])
+            
+        candidates = {}
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    for sprite in bucket:
+                        candidates[sprite] = None
+        return list(candidates)
+        
+    def get_cell_count(self):
+        return len(self.cells)
 
 class CollisionManager:
     def __init__(self, sound_manager=None, ui_manager=None):
@@ -19,6 +81,19 @@ class CollisionManager:
             'effects': pygame.sprite.Group()
         }
         
+        # Broadphase: one spatial hash per collision target group, rebuilt once per frame
+        self.spatial_hashes = {
+            'enemies': SpatialHash(),
+            'bosses': SpatialHash(),
+            'enemy_bullets': SpatialHash(),
+            'powerups': SpatialHash()
+        }
+        
+        # Optional vectorized narrow phase: (sprites, ltrb array) per group, packed once per frame
+        self.use_numpy_narrow_phase = False
+        self.packed_rects = {}
+        self.set_numpy_narrow_phase(NUMPY_NARROW_PHASE)
+        
         # Collision statistics
         self.collision_stats = {
             'player_hits': 0,
@@ -46,6 +121,12 @@ class CollisionManager:
             'score_gained': 0
         }
         
+        # Bucket or pack all collision groups for this frame
+        if self.use_numpy_narrow_phase:
+            self.pack_collision_rects()
+        else:
+            self.rebuild_spatial_hash()
+        
         # Player bullet vs enemies
         enemy_hits = self.check_player_bullets_vs_enemies()
         results['enemies_killed'].extend(enemy_hits['killed'])
@@ -86,17 +167,11 @@ class CollisionManager:
             'score': 0
         }
         
-        hits = pygame.sprite.groupcollide(
-            self.collision_groups['enemies'],
-            self.collision_groups['player_bullets'],
-            False, True,
-            collided=self.advanced_collision_detection
-        )
+        hits = self.collide_projectiles('enemies', 'player_bullets', 'player')
         
-        for enemy, bullet_list in hits.items():
-            for bullet in bullet_list:
+        for enemy, damage_list in hits.items():
+            for damage in damage_list:
                 # Apply damage
-                damage = getattr(bullet, 'damage', 1)
                 if enemy.damage(damage):
                     # Enemy killed
                     result['killed'].append(enemy)
@@ -118,9 +193,13 @@ class CollisionManager:
                     if self.ui_manager:
                         self.ui_manager.screen_shake(3, 200)
                         
+                    # Remove it so later hits this frame don't kill it again
+                    enemy.kill()
+                    break
+                        
                 else:
                     # Enemy hit but not killed
-                    hit_effect = HitEffect(
+                    hit_effect = HitEffect.acquire(
                         enemy.rect.centerx,
                         enemy.rect.centery,
                         color=WHITE
@@ -144,17 +223,11 @@ class CollisionManager:
             'score': 0
         }
         
-        hits = pygame.sprite.groupcollide(
-            self.collision_groups['bosses'],
-            self.collision_groups['player_bullets'],
-            False, True,
-            collided=self.advanced_collision_detection
-        )
+        hits = self.collide_projectiles('bosses', 'player_bullets', 'player')
         
-        for boss, bullet_list in hits.items():
-            for bullet in bullet_list:
+        for boss, damage_list in hits.items():
+            for damage in damage_list:
                 # Apply damage
-                damage = getattr(bullet, 'damage', 1)
                 if boss.damage(damage):
                     # Boss killed
                     result['killed'].append(boss)
@@ -177,9 +250,12 @@ class CollisionManager:
                     if self.ui_manager:
                         self.ui_manager.screen_shake(8, 500)
                         
+                    boss.kill()
+                    break
+                        
                 else:
                     # Boss hit but not killed
-                    hit_effect = HitEffect(
+                    hit_effect = HitEffect.acquire(
                         boss.rect.centerx,
                         boss.rect.centery,
                         color=RED
@@ -206,21 +282,16 @@ class CollisionManager:
             'effects': []
         }
         
-        hits = pygame.sprite.spritecollide(
-            player,
-            self.collision_groups['enemy_bullets'],
-            True,
-            collided=self.advanced_collision_detection
-        )
+        hits = [getattr(bullet, 'damage', 10) for bullet in self.collide_sprite(player, 'enemy_bullets', True)]
+        hits.extend(projectile_field.collide_sprite('enemy', player))
         
-        for bullet in hits:
+        for damage in hits:
             if not player.shield and not player.protected:
-                damage = getattr(bullet, 'damage', 10)
                 if player.damage(damage):
                     result['damaged'] = True
                     
                 # Create hit effect
-                hit_effect = HitEffect(
+                hit_effect = HitEffect.acquire(
                     player.rect.centerx,
                     player.rect.centery,
                     color=RED
@@ -247,12 +318,7 @@ class CollisionManager:
             'effects': []
         }
         
-        hits = pygame.sprite.spritecollide(
-            player,
-            self.collision_groups['enemies'],
-            True,
-            collided=self.advanced_collision_detection
-        )
+        hits = self.collide_sprite(player, 'enemies', True)
         
         for enemy in hits:
             if not player.shield and not player.protected:
@@ -289,12 +355,7 @@ class CollisionManager:
             'effects': []
         }
         
-        hits = pygame.sprite.spritecollide(
-            player,
-            self.collision_groups['powerups'],
-            True,
-            collided=self.advanced_collision_detection
-        )
+        hits = self.collide_sprite(player, 'powerups', True)
         
         for powerup in hits:
             result['collected'].append(powerup)
@@ -368,6 +429,149 @@ class CollisionManager:
         # Update player stats
         player.powerups_collected += 1
         
+    def rebuild_spatial_hash(self):
+        """Re-bucket every collision target group into its spatial hash"""
+        for group_name, spatial_hash in self.spatial_hashes.items():
+            spatial_hash.clear()
+            spatial_hash.insert_group(self.collision_groups[group_name])
+            
+    def set_numpy_narrow_phase(self, enabled):
+        """Switch between the NumPy narrow phase and the spatial hash path"""
+        if enabled and np is None:
+            print("Warning: NumPy not available - using spatial hash collisions")
+            enabled = False
+        self.use_numpy_narrow_phase = bool(enabled)
+        return self.use_numpy_narrow_phase
+        
+    def collide_groups(self, target_name, projectile_name, dokill_projectiles):
+        """Return {target: [projectiles]} like groupcollide(targets, projectiles, False, dokill)"""
+        if self.use_numpy_narrow_phase:
+            return self.numpy_groupcollide(target_name, projectile_name, dokill_projectiles)
+        return self.broadphase_groupcollide(target_name, projectile_name, dokill_projectiles)
+        
+    def collide_sprite(self, sprite, group_name, dokill):
+        """Return the group members hit by sprite like spritecollide(sprite, group, dokill)"""
+        if self.use_numpy_narrow_phase:
+            return self.numpy_spritecollide(sprite, group_name, dokill)
+        return self.broadphase_spritecollide(sprite, group_name, dokill)
+        
+    def collide_projectiles(self, target_name, projectile_name, owner):
+        """Return {target: [damage, ...]} from sprite projectiles and the projectile field"""
+        hits = {
+            target: [getattr(projectile, 'damage', 1) for projectile in projectile_list]
+            for target, projectile_list in self.collide_groups(target_name, projectile_name, True).items()
+        }
+        
+        field_hits = projectile_field.collide_group(owner, self.collision_groups[target_name])
+        for target, damage_list in field_hits.items():
+            hits.setdefault(target, []).extend(damage_list)
+            
+        return hits
+        
+    def broadphase_groupcollide(self, target_name, projectile_name, dokill_projectiles):
+        """Spatial hash equivalent of groupcollide(targets, projectiles, False, dokill)"""
+        targets = self.collision_groups[target_name]
+        spatial_hash = self.spatial_hashes[target_name]
+        collided = self.advanced_collision_detection
+        hits = {}
+        
+        for projectile in self.collision_groups[projectile_name].sprites():
+            for target in spatial_hash.query(projectile.rect):
+                # Targets killed earlier this frame are still bucketed
+                if target in targets and collided(target, projectile):
+                    hits.setdefault(target, []).append(projectile)
+                    # A killed projectile is spent on the first target it hits
+                    if dokill_projectiles:
+                        projectile.kill()
+                        break
+                        
+        return hits
+        
+    def broadphase_spritecollide(self, sprite, group_name, dokill):
+        """Spatial hash equivalent of spritecollide(sprite, group, dokill)"""
+        group = self.collision_groups[group_name]
+        collided = self.advanced_collision_detection
+        
+        hits = [
+            candidate for candidate in self.spatial_hashes[group_name].query(sprite.rect)
+            if candidate in group and collided(sprite, candidate)
+        ]
+        
+        if dokill:
+            for candidate in hits:
+                candidate.kill()
+                
+        return hits
+        
+    def pack_collision_rects(self):
+        """Pack every collision group into a (sprites, N x 4 left/top/right/bottom) pair"""
+        for group_name, group in self.collision_groups.items():
+            sprites = group.sprites()
+            rects = np.fromiter(
+                itertools.chain.from_iterable(sprite.rect for sprite in sprites),
+                dtype=np.int32, count=len(sprites) * 4
+            ).reshape(-1, 4)
+            rects[:, 2] += rects[:, 0]
+            rects[:, 3] += rects[:, 1]
+            self.packed_rects[group_name] = (sprites, rects)
+            
+    def numpy_groupcollide(self, target_name, projectile_name, dokill_projectiles):
+        """Batched AABB overlap matrix, refined per overlapping pair by mask if available"""
+        targets, target_rects = self.packed_rects[target_name]
+        projectiles, projectile_rects = self.packed_rects[projectile_name]
+        if not targets or not projectiles:
+            return {}
+            
+        overlap = (
+            (target_rects[:, None, 0] < projectile_rects[None, :, 2]) &
+            (target_rects[:, None, 2] > projectile_rects[None, :, 0]) &
+            (target_rects[:, None, 1] < projectile_rects[None, :, 3]) &
+            (target_rects[:, None, 3] > projectile_rects[None, :, 1])
+        )
+        
+        target_group = self.collision_groups[target_name]
+        projectile_group = self.collision_groups[projectile_name]
+        collided = self.advanced_collision_detection
+        hits = {}
+        
+        target_indices, projectile_indices = overlap.nonzero()
+        for target_index, projectile_index in zip(target_indices.tolist(), projectile_indices.tolist()):
+            target = targets[target_index]
+            projectile = projectiles[projectile_index]
+            # Packed arrays are a frame-start snapshot, so skip anything killed since. Pairs
+            # come out in group order, so a killed projectile hits only the first target
+            if target in target_group and projectile in projectile_group and collided(target, projectile):
+                hits.setdefault(target, []).append(projectile)
+                if dokill_projectiles:
+                    projectile.kill()
+                    
+        return hits
+        
+    def numpy_spritecollide(self, sprite, group_name, dokill):
+        """Batched AABB test of one sprite against a packed group"""
+        candidates, rects = self.packed_rects[group_name]
+        if not candidates:
+            return []
+            
+        rect = sprite.rect
+        overlap = (
+            (rects[:, 0] < rect.right) & (rects[:, 2] > rect.left) &
+            (rects[:, 1] < rect.bottom) & (rects[:, 3] > rect.top)
+        )
+        
+        group = self.collision_groups[group_name]
+        collided = self.advanced_collision_detection
+        hits = [
+            candidates[index] for index in overlap.nonzero()[0].tolist()
+            if candidates[index] in group and collided(sprite, candidates[index])
+        ]
+        
+        if dokill:
+            for candidate in hits:
+                candidate.kill()
+                
+        return hits
+        
     def advanced_collision_detection(self, sprite1, sprite2):
         """More accurate collision detection using masks"""
         try:
@@ -457,25 +661,6 @@ class CollisionManager:
                 
         return effects
         
-    def optimize_collision_detection(self):
-        """Optimize collision detection by using spatial partitioning"""
-        # Simple spatial partitioning - divide screen into grid
-        grid_size = 100
-        grid_width = SCREEN_WIDTH // grid_size + 1
-        grid_height = SCREEN_HEIGHT // grid_size + 1
-        
-        # Create grid
-        grid = [[[] for _ in range(grid_height)] for _ in range(grid_width)]
-        
-        # Place sprites in grid
-        for group_name, group in self.collision_groups.items():
-            for sprite in group:
-                grid_x = min(sprite.rect.centerx // grid_size, grid_width - 1)
-                grid_y = min(sprite.rect.centery // grid_size, grid_height - 1)
-                grid[grid_x][grid_y].append((sprite, group_name))
-                
-        return grid
-        
     def debug_draw_collision_boxes(self, surface):
         """Draw collision boxes for debugging"""
         for group_name, group in self.collision_groups.items():
@@ -6,6 +6,28 @@ SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 700
 FPS = 60
 
+# Timing settings
+SIMULATION_RATE = 60  # Fixed simulation steps per second, independent of the render rate
+MAX_CATCH_UP_STEPS = 5  # Steps allowed per rendered frame before lagging time is dropped
+INTERPOLATE_RENDERING = True  # Draw between the last two simulation states
+INTERPOLATION_SNAP_DISTANCE = 64  # Larger jumps are treated as teleports and not interpolated
+
+# Render settings
+DIRTY_RECT_RENDERING = False  # Redraw only changed screen regions where possible
+BACKGROUND_SCROLL_SPEED = 2  # Pixels per frame; 0 keeps the background static
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by UIManager (least recently used evicted)
+
+# Profiler settings
+PROFILER_PHASES = ["level", "sprite_update", "shooting", "collisions", "collision_results",
+                   "background", "sprites", "hud"]  # Timed engine phases, in frame order
+PROFILER_HISTORY = 240  # Frames kept for the overlay graph (one pixel column each)
+PROFILER_GRAPH_HEIGHT = 100  # Overlay graph height in pixels
+PROFILER_GRAPH_MAX_MS = 33.3  # Frame time at the top of the graph (two 60 FPS budgets)
+PROFILER_LEGEND_INTERVAL = 30  # Frames between overlay legend refreshes
+PROFILER_CSV_FLUSH_FRAMES = 60  # Rows buffered before appending to the CSV
+PROFILER_CSV_MAX_ROWS = 36000  # Rows per CSV before it rolls over to <file>.1
+TRACE_BUFFER_EVENTS = 400000  # Newest trace events kept (about 10 minutes of profiled frames)
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -45,6 +67,13 @@ BULLET_SPEED = 10
 FIRE_RATE_BASE = 500
 GUN_UPGRADE_DURATION = 10000
 
+# Projectile field settings (struct-of-arrays storage for simple bullets)
+PROJECTILE_FIELD_ENABLED = True
+PROJECTILE_FIELD_CAPACITY = 512
+
+# Sprite pool settings
+SPRITE_POOL_MAX_FREE = 1024  # Free instances kept per pooled class
+
 # Power-up settings
 POWERUP_SPAWN_RATE = 5000
 POWERUP_CHANCE = 0.1
@@ -55,14 +84,54 @@ LEVEL_SCORE_MULTIPLIER = 100
 MAX_LEVELS = 10
 LEVEL_DIFFICULTY_INCREASE = 0.2
 
+# Collision settings
+COLLISION_CELL_SIZE = 64  # Spatial hash cell size in pixels
+NUMPY_NARROW_PHASE = False  # Batch AABB tests with NumPy instead of the spatial hash
+
 # Effect settings
 EXPLOSION_FRAME_RATE = 50
 SCREEN_SHAKE_DURATION = 200
 SCREEN_SHAKE_INTENSITY = 5
+PARTICLE_CAPACITY = 1024  # Initial size of the batched particle arrays
+PARTICLE_ALPHA_LEVELS = 16  # Pre-drawn fade steps per particle stamp
 
 # Sound settings
 MUSIC_VOLUME = 0.5
 SFX_VOLUME = 0.7
+MIXER_CHANNELS = 16
+VOICE_DEDUP_VOLUME_STEP = 0.15  # Extra volume per identical sound merged into one voice
+AUDIO_RAMP_STEP_MS = 1000 / SIMULATION_RATE  # How often running volume ramps are updated
+MUSIC_CROSSFADE_TIME = 2.0  # Seconds to fade between level theme tracks
+SYNTH_SEED = 1234  # Noise seed, so synthesized sounds are the same every launch
+
+# Sound effects synthesized at load time. Times are seconds, frequencies Hz; a
+# sweep glides to end_freq, noise mixes in white noise and the filters cut off
+# above (lowpass) or below (highpass) the given frequency
+PLACEHOLDER_SOUND = {"wave": "sine", "freq": 440, "duration": 0.1, "volume": 0.125}
+SYNTH_SOUNDS = {
+    "laser": {"wave": "square", "freq": 1800, "end_freq": 250, "duration": 0.18,
+              "attack": 0.005, "decay": 0.06, "sustain": 0.5, "release": 0.1, "lowpass": 5000, "volume": 0.35},
+    "hit": {"wave": "triangle", "freq": 220, "end_freq": 80, "duration": 0.12, "noise": 0.6,
+            "attack": 0.002, "decay": 0.05, "sustain": 0.3, "release": 0.06, "lowpass": 3000, "volume": 0.6},
+    "ui_select": {"wave": "sine", "freq": 880, "duration": 0.05, "attack": 0.003, "release": 0.03, "volume": 0.4},
+    "ui_confirm": {"wave": "triangle", "freq": 660, "end_freq": 1320, "duration": 0.14,
+                   "attack": 0.005, "release": 0.06, "volume": 0.45},
+    "ui_back": {"wave": "saw", "freq": 440, "end_freq": 220, "duration": 0.12,
+                "attack": 0.005, "release": 0.06, "lowpass": 2500, "volume": 0.35}
+}
+
+# Sound categories: how many mixer voices each may hold at once, and the priority
+# that decides which playing voice is stolen when every channel is busy
+SOUND_CATEGORIES = {
+    "ui": {"voices": 2, "priority": 4},
+    "player": {"voices": 2, "priority": 3},
+    "explosion": {"voices": 4, "priority": 2},
+    "powerup": {"voices": 2, "priority": 2},
+    "weapon": {"voices": 3, "priority": 1},
+    "enemy": {"voices": 3, "priority": 1},
+    "effects": {"voices": 3, "priority": 1},
+    "ambient": {"voices": 1, "priority": 0}
+}
 
 # Asset paths
 ASSET_PATHS = {
@@ -116,6 +185,7 @@ class GameState(Enum):
     LEVEL_COMPLETE = 5
     SETTINGS = 6
     ACHIEVEMENTS = 7
+    LOADING = 8
 
 # Achievement types
 class AchievementType(Enum):
@@ -141,6 +211,15 @@ class LevelTheme(Enum):
     CYBER = {"bg_color": DARK_GREEN, "enemy_color": CYAN}
     SOLAR = {"bg_color": ORANGE, "enemy_color": DARK_RED}
 
+# Music track for each level theme, by ASSET_PATHS name
+THEME_MUSIC = {
+    "SPACE": "background_music",
+    "NEBULA": "background_music",
+    "ASTEROID": "background_music",
+    "CYBER": "background_music",
+    "SOLAR": "background_music"
+}
+
 # Input mappings
 CONTROLS = {
     "move_left": pygame.K_LEFT,
@@ -151,7 +230,8 @@ CONTROLS = {
     "pause": pygame.K_p,
     "quit": pygame.K_ESCAPE,
     "menu": pygame.K_m,
-    "restart": pygame.K_r
+    "restart": pygame.K_r,
+    "profiler": pygame.K_F3
 }
 
 # Scoring system
@@ -189,10 +269,41 @@ PARTICLE_SETTINGS = {
     }
 }
 
+# Preprocessed asset cache
+ASSET_CACHE_ENABLED = True
+ASSET_CACHE_DIR = ".asset_cache"
+ASSET_CACHE_VERSION = 2  # Bump when cached formats or procedural recipes change
+ASSET_FINISH_BUDGET_MS = 4  # Main-thread time per frame for converting assets loaded in the background
+ASSET_CONVERT_STRIP_PIXELS = 1 << 18  # Large images are converted this many pixels per step
+
 # Save file paths
 SAVE_PATHS = {
     "settings": "settings.json",
     "progress": "progress.json",
     "achievements": "achievements.json",
-    "highscores": "highscores.json"
-}
\ No newline at end of file
+    "highscores": "highscores.json",
+    "database": "shootar.db"
+}
+
+# Leaderboard
+LEADERBOARD_SIZE = 10
+
+# Achievement rules: each unlocks when its counter reaches the threshold within
+# the scope ("lifetime", "run" or "level"); "below" rules unlock under it instead
+ACHIEVEMENT_RULES = [
+    {"id": "first_kill", "counter": "enemies_killed", "threshold": 1, "scope": "lifetime"},
+    {"id": "first_boss", "counter": "bosses_defeated", "threshold": 1, "scope": "lifetime"},
+    {"id": "level_5", "counter": "level", "threshold": 5, "scope": "run"},
+    {"id": "level_10", "counter": "level", "threshold": 10, "scope": "run"},
+    {"id": "score_10k", "counter": "score", "threshold": 10000, "scope": "run"},
+    {"id": "score_50k", "counter": "score", "threshold": 50000, "scope": "run"},
+    {"id": "score_100k", "counter": "score", "threshold": 100000, "scope": "run"},
+    {"id": "perfect_level", "counter": "perfect_levels", "threshold": 1, "scope": "lifetime"},
+    {"id": "collect_100_powerups", "counter": "powerups_collected", "threshold": 100, "scope": "lifetime"},
+    {"id": "survive_5_minutes", "counter": "time_played", "threshold": 300, "scope": "run"},
+    {"id": "kill_1000_enemies", "counter": "enemies_killed", "threshold": 1000, "scope": "lifetime"},
+    {"id": "defeat_10_bosses", "counter": "bosses_defeated", "threshold": 10, "scope": "lifetime"},
+    {"id": "no_continues", "counter": "levels_without_continues", "threshold": 5, "scope": "run"},
+    {"id": "speed_demon", "counter": "level_duration", "threshold": 60, "scope": "level", "compare": "below"},
+    {"id": "sharpshooter", "counter": "level_accuracy", "threshold": 0.9, "scope": "level"}
+]
\ No newline at end of file
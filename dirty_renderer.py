@@ -0,0 +1,69 @@
+import pygame
+from typing import Hashable, Iterable, List, Optional
+
+class DirtyRenderer:
+    """Dirty-rectangle presentation for frames that change little.
+
+    Static screens are redrawn and pushed only when their content signature
+    changes. Gameplay over a static background erases last frame's rects
+    from the background and pushes only the old and new rects to the display.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.signature: Optional[Hashable] = None
+        self.background: Optional[pygame.Surface] = None
+        self.previous_rects: List[pygame.Rect] = []
+        self.current_rects: List[pygame.Rect] = []
+        self.full_update = True
+
+    def set_enabled(self, enabled: bool) -> bool:
+        self.enabled = bool(enabled)
+        self.invalidate()
+        return self.enabled
+
+    def invalidate(self):
+        """Forget what is on screen; the next dirty frame redraws everything"""
+        self.signature = None
+        self.background = None
+        self.previous_rects = []
+        self.full_update = True
+
+    def needs_redraw(self, signature: Hashable) -> bool:
+        """Return True when a static screen's content differs from the last one pushed"""
+        if signature == self.signature:
+            return False
+
+        self.invalidate()
+        self.signature = signature
+        return True
+
+    def begin_frame(self, surface: pygame.Surface, background: pygame.Surface):
+        """Erase last frame's rects, or the whole screen if the background changed"""
+        self.signature = None
+        self.current_rects = []
+
+        if background is not self.background:
+            self.background = background
+            surface.blit(background, (0, 0))
+            self.previous_rects = []
+            self.full_update = True
+            return
+
+        for rect in self.previous_rects:
+            surface.blit(background, rect, rect)
+
+    def track(self, rects: Iterable[Optional[pygame.Rect]]):
+        self.current_rects.extend(rect for rect in rects if rect)
+
+    def present(self):
+        if self.full_update:
+            pygame.display.flip()
+            self.full_update = False
+        else:
+            pygame.display.update(self.previous_rects + self.current_rects)
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+
+    def get_dirty_count(self) -> int:
+        return len(self.previous_rects)
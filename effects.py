@@ -1,12 +1,19 @@
 import pygame
 import math
-import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from config import *
+from session import session_random
 from sprite_groups import sprite_groups
+from sprite_pools import PooledSprite
+from asset_manager import asset_manager
 from utils import *
 
-class Particle(pygame.sprite.Sprite):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Particle(PooledSprite):
     def __init__(self, x: float, y: float, velocity: Tuple[float, float], color: Tuple[int, int, int], 
                  size: float, lifetime: int, gravity: float = 0):
         super().__init__()
@@ -20,7 +27,10 @@ class Particle(pygame.sprite.Sprite):
         self.gravity = gravity
         self.alpha = 255
         
-        self.image = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+        # Recycled particles keep their surface when the size matches
+        dimensions = (int(size * 2), int(size * 2))
+        if getattr(self, 'image', None) is None or self.image.get_size() != dimensions:
+            self.image = pygame.Surface(dimensions, pygame.SRCALPHA)
         self.rect = self.image.get_rect()
         self.rect.center = (int(x), int(y))
         
@@ -46,6 +56,172 @@ class Particle(pygame.sprite.Sprite):
         else:
             self.update_image()
 
+class ParticleEmitter:
+    """Batched particles kept in NumPy arrays instead of one Sprite each.
+
+    Falls back to pooled Particle sprites when NumPy is not installed.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, alpha_levels: int = PARTICLE_ALPHA_LEVELS):
+        self.enabled = np is not None
+        self.alpha_levels = alpha_levels
+        self.count = 0
+
+        # One style per (color, radius); each holds alpha_levels fading stamps
+        self.style_lookup: Dict[Tuple[Tuple[int, int, int], int], int] = {}
+        self.style_stamps: List[List[pygame.Surface]] = []
+        self.style_radii = None
+
+        if self.enabled:
+            self.allocate(capacity)
+            self.style_radii = np.zeros(0, dtype=np.int32)
+
+    def allocate(self, capacity: int):
+        self.capacity = capacity
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.gravities = np.zeros(capacity, dtype=np.float64)
+        self.lifetimes = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetimes = np.ones(capacity, dtype=np.int32)
+        self.styles = np.zeros(capacity, dtype=np.int16)
+
+    def reserve(self, count: int):
+        needed = self.count + count
+        if needed <= self.capacity:
+            return
+
+        n = self.count
+        old = (self.positions, self.previous_positions, self.velocities, self.gravities,
+               self.lifetimes, self.max_lifetimes, self.styles)
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        self.allocate(capacity)
+        new = (self.positions, self.previous_positions, self.velocities, self.gravities,
+               self.lifetimes, self.max_lifetimes, self.styles)
+        for old_array, new_array in zip(old, new):
+            new_array[:n] = old_array[:n]
+
+    def get_style(self, color: Tuple[int, int, int], radius: int) -> int:
+        key = (tuple(color), radius)
+        style = self.style_lookup.get(key)
+        if style is None:
+            style = len(self.style_stamps)
+            self.style_lookup[key] = style
+            self.style_stamps.append(self.create_stamps(key[0], radius))
+            self.style_radii = np.append(self.style_radii, radius).astype(np.int32)
+        return style
+
+    def create_stamps(self, color: Tuple[int, int, int], radius: int) -> List[pygame.Surface]:
+        stamps = []
+        for level in range(1, self.alpha_levels + 1):
+            alpha = int(255 * level / self.alpha_levels)
+            stamp = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (*color, alpha), (radius, radius), radius)
+            stamps.append(stamp)
+        return stamps
+
+    def emit_burst(self, x: float, y: float, count: int, colors: List[Tuple[int, int, int]],
+                   speed_range: Tuple[float, float], size_range: Tuple[float, float],
+                   lifetime_range: Tuple[int, int], gravity: float = 0):
+        """Spawn count particles flying out of (x, y) in random directions"""
+        if count <= 0:
+            return
+
+        if not self.enabled:
+            self.emit_sprites(x, y, count, colors, speed_range, size_range, lifetime_range, gravity)
+            return
+
+        self.reserve(count)
+        rng = session_random.numpy
+        angles = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(*speed_range, count)
+        radii = rng.uniform(*size_range, count).astype(np.int32)
+        color_indices = rng.integers(0, len(colors), count)
+
+        # Resolve (color, radius) pairs through a small table instead of per particle
+        style_table = np.zeros((len(colors), int(radii.max()) + 1), dtype=np.int16)
+        for radius in np.unique(radii).tolist():
+            for color_index, color in enumerate(colors):
+                style_table[color_index, radius] = self.get_style(color, radius)
+
+        start, end = self.count, self.count + count
+        self.positions[start:end] = (x, y)
+        self.previous_positions[start:end] = (x, y)
+        self.velocities[start:end, 0] = np.cos(angles) * speeds
+        self.velocities[start:end, 1] = np.sin(angles) * speeds
+        self.gravities[start:end] = gravity
+        self.lifetimes[start:end] = rng.integers(lifetime_range[0], lifetime_range[1] + 1, count)
+        self.max_lifetimes[start:end] = self.lifetimes[start:end]
+        self.styles[start:end] = style_table[color_indices, radii]
+        self.count = end
+
+    def emit_sprites(self, x: float, y: float, count: int, colors: List[Tuple[int, int, int]],
+                     speed_range: Tuple[float, float], size_range: Tuple[float, float],
+                     lifetime_range: Tuple[int, int], gravity: float):
+        for _ in range(count):
+            angle = session_random.uniform(0, 2 * math.pi)
+            speed = session_random.uniform(*speed_range)
+            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
+            color = session_random.choice(colors)
+            size = session_random.uniform(*size_range)
+            lifetime = session_random.randint(*lifetime_range)
+
+            particle = Particle.acquire(x, y, velocity, color, size, lifetime, gravity)
+            sprite_groups.add_sprite(particle, ["all", "particles"])
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        self.previous_positions[:n] = self.positions[:n]
+        self.positions[:n] += self.velocities[:n]
+        self.velocities[:n, 1] += self.gravities[:n]
+        self.lifetimes[:n] -= 1
+
+        keep = np.flatnonzero(self.lifetimes[:n] > 0)
+        if len(keep) == n:
+            return
+
+        k = len(keep)
+        for array in (self.positions, self.previous_positions, self.velocities, self.gravities,
+                      self.lifetimes, self.max_lifetimes, self.styles):
+            array[:k] = array[keep]
+        self.count = k
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             alpha: float = 1.0) -> List[pygame.Rect]:
+        n = self.count
+        if n == 0:
+            return []
+
+        positions = self.positions[:n]
+        if alpha < 1.0:
+            previous = self.previous_positions[:n]
+            positions = previous + (positions - previous) * alpha
+
+        # Same fade as Particle: alpha proportional to remaining lifetime
+        levels = (self.lifetimes[:n] * self.alpha_levels + self.max_lifetimes[:n] - 1) // self.max_lifetimes[:n]
+        levels = np.clip(levels, 1, self.alpha_levels) - 1
+        styles = self.styles[:n]
+        radii = self.style_radii[styles]
+        lefts = positions[:, 0].astype(np.int32) - radii + offset[0]
+        tops = positions[:, 1].astype(np.int32) - radii + offset[1]
+
+        stamps = self.style_stamps
+        return surface.blits(
+            [(stamps[style][level], (left, top))
+             for style, level, left, top in zip(styles.tolist(), levels.tolist(), lefts.tolist(), tops.tolist())]
+        )
+
+    def clear(self):
+        self.count = 0
+
+    def get_count(self) -> int:
+        return self.count
+
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, x: float, y: float, size: int, explosion_type: str = "normal"):
         super().__init__()
@@ -58,14 +234,16 @@ class Explosion(pygame.sprite.Sprite):
         self.frame_rate = 2
         self.frame_counter = 0
         
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.colors = self.get_explosion_colors()
+        self.frames = asset_manager.get_animation_frames(
+            ("explosion", size, explosion_type), self.max_frames, self.draw_frame
+        )
+        
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (int(x), int(y))
         
-        self.colors = self.get_explosion_colors()
         self.create_particles()
-        
-        self.update_image()
     
     def get_explosion_colors(self) -> List[Tuple[int, int, int]]:
         if self.explosion_type == "boss":
@@ -79,33 +257,28 @@ class Explosion(pygame.sprite.Sprite):
     
     def create_particles(self):
         particle_count = min(30, self.size // 2)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            color = random.choice(self.colors)
-            size = random.uniform(1, 4)
-            lifetime = random.randint(20, 40)
+        particle_emitter.emit_burst(self.x, self.y, particle_count, self.colors,
+                                    (1, 5), (1, 4), (20, 40), 0.1)
+    
+    def draw_frame(self, frame: int) -> pygame.Surface:
+        surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        progress = frame / self.max_frames
+        current_radius = int(self.size * 0.8 * ease_out(progress))
+        
+        # Draw multiple explosion rings
+        for i, color in enumerate(self.colors):
+            ring_radius = max(1, current_radius - i * 3)
+            alpha = int(255 * (1 - progress) * (1 - i * 0.2))
+            color_with_alpha = (*color, max(0, alpha))
             
-            particle = Particle(self.x, self.y, velocity, color, size, lifetime, 0.1)
-            sprite_groups.add_sprite(particle, ["all", "particles"])
+            if ring_radius > 0:
+                pygame.draw.circle(surface, color_with_alpha, 
+                                 (self.size // 2, self.size // 2), ring_radius)
+        return surface
     
     def update_image(self):
-        self.image.fill((0, 0, 0, 0))
-        
         if self.frame < self.max_frames:
-            progress = self.frame / self.max_frames
-            current_radius = int(self.size * 0.8 * ease_out(progress))
-            
-            # Draw multiple explosion rings
-            for i, color in enumerate(self.colors):
-                ring_radius = max(1, current_radius - i * 3)
-                alpha = int(255 * (1 - progress) * (1 - i * 0.2))
-                color_with_alpha = (*color, max(0, alpha))
-                
-                if ring_radius > 0:
-                    pygame.draw.circle(self.image, color_with_alpha, 
-                                     (self.size // 2, self.size // 2), ring_radius)
+            self.image = self.frames[self.frame]
     
     def update(self):
         self.frame_counter += 1
@@ -161,16 +334,19 @@ class MuzzleFlash(pygame.sprite.Sprite):
         self.max_lifetime = 5
         self.size = 10
         
-        self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        # Frames are indexed by remaining lifetime
+        self.frames = asset_manager.get_animation_frames(
+            ("muzzle_flash", angle), self.max_lifetime + 1, self.draw_frame
+        )
+        
+        self.image = self.frames[self.lifetime]
         self.rect = self.image.get_rect()
         self.rect.center = (int(x), int(y))
-        
-        self.update_image()
     
-    def update_image(self):
-        self.image.fill((0, 0, 0, 0))
-        if self.lifetime > 0:
-            alpha = int(255 * (self.lifetime / self.max_lifetime))
+    def draw_frame(self, lifetime: int) -> pygame.Surface:
+        surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+        if lifetime > 0:
+            alpha = int(255 * (lifetime / self.max_lifetime))
             
             # Draw flash as a star shape
             center = (10, 10)
@@ -186,7 +362,11 @@ class MuzzleFlash(pygame.sprite.Sprite):
                 y = center[1] + math.sin(angle + self.angle) * radius
                 points.append((x, y))
             
-            pygame.draw.polygon(self.image, (255, 255, 0, alpha), points)
+            pygame.draw.polygon(surface, (255, 255, 0, alpha), points)
+        return surface
+    
+    def update_image(self):
+        self.image = self.frames[self.lifetime]
     
     def update(self):
         self.lifetime -= 1
@@ -196,6 +376,9 @@ class MuzzleFlash(pygame.sprite.Sprite):
             self.update_image()
 
 class PowerUpGlow(pygame.sprite.Sprite):
+    PULSE_SPEED = 0.2
+    PULSE_FRAMES = 32  # Cached frames per pulse period
+    
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], size: int = 30):
         super().__init__()
         self.x = x
@@ -204,52 +387,72 @@ class PowerUpGlow(pygame.sprite.Sprite):
         self.size = size
         self.time = 0
         
-        self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        self.frames = asset_manager.get_animation_frames(
+            ("powerup_glow", tuple(color), size), self.PULSE_FRAMES, self.draw_frame
+        )
+        
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (int(x), int(y))
-        
-        self.update_image()
     
-    def update_image(self):
-        self.image.fill((0, 0, 0, 0))
+    def draw_frame(self, frame: int) -> pygame.Surface:
+        surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
         
         # Create pulsing glow effect
-        pulse = (math.sin(self.time * 0.2) + 1) * 0.5
+        pulse = (math.sin(2 * math.pi * frame / self.PULSE_FRAMES) + 1) * 0.5
         current_size = int(self.size * (0.8 + pulse * 0.4))
         alpha = int(100 * pulse)
         
         center = (self.size, self.size)
         color_with_alpha = (*self.color, alpha)
         
-        pygame.draw.circle(self.image, color_with_alpha, center, current_size)
-        pygame.draw.circle(self.image, (*self.color, alpha // 2), center, current_size + 5)
+        pygame.draw.circle(surface, color_with_alpha, center, current_size)
+        pygame.draw.circle(surface, (*self.color, alpha // 2), center, current_size + 5)
+        return surface
+    
+    def update_image(self):
+        # Pick the cached frame nearest to this point of the pulse
+        phase = self.time * self.PULSE_SPEED / (2 * math.pi)
+        self.image = self.frames[round(phase * self.PULSE_FRAMES) % self.PULSE_FRAMES]
     
     def update(self):
         self.time += 1
         self.update_image()
 
 class ScreenShake:
+    """The single shake source; its offset is applied when drawing the world layers"""
+    
     def __init__(self):
         self.intensity = 0
         self.duration = 0
         self.original_duration = 0
+        self.offset = (0, 0)
     
     def start(self, intensity: int, duration: int):
+        # A weaker shake must not cut a stronger one short
+        if self.get_current_intensity() > intensity:
+            return
         self.intensity = intensity
         self.duration = duration
         self.original_duration = duration
     
+    def get_current_intensity(self) -> int:
+        if self.duration <= 0:
+            return 0
+        return int(self.intensity * self.duration / self.original_duration)
+    
     def update(self) -> Tuple[int, int]:
         if self.duration > 0:
             self.duration -= 1
-            progress = self.duration / self.original_duration
-            current_intensity = int(self.intensity * progress)
+            current_intensity = self.get_current_intensity()
             
-            return (
-                random.randint(-current_intensity, current_intensity),
-                random.randint(-current_intensity, current_intensity)
+            self.offset = (
+                session_random.randint(-current_intensity, current_intensity),
+                session_random.randint(-current_intensity, current_intensity)
             )
-        return (0, 0)
+        else:
+            self.offset = (0, 0)
+        return self.offset
     
     def is_active(self) -> bool:
         return self.duration > 0
@@ -339,7 +542,7 @@ class BulletTrail(pygame.sprite.Sprite):
         else:
             self.update_image()
 
-class HitEffect(pygame.sprite.Sprite):
+class HitEffect(PooledSprite):
     def __init__(self, x: float, y: float, color: Tuple[int, int, int] = WHITE):
         super().__init__()
         self.x = x
@@ -349,17 +552,20 @@ class HitEffect(pygame.sprite.Sprite):
         self.max_lifetime = 8
         self.size = 15
         
-        self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
+        # Frames are indexed by remaining lifetime
+        self.frames = asset_manager.get_animation_frames(
+            ("hit", tuple(color)), self.max_lifetime + 1, self.draw_frame
+        )
+        
+        self.image = self.frames[self.lifetime]
         self.rect = self.image.get_rect()
         self.rect.center = (int(x), int(y))
-        
-        self.update_image()
     
-    def update_image(self):
-        self.image.fill((0, 0, 0, 0))
-        if self.lifetime > 0:
-            alpha = int(255 * (self.lifetime / self.max_lifetime))
-            size = int(self.size * (1 - self.lifetime / self.max_lifetime))
+    def draw_frame(self, lifetime: int) -> pygame.Surface:
+        surface = pygame.Surface((30, 30), pygame.SRCALPHA)
+        if lifetime > 0:
+            alpha = int(255 * (lifetime / self.max_lifetime))
+            size = int(self.size * (1 - lifetime / self.max_lifetime))
             
             center = (15, 15)
             color_with_alpha = (*self.color, alpha)
@@ -369,7 +575,11 @@ class HitEffect(pygame.sprite.Sprite):
                 angle = i * math.pi / 3
                 end_x = center[0] + math.cos(angle) * size
                 end_y = center[1] + math.sin(angle) * size
-                pygame.draw.line(self.image, color_with_alpha, center, (end_x, end_y), 2)
+                pygame.draw.line(surface, color_with_alpha, center, (end_x, end_y), 2)
+        return surface
+    
+    def update_image(self):
+        self.image = self.frames[self.lifetime]
     
     def update(self):
         self.lifetime -= 1
@@ -416,24 +626,22 @@ class EffectManager:
         sprite_groups.add_sprite(trail, ["all", "effects"])
     
     def create_hit_effect(self, x: float, y: float, color: Tuple[int, int, int] = WHITE):
-        hit = HitEffect(x, y, color)
+        hit = HitEffect.acquire(x, y, color)
         sprite_groups.add_sprite(hit, ["all", "effects"])
     
     def create_particle_burst(self, x: float, y: float, color: Tuple[int, int, int], 
                             count: int = 10, speed_range: Tuple[float, float] = (1, 5)):
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*speed_range)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-            size = random.uniform(1, 3)
-            lifetime = random.randint(15, 30)
-            
-            particle = Particle(x, y, velocity, color, size, lifetime)
-            sprite_groups.add_sprite(particle, ["all", "particles"])
+        particle_emitter.emit_burst(x, y, count, [color], speed_range, (1, 3), (15, 30))
+    
+    def start_screen_shake(self, intensity: int, duration_ms: int):
+        self.screen_shake.start(intensity, max(1, duration_ms * FPS // 1000))
     
     def update(self):
         return self.screen_shake.update()
     
+    def get_shake_offset(self) -> Tuple[int, int]:
+        return self.screen_shake.offset
+    
     def is_screen_shaking(self) -> bool:
         return self.screen_shake.is_active()
 
@@ -490,5 +698,6 @@ class PowerUpEffect(pygame.sprite.Sprite):
         else:
             self.update_image()
 
-# Global effect manager instance
-effect_manager = EffectManager()
\ No newline at end of file
+# Global effect manager and particle emitter instances
+effect_manager = EffectManager()
+particle_emitter = ParticleEmitter()
\ No newline at end of file
@@ -1,7 +1,9 @@
 import pygame
-import random
 import math
 from config import *
+from session import session_random, game_clock
+from asset_manager import asset_manager
+from sound_manager import sound_manager
 from projectiles import EnemyBullet
 from effects import Explosion, HitEffect
 
@@ -13,66 +15,67 @@ class Enemy(pygame.sprite.Sprite):
         
         # Load appropriate image based on enemy type
         if enemy_type == EnemyType.BASIC:
-            self.image = pygame.image.load(ASSET_PATHS["enemy"]).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (30, 30))
+            image_name = "enemy"
+            self.image = asset_manager.get_scaled_image(image_name, (30, 30))
             self.health = ENEMY_HEALTH_BASE + level // 2
             self.speed = ENEMY_SPEED_BASE * (1 + level * 0.1)
             self.score_value = SCORE_VALUES["enemy_basic"]
-            self.shoot_delay = random.randrange(3000, 6000)
+            self.shoot_delay = session_random.randrange(3000, 6000)
             
         elif enemy_type == EnemyType.FAST:
-            self.image = pygame.image.load(ASSET_PATHS["enemy2"]).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (25, 25))
+            image_name = "enemy2"
+            self.image = asset_manager.get_scaled_image(image_name, (25, 25))
             self.health = max(1, ENEMY_HEALTH_BASE // 2 + level // 3)
             self.speed = ENEMY_SPEED_BASE * 1.8 * (1 + level * 0.1)
             self.score_value = SCORE_VALUES["enemy_fast"]
-            self.shoot_delay = random.randrange(2000, 4000)
+            self.shoot_delay = session_random.randrange(2000, 4000)
             
         elif enemy_type == EnemyType.HEAVY:
-            self.image = pygame.image.load(ASSET_PATHS["enemy"]).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (45, 45))
+            image_name = "enemy"
+            self.image = asset_manager.get_scaled_image(image_name, (45, 45))
             self.health = ENEMY_HEALTH_BASE * 3 + level
             self.speed = ENEMY_SPEED_BASE * 0.6 * (1 + level * 0.05)
             self.score_value = SCORE_VALUES["enemy_heavy"]
-            self.shoot_delay = random.randrange(4000, 7000)
+            self.shoot_delay = session_random.randrange(4000, 7000)
             
         elif enemy_type == EnemyType.SHOOTER:
-            self.image = pygame.image.load(ASSET_PATHS["enemy2"]).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (35, 35))
+            image_name = "enemy2"
+            self.image = asset_manager.get_scaled_image(image_name, (35, 35))
             self.health = ENEMY_HEALTH_BASE + level // 2
             self.speed = ENEMY_SPEED_BASE * 1.2 * (1 + level * 0.1)
             self.score_value = SCORE_VALUES["enemy_shooter"]
-            self.shoot_delay = random.randrange(1500, 3000)
+            self.shoot_delay = session_random.randrange(1500, 3000)
             
         elif enemy_type == EnemyType.KAMIKAZE:
-            self.image = pygame.image.load(ASSET_PATHS["enemy"]).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (28, 28))
+            image_name = "enemy"
+            self.image = asset_manager.get_scaled_image(image_name, (28, 28))
             self.health = 1
             self.speed = ENEMY_SPEED_BASE * 2.5 * (1 + level * 0.15)
             self.score_value = SCORE_VALUES["enemy_kamikaze"]
             self.shoot_delay = float('inf')  # Kamikaze enemies don't shoot
             
         self.rect = self.image.get_rect()
+        self.mask = asset_manager.get_mask(image_name, self.image)
         
         # Position
         if x is None:
-            self.rect.x = random.randrange(0, SCREEN_WIDTH - self.rect.width)
+            self.rect.x = session_random.randrange(0, SCREEN_WIDTH - self.rect.width)
         else:
             self.rect.x = x
             
         if y is None:
-            self.rect.y = random.randrange(-150, -40)
+            self.rect.y = session_random.randrange(-150, -40)
         else:
             self.rect.y = y
             
         # Movement
-        self.speed_x = random.uniform(-1, 1)
+        self.speed_x = session_random.uniform(-1, 1)
         self.speed_y = self.speed
         self.direction_change_timer = 0
         
         # AI and behavior
         self.target = None
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = game_clock.get_ticks()
         self.ai_timer = 0
         self.ai_state = "descending"
         
@@ -87,7 +90,9 @@ class Enemy(pygame.sprite.Sprite):
     def update(self):
         self.update_ai()
         self.update_movement()
-        self.update_shooting()
+        # These bullets are never added to the game; hand them back to the pool
+        for bullet in self.update_shooting():
+            bullet.kill()
         self.update_visual_effects()
         self.check_bounds()
         
@@ -95,7 +100,7 @@ class Enemy(pygame.sprite.Sprite):
         if not self.target:
             return
             
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         if self.enemy_type == EnemyType.BASIC:
             # Simple tracking behavior
@@ -109,7 +114,7 @@ class Enemy(pygame.sprite.Sprite):
         elif self.enemy_type == EnemyType.FAST:
             # Erratic movement
             if now - self.direction_change_timer > 1000:
-                self.speed_x = random.uniform(-2, 2)
+                self.speed_x = session_random.uniform(-2, 2)
                 self.direction_change_timer = now
                 
         elif self.enemy_type == EnemyType.HEAVY:
@@ -165,13 +170,13 @@ class Enemy(pygame.sprite.Sprite):
             
     def update_shooting(self):
         if self.enemy_type == EnemyType.KAMIKAZE:
-            return
+            return []
             
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.target and now - self.last_shot > self.shoot_delay:
             bullets = self.shoot()
             self.last_shot = now
-            self.shoot_delay = random.randrange(
+            self.shoot_delay = session_random.randrange(
                 int(self.shoot_delay * 0.8),
                 int(self.shoot_delay * 1.2)
             )
@@ -185,7 +190,7 @@ class Enemy(pygame.sprite.Sprite):
         bullets = []
         
         if self.enemy_type == EnemyType.BASIC:
-            bullet = EnemyBullet(
+            bullet = EnemyBullet.acquire(
                 self.rect.centerx, self.rect.bottom,
                 (self.target.rect.centerx, self.target.rect.centery),
                 speed=3
@@ -194,7 +199,7 @@ class Enemy(pygame.sprite.Sprite):
             
         elif self.enemy_type == EnemyType.FAST:
             # Shoots a single fast bullet
-            bullet = EnemyBullet(
+            bullet = EnemyBullet.acquire(
                 self.rect.centerx, self.rect.bottom,
                 (self.target.rect.centerx, self.target.rect.centery),
                 speed=5
@@ -204,7 +209,7 @@ class Enemy(pygame.sprite.Sprite):
         elif self.enemy_type == EnemyType.HEAVY:
             # Shoots 3 bullets in a spread
             for i in range(-1, 2):
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx, self.rect.bottom,
                     (self.target.rect.centerx + i * 60, self.target.rect.centery),
                     speed=2
@@ -218,7 +223,7 @@ class Enemy(pygame.sprite.Sprite):
                 target_x = self.target.rect.centerx + math.sin(math.radians(angle_offset)) * 100
                 target_y = self.target.rect.centery + math.cos(math.radians(angle_offset)) * 100
                 
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx, self.rect.bottom,
                     (target_x, target_y),
                     speed=4
@@ -228,7 +233,7 @@ class Enemy(pygame.sprite.Sprite):
         return bullets
         
     def update_visual_effects(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.hit_flash and now - self.hit_flash_timer > 100:
             self.hit_flash = False
             
@@ -236,8 +241,8 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.top > SCREEN_HEIGHT:
             if self.enemy_type != EnemyType.KAMIKAZE:
                 # Reset position for non-kamikaze enemies
-                self.rect.x = random.randrange(0, SCREEN_WIDTH - self.rect.width)
-                self.rect.y = random.randrange(-150, -40)
+                self.rect.x = session_random.randrange(0, SCREEN_WIDTH - self.rect.width)
+                self.rect.y = session_random.randrange(-150, -40)
                 self.speed_y = self.speed
                 self.homing_activated = False
             else:
@@ -247,16 +252,10 @@ class Enemy(pygame.sprite.Sprite):
     def damage(self, amount):
         self.health -= amount
         self.hit_flash = True
-        self.hit_flash_timer = pygame.time.get_ticks()
+        self.hit_flash_timer = game_clock.get_ticks()
         
         if self.health <= 0:
-            # Play explosion sound
-            try:
-                explosion_sound = pygame.mixer.Sound(ASSET_PATHS["explosion"])
-                explosion_sound.set_volume(SFX_VOLUME)
-                explosion_sound.play()
-            except:
-                pass
+            sound_manager.play_sound("explosion", channel="explosion")
             return True
         return False
         
@@ -291,14 +290,14 @@ class Boss(pygame.sprite.Sprite):
         self.level = level
         self.boss_type = boss_type
         
-        # Load boss image
-        self.image = pygame.image.load(ASSET_PATHS["boss"]).convert_alpha()
+        # Boss image, shared with every boss of this size
         if boss_type == 1:
-            self.image = pygame.transform.scale(self.image, (100, 80))
+            self.image = asset_manager.get_scaled_image("boss", (100, 80))
         else:
-            self.image = pygame.transform.scale(self.image, (120, 100))
+            self.image = asset_manager.get_scaled_image("boss", (120, 100))
             
         self.rect = self.image.get_rect()
+        self.mask = asset_manager.get_mask("boss", self.image)
         self.rect.centerx = SCREEN_WIDTH // 2
         self.rect.y = -self.rect.height
         
@@ -338,7 +337,8 @@ class Boss(pygame.sprite.Sprite):
             
         self.update_entry()
         self.update_patterns()
-        self.update_shooting()
+        for bullet in self.update_shooting():
+            bullet.kill()
         self.update_phase()
         self.update_visual_effects()
         self.spawn_minions()
@@ -350,7 +350,7 @@ class Boss(pygame.sprite.Sprite):
             
     def update_patterns(self):
         if self.rect.y >= 50:
-            now = pygame.time.get_ticks()
+            now = game_clock.get_ticks()
             
             if now - self.pattern_timer > self.pattern_duration:
                 self.pattern = (self.pattern + 1) % 4
@@ -388,7 +388,7 @@ class Boss(pygame.sprite.Sprite):
                     self.rect.x += dx * 0.02
                     
     def update_shooting(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.target and now - self.last_shot > self.shoot_delay:
             bullets = self.shoot()
             self.last_shot = now
@@ -404,7 +404,7 @@ class Boss(pygame.sprite.Sprite):
         if self.pattern == 0:
             # Spray downward
             for i in range(-2, 3):
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx + i * 25, self.rect.bottom,
                     (self.rect.centerx + i * 25, SCREEN_HEIGHT),
                     speed=3
@@ -414,7 +414,7 @@ class Boss(pygame.sprite.Sprite):
         elif self.pattern == 1:
             # Aimed shots
             for i in range(-1, 2):
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx + i * 30, self.rect.bottom,
                     (self.target.rect.centerx + i * 50, self.target.rect.centery),
                     speed=4
@@ -426,7 +426,7 @@ class Boss(pygame.sprite.Sprite):
             for angle in range(0, 360, 30):
                 dx = math.cos(math.radians(angle)) * 300
                 dy = math.sin(math.radians(angle)) * 300
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx, self.rect.centery,
                     (self.rect.centerx + dx, self.rect.centery + dy),
                     speed=3
@@ -435,7 +435,7 @@ class Boss(pygame.sprite.Sprite):
                 
         elif self.pattern == 3:
             # Rapid aimed shots
-            bullet = EnemyBullet(
+            bullet = EnemyBullet.acquire(
                 self.rect.centerx, self.rect.bottom,
                 (self.target.rect.centerx, self.target.rect.centery),
                 speed=6
@@ -446,10 +446,10 @@ class Boss(pygame.sprite.Sprite):
         if self.phase >= 2:
             # Add spiral pattern
             for i in range(8):
-                angle = (pygame.time.get_ticks() / 100 + i * 45) % 360
+                angle = (game_clock.get_ticks() / 100 + i * 45) % 360
                 dx = math.cos(math.radians(angle)) * 200
                 dy = math.sin(math.radians(angle)) * 200
-                bullet = EnemyBullet(
+                bullet = EnemyBullet.acquire(
                     self.rect.centerx, self.rect.centery,
                     (self.rect.centerx + dx, self.rect.centery + dy),
                     speed=2
@@ -477,15 +477,15 @@ class Boss(pygame.sprite.Sprite):
         if self.phase < 2:
             return
             
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_minion_spawn > self.minion_spawn_delay:
             minions = []
             
             # Spawn 2-3 minions
-            for i in range(random.randint(2, 3)):
-                enemy_type = random.choice([EnemyType.BASIC, EnemyType.FAST])
+            for i in range(session_random.randint(2, 3)):
+                enemy_type = session_random.choice([EnemyType.BASIC, EnemyType.FAST])
                 minion = Enemy(enemy_type, self.level)
-                minion.rect.x = self.rect.x + random.randint(-100, 100)
+                minion.rect.x = self.rect.x + session_random.randint(-100, 100)
                 minion.rect.y = self.rect.bottom
                 minion.target = self.target
                 minions.append(minion)
@@ -495,31 +495,20 @@ class Boss(pygame.sprite.Sprite):
         return []
         
     def update_visual_effects(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if self.hit_flash and now - self.hit_flash_timer > 150:
             self.hit_flash = False
             
     def damage(self, amount):
         self.health -= amount
         self.hit_flash = True
-        self.hit_flash_timer = pygame.time.get_ticks()
+        self.hit_flash_timer = game_clock.get_ticks()
         
         # Play boss hit sound
-        try:
-            boss_hit_sound = pygame.mixer.Sound(ASSET_PATHS["explosion"])
-            boss_hit_sound.set_volume(SFX_VOLUME * 0.8)
-            boss_hit_sound.play()
-        except:
-            pass
+        sound_manager.play_sound("explosion", volume=0.8, channel="enemy")
             
         if self.health <= 0:
-            # Play explosion sound
-            try:
-                explosion_sound = pygame.mixer.Sound(ASSET_PATHS["explosion"])
-                explosion_sound.set_volume(SFX_VOLUME)
-                explosion_sound.play()
-            except:
-                pass
+            sound_manager.play_sound("explosion", channel="explosion")
             return True
         return False
         
@@ -0,0 +1,245 @@
+import os
+import csv
+import time
+import pygame
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from config import *
+from trace_recorder import trace_recorder
+
+PHASE_COLORS = {
+    "level": (120, 120, 255),
+    "sprite_update": (0, 200, 255),
+    "shooting": (255, 200, 0),
+    "collisions": (255, 80, 80),
+    "collision_results": (255, 140, 200),
+    "background": (80, 200, 80),
+    "sprites": (200, 255, 120),
+    "hud": (200, 120, 255),
+    "other": (110, 110, 110)
+}
+
+class PhaseTimer:
+    """Context manager adding the time spent in its block to one profiler phase"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.profiler.current[self.name] += end - self.start
+        trace_recorder.complete(self.name, self.start, end)
+        return False
+
+class NullPhase:
+    """Stand-in returned while profiling is off, so timed blocks cost next to nothing"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_PHASE = NullPhase()
+
+class FrameProfiler:
+    """Per-frame timings of the engine phases.
+
+    Engine code wraps each phase in `with frame_profiler.phase(name):`; a
+    frame's phases accumulate over all of its simulation steps. Whatever is
+    left of the frame time is reported as "other". Frames can be shown as a
+    stacked graph overlay, appended to a CSV that rolls over to <file>.1 and
+    recorded as Chrome trace events.
+    """
+
+    def __init__(self, phases: List[str] = PROFILER_PHASES, history: int = PROFILER_HISTORY):
+        self.phases = list(phases)
+        self.timers = {name: PhaseTimer(self, name) for name in self.phases}
+        self.current: Dict[str, float] = dict.fromkeys(self.phases, 0.0)
+        self.history: deque = deque(maxlen=history)  # (total_ms, {phase: ms})
+        self.frame_start = 0.0
+        self.frame_number = 0
+        self.enabled = False
+        self.in_frame = False
+
+        # Overlay
+        self.overlay_visible = False
+        self.graph: Optional[pygame.Surface] = None
+        self.legend: List[Tuple[str, str]] = []
+        self.last_spike: Optional[str] = None
+
+        # CSV export
+        self.csv_path: Optional[str] = None
+        self.csv_rows: List[List] = []
+        self.csv_row_count = 0
+
+    def phase(self, name: str):
+        return self.timers[name] if self.enabled else NULL_PHASE
+
+    def update_enabled(self):
+        self.enabled = self.overlay_visible or self.csv_path is not None or trace_recorder.active
+
+    def toggle_overlay(self) -> bool:
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            # Start a fresh graph rather than showing a stale one
+            self.graph = None
+            self.history.clear()
+        self.update_enabled()
+        return self.overlay_visible
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for name in self.phases:
+            self.current[name] = 0.0
+        self.frame_start = time.perf_counter()
+        self.in_frame = True
+
+    def end_frame(self):
+        # Profiling switched on mid-frame has nothing to report until the next one
+        if not (self.enabled and self.in_frame):
+            self.in_frame = False
+            return
+        self.in_frame = False
+
+        frame_end = time.perf_counter()
+        trace_recorder.complete("frame", self.frame_start, frame_end)
+        total_ms = (frame_end - self.frame_start) * 1000
+        phase_ms = {name: seconds * 1000 for name, seconds in self.current.items()}
+        phase_ms["other"] = max(0.0, total_ms - sum(phase_ms.values()))
+        self.history.append((total_ms, phase_ms))
+        self.frame_number += 1
+
+        if total_ms > 1000 / FPS:
+            worst = max(self.phases, key=phase_ms.get)
+            self.last_spike = f"Last spike: {total_ms:.1f} ms ({worst} {phase_ms[worst]:.1f})"
+
+        if self.overlay_visible:
+            self.add_graph_column(phase_ms)
+            if self.frame_number % PROFILER_LEGEND_INTERVAL == 0 or not self.legend:
+                self.update_legend()
+
+        if self.csv_path is not None:
+            self.csv_rows.append([self.frame_number, round(total_ms, 3)] +
+                                 [round(phase_ms[name], 3) for name in self.phases + ["other"]])
+            if len(self.csv_rows) >= PROFILER_CSV_FLUSH_FRAMES:
+                self.flush_csv()
+
+    def get_averages(self, frames: int = FPS) -> Dict[str, float]:
+        recent = list(self.history)[-frames:]
+        if not recent:
+            return {}
+        averages = {"total": sum(total for total, _ in recent) / len(recent)}
+        for name in self.phases + ["other"]:
+            averages[name] = sum(phase_ms[name] for _, phase_ms in recent) / len(recent)
+        return averages
+
+    # Overlay
+
+    def add_graph_column(self, phase_ms: Dict[str, float]):
+        width = self.history.maxlen
+        if self.graph is None:
+            self.graph = pygame.Surface((width, PROFILER_GRAPH_HEIGHT), pygame.SRCALPHA)
+            self.graph.fill((0, 0, 0, 160))
+
+        # Scroll one column left and stack this frame's phases in the new one
+        self.graph.scroll(-1, 0)
+        self.graph.fill((0, 0, 0, 160), (width - 1, 0, 1, PROFILER_GRAPH_HEIGHT))
+        scale = PROFILER_GRAPH_HEIGHT / PROFILER_GRAPH_MAX_MS
+        bottom = PROFILER_GRAPH_HEIGHT
+        for name in self.phases + ["other"]:
+            height = phase_ms[name] * scale
+            if height < 0.5:
+                continue
+            top = max(0, bottom - round(height))
+            self.graph.fill(PHASE_COLORS[name], (width - 1, top, 1, bottom - top))
+            bottom = top
+            if bottom == 0:
+                break
+
+    def update_legend(self):
+        averages = self.get_averages()
+        self.legend = [("total", f"frame {averages['total']:.1f} ms")]
+        self.legend += [(name, f"{name} {averages[name]:.2f}") for name in self.phases + ["other"]]
+
+    def draw_overlay(self, surface: pygame.Surface, ui_manager) -> List[pygame.Rect]:
+        if self.graph is None:
+            return []
+
+        width = self.history.maxlen
+        x = 10
+        y = SCREEN_HEIGHT - PROFILER_GRAPH_HEIGHT - 10
+        rects = [surface.blit(self.graph, (x, y))]
+
+        # Budget line for one 60 FPS frame
+        budget_y = y + PROFILER_GRAPH_HEIGHT - round(1000 / FPS * PROFILER_GRAPH_HEIGHT / PROFILER_GRAPH_MAX_MS)
+        pygame.draw.line(surface, WHITE, (x, budget_y), (x + width - 1, budget_y))
+
+        legend_x = x + width + 10
+        legend_y = y - 60
+        for name, text in self.legend:
+            color = PHASE_COLORS.get(name, WHITE)
+            rects.append(ui_manager.draw_text(surface, text, "small", legend_x, legend_y, color, False))
+            legend_y += 16
+        if self.last_spike:
+            rects.append(ui_manager.draw_text(surface, self.last_spike, "small", x, y - 20, RED, False))
+        return rects
+
+    # Trace export
+
+    def start_trace(self, path: str):
+        trace_recorder.start(path)
+        self.update_enabled()
+
+    def stop_trace(self) -> Optional[str]:
+        path = trace_recorder.stop()
+        self.update_enabled()
+        return path
+
+    # CSV export
+
+    def start_csv(self, path: str):
+        self.stop_csv()
+        self.csv_path = path
+        self.csv_row_count = 0
+        self.write_csv_header()
+        self.update_enabled()
+
+    def write_csv_header(self):
+        with open(self.csv_path, "w", newline="") as f:
+            csv.writer(f).writerow(["frame", "total_ms"] + [f"{name}_ms" for name in self.phases + ["other"]])
+
+    def flush_csv(self):
+        if self.csv_path is None or not self.csv_rows:
+            return
+
+        # Roll over once the file is full so a long session can't grow it forever
+        if self.csv_row_count + len(self.csv_rows) > PROFILER_CSV_MAX_ROWS:
+            os.replace(self.csv_path, self.csv_path + ".1")
+            self.write_csv_header()
+            self.csv_row_count = 0
+
+        with open(self.csv_path, "a", newline="") as f:
+            csv.writer(f).writerows(self.csv_rows)
+        self.csv_row_count += len(self.csv_rows)
+        self.csv_rows = []
+
+    def stop_csv(self) -> Optional[str]:
+        if self.csv_path is None:
+            return None
+        self.flush_csv()
+        path, self.csv_path = self.csv_path, None
+        self.update_enabled()
+        return path
+
+# Global frame profiler instance
+frame_profiler = FrameProfiler()
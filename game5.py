@@ -34,6 +34,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 try:
     from config import *
     from game_engine import GameEngine
+    from frame_profiler import frame_profiler
     from asset_manager import asset_manager
     from sound_manager import sound_manager
     from utils import save_json, load_json
@@ -123,6 +124,7 @@ class GameLauncher:
             'config.py',
             'game_engine.py',
             'game_state.py',
+            'input_manager.py',
             'level_manager.py',
             'player.py',
             'enemies.py',
@@ -131,9 +133,22 @@ class GameLauncher:
             'effects.py',
             'ui_manager.py',
             'collision_manager.py',
+            'dirty_renderer.py',
+            'achievement_engine.py',
+            'frame_profiler.py',
+            'projectile_field.py',
+            'save_writer.py',
+            'score_store.py',
+            'session.py',
+            'trace_recorder.py',
             'sound_manager.py',
+            'audio_timeline.py',
+            'sound_synth.py',
+            'voice_manager.py',
             'asset_manager.py',
+            'asset_cache.py',
             'sprite_groups.py',
+            'sprite_pools.py',
             'utils.py'
         ]
         
@@ -194,6 +209,9 @@ class GameLauncher:
                 "fullscreen": False,
                 "show_fps": False,
                 "difficulty": "normal",
+                "numpy_collisions": NUMPY_NARROW_PHASE,
+                "projectile_field": PROJECTILE_FIELD_ENABLED,
+                "dirty_rects": DIRTY_RECT_RENDERING,
                 "controls": CONTROLS.copy()
             }
             save_json(default_settings, settings_path)
@@ -232,7 +250,9 @@ class GameLauncher:
         except:
             pass
             
-    def run(self):
+    def run(self, seed: Optional[int] = None, record: Optional[str] = None,
+            replay: Optional[str] = None, profile: Optional[str] = None,
+            trace: Optional[str] = None):
         """Main game execution method."""
         print("=" * 60)
         print("ShooTar - Ultimate Space Shooter")
@@ -255,7 +275,14 @@ class GameLauncher:
             
             # Initialize game engine
             print("Initializing game engine...")
-            self.game_engine = GameEngine()
+            self.game_engine = GameEngine(seed=seed, trace_path=trace)
+            if profile:
+                frame_profiler.start_csv(profile)
+            
+            if replay:
+                self.game_engine.start_replay(replay)
+            elif record:
+                self.game_engine.start_recording(record, seed)
             
             # Start the game
             print("Starting game...")
@@ -286,6 +313,44 @@ class GameLauncher:
                 
             print("Game shutdown complete.")
             
+    def run_headless(self, frames: int, render: bool = True, seed: Optional[int] = None,
+                     replay: Optional[str] = None, profile: Optional[str] = None,
+                     trace: Optional[str] = None) -> bool:
+        """Run the simulation without a window or throttling and report its speed."""
+        try:
+            if not self.check_dependencies():
+                print("Cannot start game due to missing dependencies.")
+                return False
+                
+            if not self.initialize_pygame():
+                print("Cannot start game due to pygame initialization failure.")
+                return False
+                
+            self.create_default_config()
+            
+            print(f"Running {frames} headless frames{'' if render else ' without rendering'}...")
+            # A headless run never touches the player's saves, scores or settings
+            self.game_engine = GameEngine(headless=True, seed=seed, trace_path=trace, persist=False)
+            if profile:
+                frame_profiler.start_csv(profile)
+            stats = self.game_engine.run_headless(frames, render, replay)
+            
+            print(f"Simulated {stats['frames']} frames in {stats['seconds']:.2f}s "
+                  f"({stats['fps']:.1f} simulated FPS)")
+            return True
+            
+        except Exception as e:
+            # No error dialog: nobody is watching a headless run
+            print(f"Error in headless run: {e}")
+            self.log_error(traceback.format_exc())
+            return False
+            
+        finally:
+            try:
+                pygame.quit()
+            except:
+                pass
+                
     def show_help(self):
         """Show help information."""
         help_text = """
@@ -320,6 +385,14 @@ Command Line Options:
   --nosound     Disable sound
   --fullscreen  Start in fullscreen mode
   --reset       Reset all save data
+  --headless    Run without a window or frame limiter and print simulated FPS
+  --frames N    Number of frames for --headless (default 3600)
+  --norender    Skip rendering in --headless mode
+  --seed N      Seed the session RNG so runs repeat exactly
+  --record FILE Record every simulation step's input to a replay file
+  --replay FILE Play a recorded replay (also works with --headless)
+  --profile FILE Write per-phase frame timings to a rolling CSV (F3 shows the overlay)
+  --trace FILE  Write a Chrome trace-event timeline of frame phases and game events
   
 Files:
   All game files should be in the same directory as this script.
@@ -347,7 +420,8 @@ For support or bug reports, check the error_log.txt file.
             SAVE_PATHS["settings"],
             SAVE_PATHS["progress"],
             SAVE_PATHS["achievements"],
-            SAVE_PATHS["highscores"]
+            SAVE_PATHS["highscores"],
+            SAVE_PATHS["database"]
         ]
         
         for file in save_files:
@@ -360,6 +434,14 @@ For support or bug reports, check the error_log.txt file.
                     
         print("Save data reset complete.")
 
+def get_option_value(args, name: str) -> Optional[str]:
+    """Return the argument following name, or None if it is missing."""
+    if name in args:
+        index = args.index(name) + 1
+        if index < len(args):
+            return args[index]
+    return None
+
 def main():
     """Main entry point."""
     launcher = GameLauncher()
@@ -394,9 +476,30 @@ def main():
     if fullscreen:
         print("Starting in fullscreen mode")
         
+    # Reproducible sessions
+    try:
+        seed = int(get_option_value(args, "--seed")) if "--seed" in args else None
+        frames = int(get_option_value(args, "--frames")) if "--frames" in args else 3600
+    except (TypeError, ValueError):
+        print("--seed and --frames need a whole number")
+        sys.exit(2)
+    record = get_option_value(args, "--record")
+    replay = get_option_value(args, "--replay")
+    profile = get_option_value(args, "--profile")
+    trace = get_option_value(args, "--trace")
+        
+    # Headless soak/benchmark run
+    if "--headless" in args:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        
+        success = launcher.run_headless(frames, render="--norender" not in args, seed=seed,
+                                        replay=replay, profile=profile, trace=trace)
+        sys.exit(0 if success else 1)
+        
     # Run the game
     try:
-        success = launcher.run()
+        success = launcher.run(seed, record, replay, profile, trace)
         sys.exit(0 if success else 1)
     except Exception as e:
         launcher.handle_error(e, "launcher")
@@ -1,22 +1,42 @@
 import pygame
 import sys
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List
 from config import *
+from session import session_random, game_clock
+from input_manager import input_manager
 from game_state import GameStateManager
 from level_manager import LevelManager
 from player import Player
 from ui_manager import UIManager
 from collision_manager import CollisionManager
+from dirty_renderer import DirtyRenderer
+from frame_profiler import frame_profiler
+from save_writer import save_writer
+from score_store import score_store
+from voice_manager import voice_manager
+from audio_timeline import audio_timeline
+from trace_recorder import trace_recorder
 from sound_manager import sound_manager
 from asset_manager import asset_manager
-from effects import effect_manager
+from effects import effect_manager, particle_emitter
 from sprite_groups import sprite_groups
+from sprite_pools import sprite_pools
+from projectile_field import projectile_field
+from projectiles import add_projectile_to_game
 from powerups import PowerUp
 from utils import Timer
 import random
 
 class GameEngine:
-    def __init__(self):
+    def __init__(self, headless: bool = False, seed: Optional[int] = None, trace_path: Optional[str] = None,
+                 persist: bool = True):
+        # Headless engines expect the SDL dummy drivers and never start music
+        self.headless = headless
+        
+        # Trace from the start so asset loading is on the timeline
+        if trace_path:
+            frame_profiler.start_trace(trace_path)
         pygame.init()
         pygame.mixer.init()
         
@@ -27,58 +47,172 @@ class GameEngine:
         # Initialize game systems
         self.clock = pygame.time.Clock()
         self.running = True
-        self.game_state = GameStateManager()
+        self.game_state = GameStateManager(persist)
         self.level_manager = LevelManager()
         self.ui_manager = UIManager()
+        self.game_state.achievement_engine.add_listener(self.show_achievement)
         self.collision_manager = CollisionManager(sound_manager, self.ui_manager)
+        self.collision_manager.set_numpy_narrow_phase(self.game_state.get_setting("numpy_collisions"))
+        projectile_field.set_enabled(self.game_state.get_setting("projectile_field"))
+        self.dirty_renderer = DirtyRenderer()
+        self.dirty_renderer.set_enabled(self.game_state.get_setting("dirty_rects"))
         
         # Initialize player
         self.player = None
         self.background_scroll_y = 0
-        self.background_speed = 2
+        self.background_speed = BACKGROUND_SCROLL_SPEED
+        
+        # Fixed-timestep simulation; render_alpha is how far between the last two steps we draw
+        self.step_ms = 1000 / SIMULATION_RATE
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+        self.gameplay_stepped = False  # Whether the last step moved the world, so there is motion to interpolate
         
         # Game timers
         self.powerup_spawn_timer = Timer(POWERUP_SPAWN_RATE)
         self.auto_save_timer = Timer(30000)  # Auto-save every 30 seconds
         
-        # Load all assets
-        asset_manager.load_all_assets()
+        # Headless runs load everything up front; a window opens on the menu while a
+        # loader thread reads the rest
+        if headless:
+            asset_manager.load_all_assets()
+        else:
+            asset_manager.start_loading()
+        
+        # Seed the RNG and zero the simulated clock for this session
+        self.begin_session(seed)
         
         # Start background music
-        sound_manager.play_music("background_music", loops=-1)
+        if not headless:
+            sound_manager.play_music("background_music", loops=-1)
         
         # Initialize game state
         self.game_state.change_state(GameState.MENU)
         
     def run(self):
         while self.running:
+            # The limiter's sleep happens before the profiled part of the frame
+            elapsed_ms = self.clock.tick(FPS)
+            frame_profiler.begin_frame()
+            if not asset_manager.loaded:
+                self.update_loading()
             self.handle_events()
-            self.update()
+            self.advance(elapsed_ms)
             self.render()
-            self.clock.tick(FPS)
+            frame_profiler.end_frame()
             
         self.cleanup()
         
+    def update_loading(self):
+        # A game asked for during loading starts once the last asset is ready
+        if asset_manager.update_loading() and self.game_state.state == GameState.LOADING:
+            self.start_new_game()
+            
+    def begin_session(self, seed: Optional[int] = None) -> int:
+        """Reseed the RNG and restart the simulated clock so a run can be repeated"""
+        seed = session_random.seed_session(seed)
+        game_clock.reset()
+        audio_timeline.clear()
+        self.accumulator = 0.0
+        self.powerup_spawn_timer.reset()
+        self.auto_save_timer.reset()
+        return seed
+        
+    def start_recording(self, path: str, seed: Optional[int] = None):
+        # Recording and playback both start from a freshly seeded session with every asset loaded
+        asset_manager.finish_loading()
+        seed = self.begin_session(seed)
+        input_manager.start_recording(path, seed, self.step_ms)
+        print(f"Recording replay to {path} (seed {seed})")
+        
+    def start_replay(self, path: str):
+        replay = input_manager.load_replay(path)
+        asset_manager.finish_loading()
+        self.step_ms = replay["step_ms"]
+        self.begin_session(replay["seed"])
+        input_manager.start_playback(replay)
+        print(f"Playing replay {path} ({replay['steps']} steps, seed {replay['seed']})")
+        
+    def run_headless(self, frames: int, render: bool = False, replay: Optional[str] = None) -> Dict[str, float]:
+        """Step a new game (or a replay) frames times without throttling; returns throughput stats"""
+        if replay:
+            self.start_replay(replay)
+            frames = input_manager.playback["steps"]
+        else:
+            self.start_new_game()
+        
+        simulated = 0
+        start = time.perf_counter()
+        while simulated < frames and self.running:
+            frame_profiler.begin_frame()
+            self.handle_events()
+            self.update()
+            if render:
+                self.render()
+            frame_profiler.end_frame()
+            simulated += 1
+        elapsed = time.perf_counter() - start
+        input_manager.stop_recording()
+        frame_profiler.stop_csv()
+        frame_profiler.stop_trace()
+        
+        # Nothing calls cleanup() after a headless run, so finish queued writes here
+        save_writer.stop()
+        
+        return {
+            "frames": simulated,
+            "seconds": elapsed,
+            "fps": simulated / elapsed if elapsed > 0 else 0.0
+        }
+        
+    def advance(self, elapsed_ms: float) -> int:
+        # Run as many fixed simulation steps as real time demands, capped to avoid a spiral of death
+        self.accumulator += elapsed_ms
+        steps = 0
+        while self.accumulator >= self.step_ms:
+            if steps == MAX_CATCH_UP_STEPS:
+                # Too far behind: drop the backlog and let the game slow down instead
+                self.accumulator %= self.step_ms
+                break
+            self.update()
+            self.accumulator -= self.step_ms
+            steps += 1
+            
+        # Paused and between-level steps leave previous positions stale, so draw the current ones
+        if INTERPOLATE_RENDERING and self.gameplay_stepped:
+            self.render_alpha = self.accumulator / self.step_ms
+        else:
+            self.render_alpha = 1.0
+        return steps
+        
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
                 
+            # Key events are applied by the next simulation step so they can be recorded
             elif event.type == pygame.KEYDOWN:
-                self.handle_key_down(event.key)
+                input_manager.queue_key_event(True, event.key)
                 
             elif event.type == pygame.KEYUP:
-                self.handle_key_up(event.key)
+                input_manager.queue_key_event(False, event.key)
                 
-            # Handle UI events
-            if self.game_state.state == GameState.MENU:
-                selection = self.ui_manager.handle_menu_input(event, self.get_menu_options())
-                if selection is not None:
-                    self.handle_menu_selection(selection)
+    def handle_key_event(self, pressed: bool, key: int):
+        if pressed:
+            self.handle_key_down(key)
+        else:
+            self.handle_key_up(key)
+            
+        # Handle UI events
+        if self.game_state.state == GameState.MENU:
+            event = pygame.event.Event(pygame.KEYDOWN if pressed else pygame.KEYUP, key=key)
+            selection = self.ui_manager.handle_menu_input(event, self.get_menu_options())
+            if selection is not None:
+                self.handle_menu_selection(selection)
                     
     def handle_key_down(self, key):
         if key == CONTROLS["quit"]:
-            if self.game_state.state == GameState.PLAYING:
+            if self.game_state.state in (GameState.PLAYING, GameState.LOADING):
                 self.game_state.change_state(GameState.MENU)
             else:
                 self.running = False
@@ -87,6 +221,9 @@ class GameEngine:
             if self.game_state.state == GameState.PLAYING:
                 self.game_state.toggle_pause()
                 
+        elif key == CONTROLS["profiler"]:
+            frame_profiler.toggle_overlay()
+                
         elif key == CONTROLS["restart"]:
             if self.game_state.state in [GameState.GAME_OVER, GameState.PLAYING]:
                 self.start_new_game()
@@ -129,12 +266,18 @@ class GameEngine:
         return []
         
     def start_new_game(self):
+        if not asset_manager.loaded:
+            self.game_state.change_state(GameState.LOADING)
+            return
+            
         self.game_state.start_new_game()
         self.level_manager.start_level(1)
         
         # Initialize player
         self.player = Player()
+        self.game_state.ship_type = self.player.ship_type.name
         sprite_groups.clear_all_except(["effects", "particles"])
+        projectile_field.clear()
         sprite_groups.add_sprite(self.player, ["all", "player"])
         
         # Initialize collision manager
@@ -154,6 +297,11 @@ class GameEngine:
         
         # Play game start sound
         sound_manager.play_ui_sound("confirm")
+        self.play_theme_music()
+        
+    def play_theme_music(self):
+        if not self.headless:
+            sound_manager.crossfade_music(THEME_MUSIC[self.level_manager.theme.name])
         
     def advance_to_next_level(self):
         if self.level_manager.advance_to_next_level():
@@ -164,8 +312,9 @@ class GameEngine:
             if self.player:
                 self.player.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
                 
-            # Play level start sound
+            # Play level start sound and bring in the theme's music
             sound_manager.play_ui_sound("confirm")
+            self.play_theme_music()
         else:
             # Game completed
             self.game_state.game_over_state()
@@ -174,59 +323,52 @@ class GameEngine:
         if not self.running:
             return
             
+        # A replay ends the session once its recorded steps run out
+        if input_manager.is_playback_finished():
+            self.running = False
+            return
+            
+        # One simulation step: advance the simulated clock and apply this step's input
+        game_clock.advance(self.step_ms)
+        for pressed, key in input_manager.begin_step():
+            self.handle_key_event(pressed, key)
+            
         # Update game state
         self.game_state.update()
         
         # Update based on current state
-        if self.game_state.state == GameState.PLAYING and not self.game_state.paused:
+        self.gameplay_stepped = self.game_state.state == GameState.PLAYING and not self.game_state.paused
+        if self.gameplay_stepped:
             self.update_gameplay()
         elif self.game_state.state == GameState.MENU:
             self.update_menu()
         elif self.game_state.state == GameState.GAME_OVER:
             self.update_game_over()
             
-        # Update effects and sound
+        # Update effects, run due audio actions and start this step's sounds together
         effect_manager.update()
+        audio_timeline.update()
+        voice_manager.flush()
         
         # Auto-save
         if self.auto_save_timer.update():
-            self.game_state.save_all_data()
+            with trace_recorder.span("autosave"):
+                self.game_state.save_all_data(record_score=False)
             self.auto_save_timer.reset()
             
     def update_gameplay(self):
         # Update level manager
-        self.level_manager.update(self.player)
+        with frame_profiler.phase("level"):
+            self.level_manager.update(self.player)
         
-        # Update all sprites
-        sprite_groups.update_all()
+        # Update all sprites, batched projectiles and particles
+        with frame_profiler.phase("sprite_update"):
+            sprite_groups.update_all()
+            projectile_field.update()
+            particle_emitter.update()
         
-        # Update player weapon system
-        if self.player:
-            keys = pygame.key.get_pressed()
-            if keys[CONTROLS["shoot"]]:
-                bullets = self.player.shoot()
-                for bullet in bullets:
-                    sprite_groups.add_sprite(bullet, ["all", "bullets"])
-                    
-                # Track shots fired
-                if bullets:
-                    self.game_state.shot_fired()
-                    
-        # Update enemy shooting
-        enemies = sprite_groups.get_group("enemies")
-        for enemy in enemies:
-            if hasattr(enemy, 'update_shooting'):
-                enemy_bullets = enemy.update_shooting()
-                for bullet in enemy_bullets:
-                    sprite_groups.add_sprite(bullet, ["all", "enemy_bullets"])
-                    
-        # Update boss shooting
-        bosses = sprite_groups.get_group("bosses")
-        for boss in bosses:
-            if hasattr(boss, 'update_shooting'):
-                boss_bullets = boss.update_shooting()
-                for bullet in boss_bullets:
-                    sprite_groups.add_sprite(bullet, ["all", "enemy_bullets"])
+        with frame_profiler.phase("shooting"):
+            self.update_shooting()
                     
         # Spawn power-ups
         if self.powerup_spawn_timer.update():
@@ -235,10 +377,12 @@ class GameEngine:
             self.powerup_spawn_timer.reset()
             
         # Check collisions
-        collision_results = self.collision_manager.check_all_collisions(self.player)
+        with frame_profiler.phase("collisions"):
+            collision_results = self.collision_manager.check_all_collisions(self.player)
         
         # Process collision results
-        self.process_collision_results(collision_results)
+        with frame_profiler.phase("collision_results"):
+            self.process_collision_results(collision_results)
         
         # Update background scroll
         self.background_scroll_y += self.background_speed
@@ -253,6 +397,35 @@ class GameEngine:
         if self.player and self.player.lives <= 0:
             self.game_state.game_over_state()
             
+    def update_shooting(self):
+        # Update player weapon system
+        if self.player:
+            keys = input_manager.get_pressed()
+            if keys[CONTROLS["shoot"]]:
+                bullets = self.player.shoot()
+                for bullet in bullets:
+                    add_projectile_to_game(bullet)
+                    
+                # Track shots fired
+                if bullets:
+                    self.game_state.shot_fired()
+                    
+        # Update enemy shooting
+        enemies = sprite_groups.get_group("enemies")
+        for enemy in enemies:
+            if hasattr(enemy, 'update_shooting'):
+                enemy_bullets = enemy.update_shooting()
+                for bullet in enemy_bullets:
+                    add_projectile_to_game(bullet)
+                    
+        # Update boss shooting
+        bosses = sprite_groups.get_group("bosses")
+        for boss in bosses:
+            if hasattr(boss, 'update_shooting'):
+                boss_bullets = boss.update_shooting()
+                for bullet in boss_bullets:
+                    add_projectile_to_game(bullet)
+                    
     def update_menu(self):
         # Update menu animations/effects
         pass
@@ -325,9 +498,62 @@ class GameEngine:
         self.ui_manager.screen_shake(10, 500)
         
     def render(self):
+        # The profiler overlay is drawn over everything, so it needs full redraws
+        if self.dirty_renderer.enabled and not frame_profiler.overlay_visible and self.render_dirty():
+            return
+        self.dirty_renderer.invalidate()
+        
         # Clear screen
         self.screen.fill(BLACK)
+        self.render_state()
+        if frame_profiler.overlay_visible:
+            frame_profiler.draw_overlay(self.screen, self.ui_manager)
+        pygame.display.flip()
         
+    def render_dirty(self) -> bool:
+        # Returns False when the current state needs the full-redraw path
+        state = self.game_state.state
+        
+        if state == GameState.PLAYING:
+            if self.background_speed != 0 or effect_manager.get_shake_offset() != (0, 0):
+                return False
+            background = asset_manager.get_background(self.level_manager.theme.name.lower())
+            if background is None:
+                return False
+            self.dirty_renderer.begin_frame(self.screen, background)
+            self.dirty_renderer.track(self.render_gameplay(draw_background=False))
+            self.dirty_renderer.present()
+            return True
+            
+        if state in (GameState.MENU, GameState.PAUSED, GameState.GAME_OVER, GameState.LEVEL_COMPLETE,
+                     GameState.LOADING):
+            if self.dirty_renderer.needs_redraw(self.get_screen_signature()):
+                self.screen.fill(BLACK)
+                self.render_state()
+                pygame.display.flip()
+            return True
+            
+        return False
+        
+    def get_screen_signature(self) -> tuple:
+        # Everything a static screen shows; it is redrawn only when this changes
+        state = self.game_state.state
+        signature = (state, self.ui_manager.menu_selection, self.game_state.score,
+                     self.game_state.high_score, self.game_state.stats['highest_level'],
+                     len(self.ui_manager.achievement_notifications), asset_manager.get_load_progress())
+        
+        if state == GameState.PAUSED:
+            signature += (effect_manager.get_shake_offset(),)
+            if self.game_state.get_setting("show_fps"):
+                signature += (self.get_frame_rate(),)
+        elif state == GameState.GAME_OVER:
+            signature += (self.game_state.get_current_session_time(),)
+        elif state == GameState.LEVEL_COMPLETE:
+            summary = self.level_manager.get_level_summary()
+            signature += (round(summary["duration"], 1), summary["enemies_killed"], summary["score"])
+        return signature
+        
+    def render_state(self):
         # Render based on current state
         if self.game_state.state == GameState.PLAYING:
             self.render_gameplay()
@@ -344,44 +570,60 @@ class GameEngine:
             self.render_settings()
         elif self.game_state.state == GameState.ACHIEVEMENTS:
             self.render_achievements()
+        elif self.game_state.state == GameState.LOADING:
+            self.ui_manager.draw_loading_screen(self.screen, asset_manager.get_load_progress())
             
-        # Apply screen shake
-        shake_offset = effect_manager.update()
-        if shake_offset != (0, 0):
-            # Create a temporary surface for shake effect
-            temp_surface = self.screen.copy()
-            self.screen.fill(BLACK)
-            self.screen.blit(temp_surface, shake_offset)
-            
-        pygame.display.flip()
+    def render_gameplay(self, draw_background: bool = True) -> List[pygame.Rect]:
+        # Returns the rects drawn over the background, for the dirty-rect path
+        # Screen shake offsets the world layers only; the HUD stays put
+        offset_x, offset_y = shake_offset = effect_manager.get_shake_offset()
         
-    def render_gameplay(self):
         # Get current theme background
         background = asset_manager.get_background(self.level_manager.theme.name.lower())
-        if background:
-            # Scrolling background
-            self.screen.blit(background, (0, self.background_scroll_y - SCREEN_HEIGHT))
-            self.screen.blit(background, (0, self.background_scroll_y))
+        if background and draw_background:
+            with frame_profiler.phase("background"):
+                # Scrolling background
+                self.screen.blit(background, (offset_x, self.background_scroll_y - SCREEN_HEIGHT + offset_y))
+                self.screen.blit(background, (offset_x, self.background_scroll_y + offset_y))
+                if shake_offset != (0, 0):
+                    self.clear_shake_edges(offset_x, offset_y)
+        
+        with frame_profiler.phase("sprites"):
+            rects = self.render_sprites(shake_offset)
+            
+        with frame_profiler.phase("hud"):
+            rects += self.render_hud()
+        return rects
         
-        # Draw all sprites
-        sprite_groups.draw_all(self.screen)
+    def render_sprites(self, shake_offset: tuple) -> List[pygame.Rect]:
+        # Draw all sprites, batched projectiles and particles between the last two steps
+        alpha = self.render_alpha
+        rects = sprite_groups.draw_all(self.screen, shake_offset, alpha)
+        rects += projectile_field.draw(self.screen, shake_offset, alpha)
+        rects += particle_emitter.draw(self.screen, shake_offset, alpha)
         
         # Draw custom sprite effects
         if self.player:
-            self.player.draw(self.screen)
-            
+            player_rect = sprite_groups.get_interpolated_rect(self.player, shake_offset, alpha)
+            player_offset = (player_rect.x - self.player.rect.x, player_rect.y - self.player.rect.y)
+            rects += self.player.draw(self.screen, player_offset)
+        return rects
+        
+    def render_hud(self) -> List[pygame.Rect]:
+        rects = []
+        
         # Draw UI elements
         if self.player:
-            self.ui_manager.draw_hud(self.screen, self.player, 
-                                   self.level_manager.current_level, 
-                                   self.game_state.score)
+            rects += self.ui_manager.draw_hud(self.screen, self.player, 
+                                            self.level_manager.current_level, 
+                                            self.game_state.score)
             
         # Draw boss UI if active
         if self.level_manager.is_boss_active():
             bosses = sprite_groups.get_group("bosses")
             if bosses:
                 boss = list(bosses)[0]
-                self.ui_manager.draw_boss_hud(self.screen, boss)
+                rects += self.ui_manager.draw_boss_hud(self.screen, boss)
                 
         # Draw level progress
         progress = self.level_manager.get_level_progress()
@@ -399,16 +641,31 @@ class GameEngine:
             pygame.draw.rect(self.screen, GREEN, (bar_x, bar_y, fill_width, bar_height))
             
             # Border
-            pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+            rects.append(pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2))
             
             # Label
-            self.ui_manager.draw_text(self.screen, f"Progress: {int(progress * 100)}%", 
-                                    "small", bar_x + bar_width // 2, bar_y - 15, WHITE)
+            rects.append(self.ui_manager.draw_text(self.screen, f"Progress: {int(progress * 100)}%", 
+                                                 "small", bar_x + bar_width // 2, bar_y - 15, WHITE))
                                     
         # Draw FPS counter if enabled
         if self.game_state.get_setting("show_fps"):
-            self.ui_manager.draw_fps_counter(self.screen, self.clock)
+            rects.append(self.ui_manager.draw_fps_counter(self.screen, self.clock))
+            
+        return rects
             
+    def clear_shake_edges(self, offset_x: int, offset_y: int):
+        # Blank the strips the shifted background no longer covers
+        if offset_x > 0:
+            self.screen.fill(BLACK, (0, 0, offset_x, SCREEN_HEIGHT))
+        elif offset_x < 0:
+            self.screen.fill(BLACK, (SCREEN_WIDTH + offset_x, 0, -offset_x, SCREEN_HEIGHT))
+        top = self.background_scroll_y - SCREEN_HEIGHT + offset_y
+        if top > 0:
+            self.screen.fill(BLACK, (0, 0, SCREEN_WIDTH, top))
+        bottom = self.background_scroll_y + SCREEN_HEIGHT + offset_y
+        if bottom < SCREEN_HEIGHT:
+            self.screen.fill(BLACK, (0, bottom, SCREEN_WIDTH, SCREEN_HEIGHT - bottom))
+        
     def render_menu(self):
         options = self.get_menu_options()
         self.ui_manager.draw_menu(self.screen, "SHOOTAR", options, 
@@ -419,6 +676,9 @@ class GameEngine:
                                 "medium", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150, GOLD)
         self.ui_manager.draw_text(self.screen, f"Level: {self.game_state.stats['highest_level']}", 
                                 "medium", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120, WHITE)
+        if not asset_manager.loaded:
+            self.ui_manager.draw_text(self.screen, f"Loading assets {asset_manager.get_load_progress():.0%}",
+                                    "small", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 85, GREY)
                                 
     def render_game_over(self):
         high_scores = self.game_state.get_high_scores()
@@ -482,18 +742,32 @@ class GameEngine:
             "Music": "ON" if self.game_state.settings['music_enabled'] else "OFF",
             "SFX": "ON" if self.game_state.settings['sfx_enabled'] else "OFF",
             "Show FPS": "ON" if self.game_state.settings['show_fps'] else "OFF",
+            "NumPy Collisions": "ON" if self.game_state.settings['numpy_collisions'] else "OFF",
+            "Dirty Rects": "ON" if self.game_state.settings['dirty_rects'] else "OFF",
             "Difficulty": self.game_state.settings['difficulty'].upper()
         }
         
         self.ui_manager.draw_settings_screen(self.screen, settings)
         
+    def show_achievement(self, achievement_id: str):
+        achievement = self.game_state.achievements.get(achievement_id)
+        if achievement:
+            self.ui_manager.add_achievement_notification(achievement["name"], achievement["description"])
+            
     def render_achievements(self):
         achievements = list(self.game_state.achievements.values())
         self.ui_manager.draw_achievements_screen(self.screen, achievements)
         
     def cleanup(self):
-        # Save game data
+        # Finish any replay being recorded and flush profiler output
+        input_manager.stop_recording()
+        frame_profiler.stop_csv()
+        frame_profiler.stop_trace()
+        
+        # Save game data and wait for the writer to finish
         self.game_state.save_all_data()
+        save_writer.stop()
+        score_store.close()
         
         # Cleanup sound
         sound_manager.cleanup()
@@ -506,7 +780,7 @@ class GameEngine:
         return int(self.clock.get_fps())
         
     def get_game_time(self) -> float:
-        return pygame.time.get_ticks() / 1000.0
+        return game_clock.get_ticks() / 1000.0
         
     def toggle_fullscreen(self):
         if self.game_state.settings['fullscreen']:
@@ -541,8 +815,15 @@ class GameEngine:
                 "bullets": sprite_groups.get_sprite_count("bullets"),
                 "enemy_bullets": sprite_groups.get_sprite_count("enemy_bullets"),
                 "powerups": sprite_groups.get_sprite_count("powerups"),
-                "effects": sprite_groups.get_sprite_count("effects")
+                "effects": sprite_groups.get_sprite_count("effects"),
+                "field_bullets": projectile_field.get_count("player"),
+                "field_enemy_bullets": projectile_field.get_count("enemy"),
+                "field_particles": particle_emitter.get_count()
             },
+            "pools": sprite_pools.get_stats(),
+            "saves": save_writer.get_stats(),
+            "voices": voice_manager.get_stats(),
+            "frame_phases_ms": frame_profiler.get_averages(),
             "level_progress": self.level_manager.get_level_progress(),
             "boss_active": self.level_manager.is_boss_active(),
             "paused": self.game_state.paused
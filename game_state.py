@@ -1,18 +1,25 @@
-import pygame
 import json
 import os
 from typing import Dict, Any, Optional, List
 from config import *
+from session import game_clock
 from utils import save_json, load_json
+from save_writer import save_writer
+from score_store import score_store
+from achievement_engine import AchievementEngine
 
 class GameStateManager:
-    def __init__(self):
+    def __init__(self, persist: bool = True):
+        # Without persistence the session starts from defaults and nothing reaches the disk
+        self.persist = persist
         self.state = GameState.MENU
         self.previous_state = None
         self.paused = False
         self.game_over = False
         self.score = 0
         self.high_score = 0
+        self.score_recorded = False
+        self.ship_type = "FIGHTER"
         self.lives = PLAYER_LIVES
         self.level = 1
         self.time_played = 0
@@ -44,6 +51,9 @@ class GameStateManager:
             "fullscreen": False,
             "show_fps": False,
             "difficulty": "normal",
+            "numpy_collisions": NUMPY_NARROW_PHASE,
+            "projectile_field": PROJECTILE_FIELD_ENABLED,
+            "dirty_rects": DIRTY_RECT_RENDERING,
             "controls": CONTROLS.copy()
         }
         
@@ -66,6 +76,10 @@ class GameStateManager:
             "sharpshooter": {"unlocked": False, "name": "Sharpshooter", "description": "Achieve 90% accuracy in a level"}
         }
         
+        # Rules unlocking the achievements above as counters change
+        self.achievement_engine = AchievementEngine()
+        self.achievement_engine.add_listener(self.unlock_achievement)
+        
         # Session data
         self.session_data = {
             "level_start_time": 0,
@@ -79,6 +93,10 @@ class GameStateManager:
             "levels_completed_no_continues": 0
         }
         
+        # This run's totals and per-level results, recorded when it ends
+        self.run_stats = {"enemies_killed": 0, "bosses_defeated": 0}
+        self.level_results: List[Dict] = []
+        
         # Load saved data
         self.load_all_data()
         
@@ -94,15 +112,16 @@ class GameStateManager:
         self.state = GameState.PLAYING
         self.game_over = False
         self.score = 0
+        self.score_recorded = False
         self.lives = PLAYER_LIVES
         self.level = 1
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.time_played = 0
         self.paused = False
         
         # Reset session data
         self.session_data = {
-            "level_start_time": pygame.time.get_ticks(),
+            "level_start_time": game_clock.get_ticks(),
             "level_score": 0,
             "level_enemies_killed": 0,
             "level_damage_taken": 0,
@@ -112,6 +131,10 @@ class GameStateManager:
             "continues_this_session": 0,
             "levels_completed_no_continues": 0
         }
+        self.run_stats = {"enemies_killed": 0, "bosses_defeated": 0}
+        self.level_results = []
+        self.achievement_engine.reset_scope("run")
+        self.achievement_engine.reset_scope("level")
         
         self.stats["games_played"] += 1
         
@@ -120,16 +143,13 @@ class GameStateManager:
         self.state = GameState.GAME_OVER
         
         # Update statistics
-        self.time_played = (pygame.time.get_ticks() - self.start_time) / 1000
+        self.time_played = (game_clock.get_ticks() - self.start_time) / 1000
         self.stats["total_time_played"] += self.time_played
         self.stats["total_score"] += self.score
         
         # Update high score
         if self.score > self.high_score:
             self.high_score = self.score
-            
-        # Check achievements
-        self.check_achievements()
         
         # Save data
         self.save_all_data()
@@ -143,8 +163,11 @@ class GameStateManager:
             self.game_over = False
             
     def level_complete(self, level_score: int, level_data: Dict):
+        achievements = self.achievement_engine
         self.score += level_score
         self.level += 1
+        achievements.set("score", self.score)
+        achievements.set("level", self.level)
         
         # Update level statistics
         self.stats["levels_completed"] += 1
@@ -155,65 +178,58 @@ class GameStateManager:
         self.session_data["level_enemies_killed"] += level_data.get("enemies_killed", 0)
         self.session_data["level_damage_taken"] += level_data.get("damage_taken", 0)
         self.session_data["level_powerups_collected"] += level_data.get("powerups_collected", 0)
-        
-        # Check for perfect level
+        self.level_results.append({
+            "level": level_data.get("level", self.level - 1),
+            "score": level_data.get("score", level_score),
+            "enemies_killed": level_data.get("enemies_killed", 0),
+            "damage_taken": level_data.get("damage_taken", 0),
+            "powerups_collected": level_data.get("powerups_collected", 0),
+            "duration": level_data.get("duration", 0),
+            "perfect": level_data.get("perfect_level", False)
+        })
+        
+        # Perfect levels
         if level_data.get("damage_taken", 0) == 0:
             self.stats["perfect_levels"] += 1
-            self.unlock_achievement("perfect_level")
+            achievements.add("perfect_levels")
             
-        # Check for no continues achievement
+        # Levels completed without using a continue
         if self.session_data["continues_this_session"] == 0:
             self.session_data["levels_completed_no_continues"] += 1
-            if self.session_data["levels_completed_no_continues"] >= 5:
-                self.unlock_achievement("no_continues")
+            achievements.add("levels_without_continues")
                 
-        # Check for speed demon achievement
-        level_duration = level_data.get("duration", 0)
-        if level_duration < 60:
-            self.unlock_achievement("speed_demon")
-            
-        # Check for sharpshooter achievement
-        if (self.session_data["level_shots_fired"] > 0 and 
-            self.session_data["level_shots_hit"] / self.session_data["level_shots_fired"] >= 0.9):
-            self.unlock_achievement("sharpshooter")
+        # Per-level results
+        achievements.set("level_duration", level_data.get("duration", 0))
+        if self.session_data["level_shots_fired"] > 0:
+            achievements.set("level_accuracy", self.get_level_accuracy())
             
         # Reset level session data
-        self.session_data["level_start_time"] = pygame.time.get_ticks()
+        self.session_data["level_start_time"] = game_clock.get_ticks()
         self.session_data["level_shots_fired"] = 0
         self.session_data["level_shots_hit"] = 0
-        
-        # Check other achievements
-        self.check_achievements()
+        achievements.reset_scope("level")
         
     def enemy_killed(self, enemy_score: int):
         self.score += enemy_score
         self.stats["enemies_killed"] += 1
+        self.run_stats["enemies_killed"] += 1
         self.session_data["level_enemies_killed"] += 1
-        
-        # Check achievements
-        if self.stats["enemies_killed"] == 1:
-            self.unlock_achievement("first_kill")
-        elif self.stats["enemies_killed"] >= 1000:
-            self.unlock_achievement("kill_1000_enemies")
+        self.achievement_engine.add("enemies_killed")
+        self.achievement_engine.set("score", self.score)
             
     def boss_defeated(self, boss_score: int):
         self.score += boss_score
         self.stats["bosses_defeated"] += 1
-        
-        # Check achievements
-        if self.stats["bosses_defeated"] == 1:
-            self.unlock_achievement("first_boss")
-        elif self.stats["bosses_defeated"] >= 10:
-            self.unlock_achievement("defeat_10_bosses")
+        self.run_stats["bosses_defeated"] += 1
+        self.achievement_engine.add("bosses_defeated")
+        self.achievement_engine.set("score", self.score)
             
     def powerup_collected(self, powerup_score: int = 0):
         self.score += powerup_score
         self.stats["powerups_collected"] += 1
         self.session_data["level_powerups_collected"] += 1
-        
-        # Check achievements
-        if self.stats["powerups_collected"] >= 100:
-            self.unlock_achievement("collect_100_powerups")
+        self.achievement_engine.add("powerups_collected")
+        self.achievement_engine.set("score", self.score)
             
     def shot_fired(self):
         self.stats["total_shots_fired"] += 1
@@ -238,27 +254,9 @@ class GameStateManager:
     def update(self):
         if self.state == GameState.PLAYING and not self.paused:
             # Update time played
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             self.time_played = (current_time - self.start_time) / 1000
-            
-            # Check time-based achievements
-            if self.time_played >= 300:  # 5 minutes
-                self.unlock_achievement("survive_5_minutes")
-                
-    def check_achievements(self):
-        # Score-based achievements
-        if self.score >= 10000:
-            self.unlock_achievement("score_10k")
-        if self.score >= 50000:
-            self.unlock_achievement("score_50k")
-        if self.score >= 100000:
-            self.unlock_achievement("score_100k")
-            
-        # Level-based achievements
-        if self.level >= 5:
-            self.unlock_achievement("level_5")
-        if self.level >= 10:
-            self.unlock_achievement("level_10")
+            self.achievement_engine.set("time_played", self.time_played)
             
     def unlock_achievement(self, achievement_id: str):
         if achievement_id in self.achievements and not self.achievements[achievement_id]["unlocked"]:
@@ -337,75 +335,87 @@ class GameStateManager:
     def reset_achievements(self):
         for achievement in self.achievements.values():
             achievement["unlocked"] = False
+        self.arm_achievements()
+        
+    def arm_achievements(self):
+        unlocked = [achievement_id for achievement_id, achievement in self.achievements.items()
+                    if achievement["unlocked"]]
+        self.achievement_engine.arm(unlocked, self.stats)
             
-    def save_all_data(self):
+    def save_all_data(self, record_score: bool = True):
+        # Only files whose contents changed are queued, and they are written off the main thread
         self.save_statistics()
         self.save_settings()
         self.save_achievements()
-        self.save_high_score()
+        self.save_high_score(record_score)
         
     def load_all_data(self):
+        if not self.persist:
+            # Scores and stats still work within the session, in a throwaway database
+            score_store.open(":memory:", migrate=False)
+            self.arm_achievements()
+            return
+            
+        # Opening the store migrates the old JSON scores and stats the first time
+        score_store.open()
         self.load_statistics()
         self.load_settings()
         self.load_achievements()
         self.load_high_score()
+        self.arm_achievements()
         
     def save_statistics(self):
-        save_json(self.stats, SAVE_PATHS["progress"])
+        score_store.save_lifetime_stats(self.stats)
         
     def load_statistics(self):
-        data = load_json(SAVE_PATHS["progress"])
-        if data:
-            self.stats.update(data)
+        self.stats.update(score_store.get_lifetime_stats())
             
     def save_settings(self):
-        save_json(self.settings, SAVE_PATHS["settings"])
+        if not self.persist:
+            return
+        save_writer.submit(SAVE_PATHS["settings"], self.settings)
         
     def load_settings(self):
         data = load_json(SAVE_PATHS["settings"])
         if data:
             self.settings.update(data)
+            save_writer.mark_saved(SAVE_PATHS["settings"], data)
             
     def save_achievements(self):
-        save_json(self.achievements, SAVE_PATHS["achievements"])
+        if not self.persist:
+            return
+        save_writer.submit(SAVE_PATHS["achievements"], self.achievements)
         
     def load_achievements(self):
         data = load_json(SAVE_PATHS["achievements"])
         if data:
             self.achievements.update(data)
+            save_writer.mark_saved(SAVE_PATHS["achievements"], data)
             
-    def save_high_score(self):
-        try:
-            data = load_json(SAVE_PATHS["highscores"]) or []
-            
-            # Add current score if it's high enough
-            if self.score > 0:
-                data.append(self.score)
-                
-            # Sort and keep top 10
-            data.sort(reverse=True)
-            data = data[:10]
-            
-            save_json(data, SAVE_PATHS["highscores"])
-            
-            # Update high score
-            if data:
-                self.high_score = data[0]
-                
-        except Exception as e:
-            print(f"Error saving high score: {e}")
+    def save_high_score(self, record_score: bool = True):
+        # Each game is recorded as a run once; autosaves leave the leaderboard alone
+        if record_score and self.score > 0 and not self.score_recorded:
+            score_store.record_run(self.get_run_summary(), self.level_results)
+            self.score_recorded = True
+        self.load_high_score()
             
     def load_high_score(self):
-        try:
-            data = load_json(SAVE_PATHS["highscores"])
-            if data and len(data) > 0:
-                self.high_score = data[0]
-        except Exception as e:
-            print(f"Error loading high score: {e}")
+        high_scores = score_store.get_high_scores()
+        if high_scores:
+            self.high_score = high_scores[0]
             
-    def get_high_scores(self) -> List[int]:
-        data = load_json(SAVE_PATHS["highscores"])
-        return data if data else []
+    def get_high_scores(self, ship_type: Optional[str] = None) -> List[int]:
+        return score_store.get_high_scores(ship_type)
+        
+    def get_run_summary(self) -> Dict:
+        return {
+            "score": self.score,
+            "ship_type": self.ship_type,
+            "level_reached": self.level,
+            "enemies_killed": self.run_stats["enemies_killed"],
+            "bosses_defeated": self.run_stats["bosses_defeated"],
+            "duration": self.time_played
+        }
         
     def is_new_high_score(self) -> bool:
         return self.score > self.high_score
@@ -452,8 +462,9 @@ class GameStateManager:
                 if "achievements" in data:
                     self.achievements.update(data["achievements"])
                 if "high_scores" in data:
-                    save_json(data["high_scores"], SAVE_PATHS["highscores"])
-                    self.load_high_score()
+                    for score in data["high_scores"]:
+                        score_store.record_run({"score": score})
+                self.arm_achievements()
                     
                 self.save_all_data()
                 return True
@@ -0,0 +1,135 @@
+import pygame
+import gzip
+import json
+from typing import Dict, List, Optional, Tuple
+from config import CONTROLS
+
+REPLAY_VERSION = 1
+
+class KeySnapshot:
+    """Pressed keys for one simulation step, indexable like pygame.key.get_pressed()"""
+
+    def __init__(self, pressed: frozenset = frozenset()):
+        self.pressed = pressed
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+class InputManager:
+    """Hands each simulation step its keyboard state and key events.
+
+    Live steps can be recorded to a compact replay file: held keys become a
+    run-length encoded bitmask per step, key presses a sparse event list.
+    During playback the recorded steps replace the keyboard entirely.
+    """
+
+    def __init__(self):
+        self.tracked_keys: List[int] = sorted(set(CONTROLS.values()) | {pygame.K_UP, pygame.K_DOWN, pygame.K_RETURN})
+        self.keys = KeySnapshot()
+        self.pending_events: List[Tuple[bool, int]] = []
+        self.step = 0
+
+        self.recording: Optional[Dict] = None
+        self.playback: Optional[Dict] = None
+
+    def queue_key_event(self, pressed: bool, key: int):
+        # The keyboard is ignored while a replay is driving the game
+        if self.playback is None:
+            self.pending_events.append((pressed, key))
+
+    def begin_step(self) -> List[Tuple[bool, int]]:
+        """Move to the next simulation step and return its (pressed, key) events"""
+        if self.playback is not None:
+            return self.next_playback_step()
+
+        live_keys = pygame.key.get_pressed()
+        self.keys = KeySnapshot(frozenset(key for key in self.tracked_keys if live_keys[key]))
+        events, self.pending_events = self.pending_events, []
+
+        if self.recording is not None:
+            self.record_step(events)
+        self.step += 1
+        return events
+
+    def get_pressed(self) -> KeySnapshot:
+        return self.keys
+
+    def get_mask(self, pressed: frozenset) -> int:
+        return sum(1 << index for index, key in enumerate(self.tracked_keys) if key in pressed)
+
+    def start_recording(self, path: str, seed: int, step_ms: float):
+        self.step = 0
+        self.pending_events = []
+        self.recording = {
+            "version": REPLAY_VERSION,
+            "path": path,
+            "seed": seed,
+            "step_ms": step_ms,
+            "keys": self.tracked_keys,
+            "masks": [],  # [mask, repeat count] runs
+            "events": []  # [step, pressed, key]
+        }
+
+    def record_step(self, events: List[Tuple[bool, int]]):
+        masks = self.recording["masks"]
+        mask = self.get_mask(self.keys.pressed)
+        if masks and masks[-1][0] == mask:
+            masks[-1][1] += 1
+        else:
+            masks.append([mask, 1])
+
+        for pressed, key in events:
+            self.recording["events"].append([self.step, int(pressed), key])
+
+    def stop_recording(self) -> Optional[str]:
+        if self.recording is None:
+            return None
+
+        recording, self.recording = self.recording, None
+        path = recording.pop("path")
+        recording["steps"] = self.step
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(recording, f, separators=(",", ":"))
+        return path
+
+    def load_replay(self, path: str) -> Dict:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            replay = json.load(f)
+        if replay.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {replay.get('version')}")
+        return replay
+
+    def start_playback(self, replay: Dict):
+        keys = replay["keys"]
+        step_keys = []
+        for mask, count in replay["masks"]:
+            pressed = KeySnapshot(frozenset(key for index, key in enumerate(keys) if mask & (1 << index)))
+            step_keys.extend([pressed] * count)
+
+        step_events: Dict[int, List[Tuple[bool, int]]] = {}
+        for step, pressed, key in replay["events"]:
+            step_events.setdefault(step, []).append((bool(pressed), key))
+
+        self.step = 0
+        self.pending_events = []
+        self.playback = {"keys": step_keys, "events": step_events, "steps": replay["steps"]}
+
+    def next_playback_step(self) -> List[Tuple[bool, int]]:
+        if self.is_playback_finished():
+            self.keys = KeySnapshot()
+            return []
+
+        self.keys = self.playback["keys"][self.step]
+        events = self.playback["events"].get(self.step, [])
+        self.step += 1
+        return events
+
+    def is_playback_finished(self) -> bool:
+        return self.playback is not None and self.step >= self.playback["steps"]
+
+    def stop_playback(self):
+        self.playback = None
+        self.keys = KeySnapshot()
+
+# Global input manager instance
+input_manager = InputManager()
@@ -1,9 +1,10 @@
-import pygame
-import random
 from typing import Dict, List, Optional, Tuple
 from config import *
+from session import session_random, game_clock
 from enemies import Enemy, Boss
 from sprite_groups import sprite_groups
+from projectile_field import projectile_field
+from trace_recorder import trace_recorder
 from utils import weighted_choice, Timer, calculate_level_multiplier, calculate_spawn_rate
 
 class LevelManager:
@@ -63,7 +64,7 @@ class LevelManager:
         
         # Initialize level stats
         self.level_stats = {
-            "start_time": pygame.time.get_ticks(),
+            "start_time": game_clock.get_ticks(),
             "enemies_killed": 0,
             "damage_taken": 0,
             "powerups_collected": 0,
@@ -74,7 +75,9 @@ class LevelManager:
         sprite_groups.clear_group("enemies")
         sprite_groups.clear_group("bosses")
         sprite_groups.clear_group("enemy_bullets")
+        projectile_field.clear("enemy")
         
+        trace_recorder.instant("level_start", {"level": level_number, "theme": self.theme.name})
         print(f"Level {level_number} started - Theme: {self.theme.name}")
         
     def get_level_theme(self, level_number: int) -> LevelTheme:
@@ -99,7 +102,7 @@ class LevelManager:
         self.check_level_completion()
         
     def update_enemy_spawning(self, player):
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         
         # Calculate spawn rate based on level
         base_spawn_rate = calculate_spawn_rate(ENEMY_SPAWN_RATE, self.current_level)
@@ -181,6 +184,7 @@ class LevelManager:
         # Clear remaining enemies
         sprite_groups.clear_group("enemies")
         
+        trace_recorder.instant("boss_spawn", {"level": self.current_level, "boss_type": boss_type})
         print(f"Boss spawned for level {self.current_level}")
         
     def update_boss_fight(self):
@@ -294,7 +298,7 @@ class LevelManager:
             
     def reset_level_stats(self):
         self.level_stats = {
-            "start_time": pygame.time.get_ticks(),
+            "start_time": game_clock.get_ticks(),
             "enemies_killed": 0,
             "damage_taken": 0,
             "powerups_collected": 0,
@@ -318,10 +322,10 @@ class LevelManager:
         # Increase powerup spawn chance in later levels
         base_chance = POWERUP_CHANCE
         level_bonus = (self.current_level - 1) * 0.02
-        return random.random() < (base_chance + level_bonus)
+        return session_random.random() < (base_chance + level_bonus)
         
     def get_level_summary(self) -> Dict:
-        duration = (pygame.time.get_ticks() - self.level_stats["start_time"]) / 1000
+        duration = (game_clock.get_ticks() - self.level_stats["start_time"]) / 1000
         return {
             "level": self.current_level,
             "theme": self.theme.name,
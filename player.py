@@ -1,6 +1,10 @@
 import pygame
 import math
 from config import *
+from session import game_clock
+from input_manager import input_manager
+from asset_manager import asset_manager
+from sound_manager import sound_manager
 from projectiles import Bullet
 
 class Player(pygame.sprite.Sprite):
@@ -9,10 +13,10 @@ class Player(pygame.sprite.Sprite):
         self.ship_type = ship_type
         self.ship_stats = ship_type.value
         
-        # Load and scale player image
-        self.image = pygame.image.load(ASSET_PATHS["player"]).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (50, 40))
+        # Scaled player image, shared across respawns
+        self.image = asset_manager.get_scaled_image("player", (50, 40))
         self.rect = self.image.get_rect()
+        self.mask = asset_manager.get_mask("player", self.image)
         self.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
         
         # Movement attributes
@@ -67,7 +71,7 @@ class Player(pygame.sprite.Sprite):
         self.constrain_to_screen()
         
     def handle_input(self):
-        keys = pygame.key.get_pressed()
+        keys = input_manager.get_pressed()
         
         # Movement input
         if keys[CONTROLS["move_left"]]:
@@ -85,9 +89,9 @@ class Player(pygame.sprite.Sprite):
             
     def update_movement(self):
         # Apply friction when not moving
-        if not pygame.key.get_pressed()[CONTROLS["move_left"]] and not pygame.key.get_pressed()[CONTROLS["move_right"]]:
+        if not input_manager.get_pressed()[CONTROLS["move_left"]] and not input_manager.get_pressed()[CONTROLS["move_right"]]:
             self.speed_x *= (1 - self.friction)
-        if not pygame.key.get_pressed()[CONTROLS["move_up"]] and not pygame.key.get_pressed()[CONTROLS["move_down"]]:
+        if not input_manager.get_pressed()[CONTROLS["move_up"]] and not input_manager.get_pressed()[CONTROLS["move_down"]]:
             self.speed_y *= (1 - self.friction)
             
         # Limit speed
@@ -113,44 +117,41 @@ class Player(pygame.sprite.Sprite):
             self.speed_y = 0
             
     def try_shoot(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_shot > self.fire_rate:
-            self.shoot()
+            # These bullets are never added to the game; hand them back to the pool
+            for bullet in self.shoot():
+                bullet.kill()
             self.last_shot = now
             
     def shoot(self):
         bullets = []
         
         if self.weapon_type == WeaponType.BASIC:
-            bullet = Bullet(self.rect.centerx, self.rect.top, damage=self.bullet_damage)
+            bullet = Bullet.acquire(self.rect.centerx, self.rect.top, damage=self.bullet_damage)
             bullets.append(bullet)
             
         elif self.weapon_type == WeaponType.DOUBLE:
-            bullet1 = Bullet(self.rect.left + 10, self.rect.top, damage=self.bullet_damage)
-            bullet2 = Bullet(self.rect.right - 10, self.rect.top, damage=self.bullet_damage)
+            bullet1 = Bullet.acquire(self.rect.left + 10, self.rect.top, damage=self.bullet_damage)
+            bullet2 = Bullet.acquire(self.rect.right - 10, self.rect.top, damage=self.bullet_damage)
             bullets.extend([bullet1, bullet2])
             
         elif self.weapon_type == WeaponType.TRIPLE:
-            bullet1 = Bullet(self.rect.centerx, self.rect.top, damage=self.bullet_damage)
-            bullet2 = Bullet(self.rect.centerx - 15, self.rect.top + 5, damage=self.bullet_damage)
+            bullet1 = Bullet.acquire(self.rect.centerx, self.rect.top, damage=self.bullet_damage)
+            bullet2 = Bullet.acquire(self.rect.centerx - 15, self.rect.top + 5, damage=self.bullet_damage)
             bullet2.speed_x = -1
-            bullet3 = Bullet(self.rect.centerx + 15, self.rect.top + 5, damage=self.bullet_damage)
+            bullet3 = Bullet.acquire(self.rect.centerx + 15, self.rect.top + 5, damage=self.bullet_damage)
             bullet3.speed_x = 1
             bullets.extend([bullet1, bullet2, bullet3])
             
         elif self.weapon_type == WeaponType.SPREAD:
             for i in range(-2, 3):
-                bullet = Bullet(self.rect.centerx + i * 10, self.rect.top, damage=self.bullet_damage)
+                bullet = Bullet.acquire(self.rect.centerx + i * 10, self.rect.top, damage=self.bullet_damage)
                 bullet.speed_x = i * 0.5
                 bullets.append(bullet)
                 
         # Play shoot sound
-        try:
-            shoot_sound = pygame.mixer.Sound(ASSET_PATHS["shoot"])
-            shoot_sound.set_volume(SFX_VOLUME)
-            shoot_sound.play()
-        except:
-            pass
+        sound_manager.play_shoot_sound(self.weapon_type.name.lower())
             
         return bullets
         
@@ -160,17 +161,12 @@ class Player(pygame.sprite.Sprite):
             
         self.health -= amount
         self.protected = True
-        self.protected_timer = pygame.time.get_ticks()
+        self.protected_timer = game_clock.get_ticks()
         self.hit_flash = True
-        self.hit_flash_timer = pygame.time.get_ticks()
+        self.hit_flash_timer = game_clock.get_ticks()
         
         # Play hit sound
-        try:
-            hit_sound = pygame.mixer.Sound(ASSET_PATHS["explosion"])
-            hit_sound.set_volume(SFX_VOLUME * 0.5)
-            hit_sound.play()
-        except:
-            pass
+        sound_manager.play_sound("explosion", volume=0.5, channel="player")
             
         if self.health <= 0:
             self.lives -= 1
@@ -189,26 +185,26 @@ class Player(pygame.sprite.Sprite):
     def upgrade_weapon(self, weapon_type, duration=None):
         self.weapon_type = weapon_type
         if duration:
-            self.weapon_timer = pygame.time.get_ticks()
+            self.weapon_timer = game_clock.get_ticks()
             self.powerup_timers["weapon"] = duration
             
     def activate_shield(self, duration):
         self.shield = True
-        self.shield_timer = pygame.time.get_ticks()
+        self.shield_timer = game_clock.get_ticks()
         self.powerup_timers["shield"] = duration
         
     def speed_boost(self, multiplier, duration):
         self.max_speed *= multiplier
         self.powerup_timers["speed"] = duration
-        self.active_powerups["speed"] = {"multiplier": multiplier, "start_time": pygame.time.get_ticks()}
+        self.active_powerups["speed"] = {"multiplier": multiplier, "start_time": game_clock.get_ticks()}
         
     def rapid_fire(self, duration):
         self.fire_rate = max(self.fire_rate // 2, 100)
         self.powerup_timers["rapid_fire"] = duration
-        self.active_powerups["rapid_fire"] = {"original_rate": self.fire_rate * 2, "start_time": pygame.time.get_ticks()}
+        self.active_powerups["rapid_fire"] = {"original_rate": self.fire_rate * 2, "start_time": game_clock.get_ticks()}
         
     def update_powerups(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         # Update protection
         if self.protected and now - self.protected_timer > self.protection_duration:
@@ -241,7 +237,7 @@ class Player(pygame.sprite.Sprite):
                 del self.active_powerups["rapid_fire"]
                 
     def update_visual_effects(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         
         # Update hit flash
         if self.hit_flash and now - self.hit_flash_timer > 100:
@@ -251,7 +247,7 @@ class Player(pygame.sprite.Sprite):
         # Add new engine particles
         if len(self.engine_particles) < PARTICLE_SETTINGS["engine_trail"]["count"]:
             particle = {
-                "x": self.rect.centerx + ((-5 + pygame.time.get_ticks() % 10) if self.speed_x == 0 else 0),
+                "x": self.rect.centerx + ((-5 + game_clock.get_ticks() % 10) if self.speed_x == 0 else 0),
                 "y": self.rect.bottom,
                 "speed_x": self.speed_x * -0.1,
                 "speed_y": PARTICLE_SETTINGS["engine_trail"]["speed"],
@@ -270,13 +266,15 @@ class Player(pygame.sprite.Sprite):
             if particle["age"] >= particle["lifetime"]:
                 self.engine_particles.remove(particle)
                 
-    def draw_shield(self, screen):
+    def draw_shield(self, screen, offset=(0, 0)):
         if self.shield:
             shield_surface = pygame.Surface((80, 80), pygame.SRCALPHA)
             pygame.draw.circle(shield_surface, (*BLUE[:3], 100), (40, 40), 40)
-            screen.blit(shield_surface, (self.rect.centerx - 40, self.rect.centery - 40))
+            return screen.blit(shield_surface, (self.rect.centerx - 40 + offset[0], self.rect.centery - 40 + offset[1]))
+        return None
             
-    def draw_engine_trail(self, screen):
+    def draw_engine_trail(self, screen, offset=(0, 0)):
+        rects = []
         for particle in self.engine_particles:
             alpha = int(255 * (1 - particle["age"] / particle["lifetime"]))
             color = (*particle["color"][:3], alpha)
@@ -284,23 +282,28 @@ class Player(pygame.sprite.Sprite):
             
             particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
             pygame.draw.circle(particle_surface, color, (size, size), size)
-            screen.blit(particle_surface, (particle["x"] - size, particle["y"] - size))
+            rects.append(screen.blit(particle_surface, (particle["x"] - size + offset[0], particle["y"] - size + offset[1])))
+        return rects
             
-    def draw(self, screen):
+    def draw(self, screen, offset=(0, 0)):
+        # Returns the rects drawn, for the dirty-rect renderer
         # Draw engine trail
-        self.draw_engine_trail(screen)
+        rects = self.draw_engine_trail(screen, offset)
         
         # Draw shield
-        self.draw_shield(screen)
+        shield_rect = self.draw_shield(screen, offset)
+        if shield_rect:
+            rects.append(shield_rect)
         
         # Draw player with hit flash effect
         if self.hit_flash:
             # Create a white flash effect
             flash_surface = self.image.copy()
             flash_surface.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
-            screen.blit(flash_surface, self.rect)
+            rects.append(screen.blit(flash_surface, self.rect.move(offset)))
         else:
-            screen.blit(self.image, self.rect)
+            rects.append(screen.blit(self.image, self.rect.move(offset)))
+        return rects
             
     def get_stats(self):
         return {
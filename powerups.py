@@ -1,8 +1,8 @@
 import pygame
-import random
 import math
 from typing import Optional
 from config import *
+from session import session_random, game_clock
 from asset_manager import asset_manager
 
 class PowerUp(pygame.sprite.Sprite):
@@ -11,7 +11,7 @@ class PowerUp(pygame.sprite.Sprite):
         self.type = powerup_type
         self.speed_y = 3
         self.lifetime = 10000  # 10 seconds
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = game_clock.get_ticks()
         
         # Load appropriate image
         image_name = f"powerup_{powerup_type.value}"
@@ -25,12 +25,12 @@ class PowerUp(pygame.sprite.Sprite):
         
         # Set position
         if x is None:
-            self.rect.x = random.randrange(0, SCREEN_WIDTH - self.rect.width)
+            self.rect.x = session_random.randrange(0, SCREEN_WIDTH - self.rect.width)
         else:
             self.rect.x = x
             
         if y is None:
-            self.rect.y = random.randrange(-150, -40)
+            self.rect.y = session_random.randrange(-150, -40)
         else:
             self.rect.y = y
             
@@ -59,7 +59,7 @@ class PowerUp(pygame.sprite.Sprite):
             self.glow_direction = 1
             
         # Check lifetime
-        if pygame.time.get_ticks() - self.spawn_time > self.lifetime:
+        if game_clock.get_ticks() - self.spawn_time > self.lifetime:
             self.kill()
             
         # Remove if off screen
@@ -0,0 +1,291 @@
+import pygame
+import itertools
+from typing import Dict, List, Optional, Tuple
+from config import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ProjectileField:
+    """Struct-of-arrays store for simple straight-line projectiles.
+
+    Positions, velocities, damage, lifetime and owner live in contiguous
+    NumPy arrays so the whole field advances, culls and collides in a few
+    vectorized operations per frame instead of one Sprite.update() each.
+    """
+
+    OWNERS = {"player": 0, "enemy": 1}
+    TRAIL_STEPS = 3
+
+    def __init__(self, capacity: int = PROJECTILE_FIELD_CAPACITY):
+        self.enabled = PROJECTILE_FIELD_ENABLED and np is not None
+        self.count = 0
+
+        # Per-kind render/collision data, shared by every projectile of that kind
+        self.kind_lookup: Dict[Tuple[int, Optional[Tuple[int, int, int]]], int] = {}
+        self.kind_images: List[pygame.Surface] = []
+        self.kind_masks: List[Optional[pygame.mask.Mask]] = []
+        self.kind_trails: List[List[pygame.Surface]] = []
+        self.kind_sizes = None
+
+        if np is not None:
+            self.allocate(capacity)
+            self.kind_sizes = np.zeros((0, 2), dtype=np.int32)
+
+    def allocate(self, capacity: int):
+        self.capacity = capacity
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.damages = np.zeros(capacity, dtype=np.int32)
+        self.lifetimes = np.zeros(capacity, dtype=np.int32)
+        self.owners = np.zeros(capacity, dtype=np.int8)
+        self.kinds = np.zeros(capacity, dtype=np.int16)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def grow(self):
+        n = self.count
+        old = (self.positions, self.previous_positions, self.velocities, self.damages,
+               self.lifetimes, self.owners, self.kinds, self.alive)
+        self.allocate(self.capacity * 2)
+        new = (self.positions, self.previous_positions, self.velocities, self.damages,
+               self.lifetimes, self.owners, self.kinds, self.alive)
+        for old_array, new_array in zip(old, new):
+            new_array[:n] = old_array[:n]
+
+    def set_enabled(self, enabled: bool) -> bool:
+        if enabled and np is None:
+            print("Warning: NumPy not available - projectiles stay as sprites")
+            enabled = False
+        self.enabled = bool(enabled)
+        return self.enabled
+
+    def accepts(self, projectile) -> bool:
+        return self.enabled and getattr(projectile, "batchable", False)
+
+    def get_kind(self, image: pygame.Surface, mask: Optional[pygame.mask.Mask],
+                 trail_color: Optional[Tuple[int, int, int]]) -> int:
+        key = (id(image), trail_color)
+        kind = self.kind_lookup.get(key)
+        if kind is None:
+            kind = len(self.kind_images)
+            self.kind_lookup[key] = kind
+            self.kind_images.append(image)
+            self.kind_masks.append(mask)
+            self.kind_trails.append(self.create_trail_stamps(trail_color))
+            self.kind_sizes = np.vstack([self.kind_sizes, image.get_size()]).astype(np.int32)
+        return kind
+
+    def create_trail_stamps(self, color: Optional[Tuple[int, int, int]]) -> List[pygame.Surface]:
+        # Fading dots drawn behind each projectile in place of BulletTrail sprites
+        if color is None:
+            return []
+        stamps = []
+        for step in range(1, self.TRAIL_STEPS + 1):
+            alpha = int(255 * (1 - step / (self.TRAIL_STEPS + 1)))
+            stamp = pygame.Surface((4, 4), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (*color, alpha), (2, 2), 2)
+            stamps.append(stamp)
+        return stamps
+
+    def emit(self, x: float, y: float, velocity: Tuple[float, float], damage: int, lifetime: int,
+             owner: str, image: pygame.Surface, mask: Optional[pygame.mask.Mask] = None,
+             trail_color: Optional[Tuple[int, int, int]] = None):
+        if self.count == self.capacity:
+            self.grow()
+
+        i = self.count
+        self.positions[i] = (x, y)
+        self.previous_positions[i] = (x, y)
+        self.velocities[i] = velocity
+        self.damages[i] = damage
+        self.lifetimes[i] = lifetime
+        self.owners[i] = self.OWNERS[owner]
+        self.kinds[i] = self.get_kind(image, mask, trail_color)
+        self.alive[i] = True
+        self.count += 1
+
+    def add_projectile(self, projectile):
+        self.emit(
+            projectile.x, projectile.y,
+            (projectile.velocity_x, projectile.velocity_y),
+            projectile.damage, projectile.lifetime, projectile.owner,
+            projectile.image, getattr(projectile, "mask", None),
+            projectile.trail_color if projectile.create_trail else None
+        )
+
+    def get_rects(self, indices, positions=None) -> "np.ndarray":
+        """Return an N x 4 left/top/right/bottom array matching Projectile.rect"""
+        if positions is None:
+            positions = self.positions[indices]
+        sizes = self.kind_sizes[self.kinds[indices]]
+        rects = np.empty((len(indices), 4), dtype=np.int32)
+        rects[:, 0] = positions[:, 0].astype(np.int32) - sizes[:, 0] // 2
+        rects[:, 1] = positions[:, 1].astype(np.int32) - sizes[:, 1] // 2
+        rects[:, 2] = rects[:, 0] + sizes[:, 0]
+        rects[:, 3] = rects[:, 1] + sizes[:, 1]
+        return rects
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        self.previous_positions[:n] = self.positions[:n]
+        self.positions[:n] += self.velocities[:n]
+        self.lifetimes[:n] -= 1
+
+        rects = self.get_rects(np.arange(n))
+        onscreen = ((rects[:, 3] >= 0) & (rects[:, 1] <= SCREEN_HEIGHT) &
+                    (rects[:, 2] >= 0) & (rects[:, 0] <= SCREEN_WIDTH))
+        self.alive[:n] &= onscreen & (self.lifetimes[:n] > 0)
+        self.compact()
+
+    def compact(self):
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+
+        k = len(keep)
+        for array in (self.positions, self.previous_positions, self.velocities, self.damages,
+                      self.lifetimes, self.owners, self.kinds):
+            array[:k] = array[keep]
+        self.alive[:k] = True
+        self.alive[k:n] = False
+        self.count = k
+
+    def live_indices(self, owner: str) -> "np.ndarray":
+        n = self.count
+        return np.flatnonzero(self.alive[:n] & (self.owners[:n] == self.OWNERS[owner]))
+
+    def overlaps_mask(self, target, kind: int, left: int, top: int) -> bool:
+        target_mask = getattr(target, "mask", None)
+        kind_mask = self.kind_masks[kind]
+        if target_mask is None or kind_mask is None:
+            return True
+        return target_mask.overlap(kind_mask, (left - target.rect.x, top - target.rect.y)) is not None
+
+    def collide_group(self, owner: str, group: pygame.sprite.Group) -> Dict[pygame.sprite.Sprite, List[int]]:
+        """Kill owner's projectiles that hit group members; return {target: [damage, ...]}"""
+        if self.count == 0 or not group:
+            return {}
+
+        indices = self.live_indices(owner)
+        if len(indices) == 0:
+            return {}
+
+        targets = group.sprites()
+        target_rects = np.fromiter(
+            itertools.chain.from_iterable(target.rect for target in targets),
+            dtype=np.int32, count=len(targets) * 4
+        ).reshape(-1, 4)
+        target_rects[:, 2] += target_rects[:, 0]
+        target_rects[:, 3] += target_rects[:, 1]
+        rects = self.get_rects(indices)
+
+        overlap = (
+            (target_rects[:, None, 0] < rects[None, :, 2]) &
+            (target_rects[:, None, 2] > rects[None, :, 0]) &
+            (target_rects[:, None, 1] < rects[None, :, 3]) &
+            (target_rects[:, None, 3] > rects[None, :, 1])
+        )
+
+        hits = {}
+        killed = set()
+        # Pairs come out in group order, and like groupcollide a projectile is
+        # spent on the first target it hits, so later targets never see it
+        target_indices, projectile_indices = overlap.nonzero()
+        for target_index, projectile_index in zip(target_indices.tolist(), projectile_indices.tolist()):
+            i = int(indices[projectile_index])
+            if i in killed:
+                continue
+            target = targets[target_index]
+            left, top = rects[projectile_index, 0], rects[projectile_index, 1]
+            if self.overlaps_mask(target, self.kinds[i], left, top):
+                hits.setdefault(target, []).append(int(self.damages[i]))
+                killed.add(i)
+
+        self.alive[list(killed)] = False
+        return hits
+
+    def collide_sprite(self, owner: str, sprite: pygame.sprite.Sprite) -> List[int]:
+        """Kill owner's projectiles that hit sprite; return their damage values"""
+        if self.count == 0:
+            return []
+
+        indices = self.live_indices(owner)
+        if len(indices) == 0:
+            return []
+
+        rects = self.get_rects(indices)
+        rect = sprite.rect
+        overlap = ((rects[:, 0] < rect.right) & (rects[:, 2] > rect.left) &
+                   (rects[:, 1] < rect.bottom) & (rects[:, 3] > rect.top))
+
+        damages = []
+        for projectile_index in overlap.nonzero()[0].tolist():
+            i = indices[projectile_index]
+            if self.overlaps_mask(sprite, self.kinds[i], rects[projectile_index, 0], rects[projectile_index, 1]):
+                damages.append(int(self.damages[i]))
+                self.alive[i] = False
+        return damages
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             alpha: float = 1.0) -> List[pygame.Rect]:
+        n = self.count
+        if n == 0:
+            return []
+
+        indices = np.flatnonzero(self.alive[:n])
+        if len(indices) == 0:
+            return []
+
+        # Interpolate between the last two updates, alpha of the way to the current one
+        positions = self.positions[indices]
+        if alpha < 1.0:
+            previous = self.previous_positions[indices]
+            positions = previous + (positions - previous) * alpha
+        positions = positions + offset
+
+        kinds = self.kinds[indices].tolist()
+        rects = self.get_rects(indices, positions)
+        velocities = self.velocities[indices]
+        images = self.kind_images
+        trails = self.kind_trails
+
+        blit_sequence = []
+        for step in range(1, self.TRAIL_STEPS + 1):
+            trail_positions = (positions - velocities * (step * 0.5)).astype(np.int32) - 2
+            for kind, (x, y) in zip(kinds, trail_positions.tolist()):
+                if trails[kind]:
+                    blit_sequence.append((trails[kind][step - 1], (x, y)))
+        blit_sequence.extend(
+            (images[kind], (left, top))
+            for kind, left, top in zip(kinds, rects[:, 0].tolist(), rects[:, 1].tolist())
+        )
+
+        return surface.blits(blit_sequence)
+
+    def clear(self, owner: Optional[str] = None):
+        if owner is None:
+            self.count = 0
+            if np is not None:
+                self.alive[:] = False
+            return
+
+        n = self.count
+        self.alive[:n] &= self.owners[:n] != self.OWNERS[owner]
+        self.compact()
+
+    def get_count(self, owner: Optional[str] = None) -> int:
+        if self.count == 0:
+            return 0
+        if owner is None:
+            return int(np.count_nonzero(self.alive[:self.count]))
+        return len(self.live_indices(owner))
+
+# Global projectile field instance
+projectile_field = ProjectileField()
@@ -1,15 +1,20 @@
 import pygame
 import math
-import random
 from typing import Tuple, Optional, List
 from config import *
+from session import session_random, game_clock
 from asset_manager import asset_manager
 from sound_manager import sound_manager
 from effects import effect_manager
 from sprite_groups import sprite_groups
+from projectile_field import projectile_field
+from sprite_pools import PooledSprite, sprite_pools
 from utils import *
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile(PooledSprite):
+    # Straight-line, single-hit projectiles can live in the ProjectileField instead
+    batchable = False
+    
     def __init__(self, x: float, y: float, velocity: Tuple[float, float], 
                  damage: int = 1, owner: str = "player", projectile_type: str = "basic"):
         super().__init__()
@@ -30,19 +35,19 @@ class Projectile(pygame.sprite.Sprite):
         self.trail_color = YELLOW
         
     def setup_sprite(self):
-        if self.owner == "player":
-            self.image = asset_manager.get_image("bullet") or asset_manager.create_placeholder_image("bullet")
-        else:
-            self.image = asset_manager.get_image("enemy_bullet") or asset_manager.create_placeholder_image("enemy_bullet")
+        image_name = "bullet" if self.owner == "player" else "enemy_bullet"
+        self.image = asset_manager.get_image(image_name) or asset_manager.create_placeholder_image(image_name)
         
         self.rect = self.image.get_rect()
         self.rect.center = (int(self.x), int(self.y))
         
         # Scale based on projectile type
         if self.projectile_type == "laser":
-            self.image = pygame.transform.scale(self.image, (3, 15))
+            self.image = asset_manager.get_scaled_image(image_name, (3, 15))
         elif self.projectile_type == "heavy":
-            self.image = pygame.transform.scale(self.image, (8, 12))
+            self.image = asset_manager.get_scaled_image(image_name, (8, 12))
+        
+        self.mask = asset_manager.get_mask(image_name, self.image)
     
     def update(self):
         if self.homing and self.target:
@@ -85,6 +90,8 @@ class Projectile(pygame.sprite.Sprite):
             self.kill()
 
 class Bullet(Projectile):
+    batchable = True
+    
     def __init__(self, x: float, y: float, velocity: Tuple[float, float] = (0, -BULLET_SPEED), 
                  damage: int = 1):
         super().__init__(x, y, velocity, damage, "player", "basic")
@@ -138,6 +145,8 @@ class HomingMissile(Projectile):
         super().update()
 
 class EnemyBullet(Projectile):
+    batchable = True
+    
     def __init__(self, x: float, y: float, target_pos: Tuple[float, float], 
                  speed: float = 5, damage: int = 10):
         # Calculate direction to target
@@ -149,6 +158,8 @@ class EnemyBullet(Projectile):
         self.create_trail = True
 
 class SpreadBullet(Projectile):
+    batchable = True
+    
     def __init__(self, x: float, y: float, angle: float, speed: float = BULLET_SPEED, 
                  damage: int = 1, owner: str = "player"):
         velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
@@ -178,6 +189,7 @@ class PlasmaBall(Projectile):
             pygame.draw.circle(self.image, color, center, radius)
         
         self.rect = self.image.get_rect()
+        self.mask = asset_manager.get_mask("plasma_ball", self.image)
         self.rect.center = (int(self.x), int(self.y))
     
     def on_hit(self, target):
@@ -238,7 +250,7 @@ class WeaponSystem:
         self.burst_timer = 0
     
     def can_fire(self) -> bool:
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if self.current_burst > 0:
             return current_time - self.last_shot >= self.burst_delay
         return current_time - self.last_shot >= self.fire_rate
@@ -266,7 +278,7 @@ class WeaponSystem:
             projectiles = self.fire_homing(x, y)
         
         if projectiles:
-            self.last_shot = pygame.time.get_ticks()
+            self.last_shot = game_clock.get_ticks()
             if self.ammo > 0:
                 self.ammo -= 1
             
@@ -285,18 +297,18 @@ class WeaponSystem:
         return projectiles
     
     def fire_basic(self, x: float, y: float) -> List[Projectile]:
-        bullet = Bullet(x, y)
+        bullet = Bullet.acquire(x, y)
         return [bullet]
     
     def fire_double(self, x: float, y: float) -> List[Projectile]:
-        bullet1 = Bullet(x - 10, y)
-        bullet2 = Bullet(x + 10, y)
+        bullet1 = Bullet.acquire(x - 10, y)
+        bullet2 = Bullet.acquire(x + 10, y)
         return [bullet1, bullet2]
     
     def fire_triple(self, x: float, y: float) -> List[Projectile]:
-        bullet1 = Bullet(x, y)
-        bullet2 = SpreadBullet(x, y, -math.pi/2 - self.spread_angle)
-        bullet3 = SpreadBullet(x, y, -math.pi/2 + self.spread_angle)
+        bullet1 = Bullet.acquire(x, y)
+        bullet2 = SpreadBullet.acquire(x, y, -math.pi/2 - self.spread_angle)
+        bullet3 = SpreadBullet.acquire(x, y, -math.pi/2 + self.spread_angle)
         return [bullet1, bullet2, bullet3]
     
     def fire_spread(self, x: float, y: float) -> List[Projectile]:
@@ -306,17 +318,17 @@ class WeaponSystem:
         
         for i in range(bullet_count):
             angle = -math.pi/2 - self.spread_angle + i * angle_step
-            bullet = SpreadBullet(x, y, angle)
+            bullet = SpreadBullet.acquire(x, y, angle)
             projectiles.append(bullet)
         
         return projectiles
     
     def fire_laser(self, x: float, y: float) -> List[Projectile]:
-        laser = LaserBullet(x, y)
+        laser = LaserBullet.acquire(x, y)
         return [laser]
     
     def fire_homing(self, x: float, y: float) -> List[Projectile]:
-        missile = HomingMissile(x, y)
+        missile = HomingMissile.acquire(x, y)
         return [missile]
     
     def upgrade_weapon(self, new_type: WeaponType):
@@ -350,7 +362,7 @@ class EnemyWeaponSystem:
         self.accuracy = 0.9
     
     def can_fire(self) -> bool:
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         return current_time - self.last_shot >= self.fire_rate
     
     def fire(self, x: float, y: float, target_pos: Tuple[float, float]) -> List[Projectile]:
@@ -367,18 +379,18 @@ class EnemyWeaponSystem:
             projectiles = self.fire_burst(x, y, target_pos)
         
         if projectiles:
-            self.last_shot = pygame.time.get_ticks()
+            self.last_shot = game_clock.get_ticks()
             sound_manager.play_enemy_sound(self.owner.__class__.__name__.lower(), "shoot")
         
         return projectiles
     
     def fire_basic(self, x: float, y: float, target_pos: Tuple[float, float]) -> List[Projectile]:
         # Add inaccuracy
-        offset_x = random.uniform(-20, 20) * (1 - self.accuracy)
-        offset_y = random.uniform(-20, 20) * (1 - self.accuracy)
+        offset_x = session_random.uniform(-20, 20) * (1 - self.accuracy)
+        offset_y = session_random.uniform(-20, 20) * (1 - self.accuracy)
         
         adjusted_target = (target_pos[0] + offset_x, target_pos[1] + offset_y)
-        bullet = EnemyBullet(x, y, adjusted_target)
+        bullet = EnemyBullet.acquire(x, y, adjusted_target)
         return [bullet]
     
     def fire_spread(self, x: float, y: float, target_pos: Tuple[float, float]) -> List[Projectile]:
@@ -386,28 +398,33 @@ class EnemyWeaponSystem:
         for i in range(3):
             offset_x = (i - 1) * 30
             target = (target_pos[0] + offset_x, target_pos[1])
-            bullet = EnemyBullet(x, y, target)
+            bullet = EnemyBullet.acquire(x, y, target)
             projectiles.append(bullet)
         return projectiles
     
     def fire_burst(self, x: float, y: float, target_pos: Tuple[float, float]) -> List[Projectile]:
         projectiles = []
         for i in range(self.burst_count):
-            bullet = EnemyBullet(x, y, target_pos, speed=6)
+            bullet = EnemyBullet.acquire(x, y, target_pos, speed=6)
             projectiles.append(bullet)
         return projectiles
 
 def create_bullet_for_weapon(weapon_type: WeaponType, x: float, y: float, **kwargs) -> Projectile:
     if weapon_type == WeaponType.BASIC:
-        return Bullet(x, y, **kwargs)
+        return Bullet.acquire(x, y, **kwargs)
     elif weapon_type == WeaponType.LASER:
-        return LaserBullet(x, y, **kwargs)
+        return LaserBullet.acquire(x, y, **kwargs)
     elif weapon_type == WeaponType.HOMING:
-        return HomingMissile(x, y, **kwargs)
+        return HomingMissile.acquire(x, y, **kwargs)
     else:
-        return Bullet(x, y, **kwargs)
+        return Bullet.acquire(x, y, **kwargs)
 
 def add_projectile_to_game(projectile: Projectile):
+    if projectile_field.accepts(projectile):
+        projectile_field.add_projectile(projectile)
+        sprite_pools.release(projectile)
+        return
+    
     sprite_groups.add_sprite(projectile, ["all"])
     
     if projectile.owner == "player":
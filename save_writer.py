@@ -0,0 +1,94 @@
+import json
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+from utils import write_file_atomic
+from trace_recorder import trace_recorder
+
+class SaveWriter:
+    """Writes save files on a background thread so saving never stalls a frame.
+
+    submit() serializes the data on the calling thread, which turns it into
+    an immutable snapshot, and drops it when the file's contents have not
+    changed since they were last saved. The writer thread pretty-prints each
+    snapshot and replaces the file atomically. Other stores can queue their
+    own writes with submit_task() to keep them in the same order.
+    """
+
+    def __init__(self):
+        self.queue: queue.Queue = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.start_lock = threading.Lock()  # The asset loader thread queues cache writes too
+        self.saved: Dict[str, str] = {}  # path -> last snapshot queued or loaded
+        self.writes = 0
+        self.skipped = 0
+
+    def start(self):
+        with self.start_lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="save-writer", daemon=True)
+                self.thread.start()
+
+    def mark_saved(self, path: str, data: Any):
+        """Record what is already on disk so an unchanged file is not rewritten"""
+        self.saved[path] = json.dumps(data)
+
+    def submit(self, path: str, data: Any) -> bool:
+        """Queue data to be written to path; returns False if nothing changed"""
+        snapshot = json.dumps(data)
+        if self.saved.get(path) == snapshot:
+            self.skipped += 1
+            return False
+
+        self.saved[path] = snapshot
+        self.start()
+        self.queue.put((self.write_snapshot, (path, snapshot)))
+        return True
+
+    def submit_task(self, task: Callable, *args):
+        """Run task(*args) on the writer thread after everything queued before it"""
+        self.start()
+        self.queue.put((task, args))
+
+    def write_snapshot(self, path: str, snapshot: str):
+        try:
+            with trace_recorder.span("save_file", {"path": path}):
+                write_file_atomic(path, json.dumps(json.loads(snapshot), indent=2))
+        except Exception:
+            # Let the next submit retry this file
+            if self.saved.get(path) == snapshot:
+                del self.saved[path]
+            raise
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                task, args = item
+                task(*args)
+                self.writes += 1
+            except Exception as e:
+                print(f"Error in save writer: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Block until every queued snapshot is on disk"""
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.join()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        # The sentinel queues behind any pending writes, so they finish first
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"writes": self.writes, "skipped": self.skipped, "pending": self.queue.qsize()}
+
+# Global save writer instance
+save_writer = SaveWriter()
@@ -0,0 +1,205 @@
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+from config import *
+from utils import load_json
+from save_writer import save_writer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    ship_type TEXT,
+    level_reached INTEGER NOT NULL DEFAULT 1,
+    enemies_killed INTEGER NOT NULL DEFAULT 0,
+    bosses_defeated INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_ship_score ON runs (ship_type, score DESC);
+CREATE TABLE IF NOT EXISTS level_results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    level INTEGER NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    enemies_killed INTEGER NOT NULL DEFAULT 0,
+    damage_taken INTEGER NOT NULL DEFAULT 0,
+    powerups_collected INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    perfect INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS level_results_by_run ON level_results (run_id);
+CREATE INDEX IF NOT EXISTS level_results_by_level_score ON level_results (level, score DESC);
+CREATE TABLE IF NOT EXISTS lifetime_stats (
+    key TEXT PRIMARY KEY,
+    value NUMERIC NOT NULL
+);
+"""
+
+RUN_COLUMNS = ["score", "ship_type", "level_reached", "enemies_killed", "bosses_defeated", "duration"]
+LEVEL_COLUMNS = ["level", "score", "enemies_killed", "damage_taken", "powerups_collected", "duration", "perfect"]
+
+class ScoreStore:
+    """SQLite store for finished runs, per-level results and lifetime stats.
+
+    Everything the UI shows is read once when the store opens and kept in
+    memory afterwards: the overall and per-ship leaderboards and the
+    lifetime stats. Recording a run updates those caches straight away and
+    queues the insert on the save writer thread, so neither drawing nor
+    saving touches the disk on the main thread.
+    """
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.connection: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()  # The connection is shared with the writer thread
+        self.leaderboard: List[Dict[str, Any]] = []
+        self.ship_leaderboards: Dict[str, List[Dict[str, Any]]] = {}
+        self.lifetime_stats: Dict[str, Any] = {}
+
+    def open(self, path: str = SAVE_PATHS["database"], migrate: bool = True):
+        if self.connection is not None:
+            return
+        self.path = path
+        try:
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            with self.connection:
+                self.connection.executescript(SCHEMA)
+            if migrate and self.get_meta("json_migrated") is None:
+                self.migrate_json()
+            self.load_caches()
+        except sqlite3.Error as e:
+            print(f"Error opening score database {path}: {e}")
+            self.connection = None
+
+    def close(self):
+        if self.connection is None:
+            return
+        save_writer.flush()
+        with self.lock:
+            self.connection.close()
+            self.connection = None
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def migrate_json(self):
+        """Import highscores.json and progress.json once; the JSON files are left as they are"""
+        scores = load_json(SAVE_PATHS["highscores"]) or []
+        stats = load_json(SAVE_PATHS["progress"]) or {}
+        now = time.time()
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO runs (score, created_at) VALUES (?, ?)",
+                [(int(score), now) for score in scores if isinstance(score, (int, float))])
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO lifetime_stats (key, value) VALUES (?, ?)",
+                [(key, value) for key, value in stats.items() if isinstance(value, (int, float))])
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                                    (str(now),))
+
+        if scores or stats:
+            print(f"Migrated {len(scores)} high scores and {len(stats)} stats to {self.path}")
+
+    def load_caches(self):
+        columns = ", ".join(RUN_COLUMNS)
+        self.leaderboard = self.fetch_runs(
+            f"SELECT {columns} FROM runs ORDER BY score DESC LIMIT ?", (LEADERBOARD_SIZE,))
+
+        self.ship_leaderboards = {}
+        ship_types = self.connection.execute(
+            "SELECT DISTINCT ship_type FROM runs WHERE ship_type IS NOT NULL").fetchall()
+        for (ship_type,) in ship_types:
+            self.ship_leaderboards[ship_type] = self.fetch_runs(
+                f"SELECT {columns} FROM runs WHERE ship_type = ? ORDER BY score DESC LIMIT ?",
+                (ship_type, LEADERBOARD_SIZE))
+
+        self.lifetime_stats = dict(self.connection.execute("SELECT key, value FROM lifetime_stats"))
+
+    def fetch_runs(self, query: str, params: tuple) -> List[Dict[str, Any]]:
+        return [dict(zip(RUN_COLUMNS, row)) for row in self.connection.execute(query, params)]
+
+    # Cached reads
+
+    def get_leaderboard(self, ship_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        if ship_type is None:
+            return list(self.leaderboard)
+        return list(self.ship_leaderboards.get(ship_type, []))
+
+    def get_high_scores(self, ship_type: Optional[str] = None) -> List[int]:
+        return [run["score"] for run in self.get_leaderboard(ship_type)]
+
+    def get_lifetime_stats(self) -> Dict[str, Any]:
+        return dict(self.lifetime_stats)
+
+    # Writes
+
+    def record_run(self, run: Dict[str, Any], levels: Optional[List[Dict[str, Any]]] = None):
+        run = {column: run.get(column) for column in RUN_COLUMNS}
+        run["score"] = int(run["score"] or 0)
+
+        self.add_to_leaderboard(self.leaderboard, run)
+        if run["ship_type"] is not None:
+            self.add_to_leaderboard(self.ship_leaderboards.setdefault(run["ship_type"], []), run)
+
+        if self.connection is not None:
+            save_writer.submit_task(self.write_run, run, list(levels or []), time.time())
+
+    def add_to_leaderboard(self, leaderboard: List[Dict[str, Any]], run: Dict[str, Any]):
+        # Ties keep the older run first, matching ORDER BY score DESC on insertion order
+        index = len(leaderboard)
+        while index > 0 and leaderboard[index - 1]["score"] < run["score"]:
+            index -= 1
+        leaderboard.insert(index, run)
+        del leaderboard[LEADERBOARD_SIZE:]
+
+    def save_lifetime_stats(self, stats: Dict[str, Any]):
+        """Queue the stats that changed since the last save; returns False if none did"""
+        changed = {key: value for key, value in stats.items() if self.lifetime_stats.get(key) != value}
+        if not changed:
+            return False
+        self.lifetime_stats.update(changed)
+        if self.connection is not None:
+            save_writer.submit_task(self.write_stats, changed)
+        return True
+
+    def write_run(self, run: Dict[str, Any], levels: List[Dict[str, Any]], created_at: float):
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (score, ship_type, level_reached, enemies_killed, bosses_defeated, "
+                "duration, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run["score"], run["ship_type"], run["level_reached"] or 1, run["enemies_killed"] or 0,
+                 run["bosses_defeated"] or 0, run["duration"] or 0, created_at))
+            self.connection.executemany(
+                "INSERT INTO level_results (run_id, level, score, enemies_killed, damage_taken, "
+                "powerups_collected, duration, perfect) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(cursor.lastrowid,) + tuple(level.get(column) or 0 for column in LEVEL_COLUMNS)
+                 for level in levels])
+
+    def write_stats(self, stats: Dict[str, Any]):
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO lifetime_stats (key, value) VALUES (?, ?)", list(stats.items()))
+
+    def get_level_bests(self, level: int, limit: int = LEADERBOARD_SIZE) -> List[Dict[str, Any]]:
+        """Best results for one level; this one queries the database, so keep it off per-frame paths"""
+        if self.connection is None:
+            return []
+        save_writer.flush()
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT r.ship_type, l.score, l.duration, l.perfect FROM level_results l "
+                "JOIN runs r ON r.id = l.run_id WHERE l.level = ? ORDER BY l.score DESC LIMIT ?",
+                (level, limit)).fetchall()
+        return [dict(zip(["ship_type", "score", "duration", "perfect"], row)) for row in rows]
+
+# Global score store instance
+score_store = ScoreStore()
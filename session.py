@@ -0,0 +1,56 @@
+import os
+import random
+from typing import Optional
+from config import FPS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class SessionRandom(random.Random):
+    """Seeded random source shared by every gameplay module.
+
+    Drop-in for the random module (randint, uniform, choice, ...); vectorized
+    code draws from the matching NumPy generator in self.numpy.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__()
+        self.numpy = None
+        self.seed_session(seed)
+
+    def seed_session(self, seed: Optional[int] = None) -> int:
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        self.session_seed = seed
+        self.seed(seed)
+        if np is not None:
+            self.numpy = np.random.default_rng(seed)
+        return seed
+
+class GameClock:
+    """Simulated milliseconds, advanced once per simulation step.
+
+    Gameplay timers read this instead of pygame.time.get_ticks() so a run
+    depends on the number of steps taken, not on wall-clock speed.
+    """
+
+    def __init__(self):
+        self.ticks = 0.0
+        self.steps = 0
+
+    def reset(self):
+        self.ticks = 0.0
+        self.steps = 0
+
+    def advance(self, ms: float = 1000 / FPS):
+        self.ticks += ms
+        self.steps += 1
+
+    def get_ticks(self) -> int:
+        return int(self.ticks)
+
+# Global session instances
+session_random = SessionRandom()
+game_clock = GameClock()
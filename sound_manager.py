@@ -1,8 +1,9 @@
 import pygame
 import os
-from typing import Dict, Optional, List
-from config import MUSIC_VOLUME, SFX_VOLUME, ASSET_PATHS
-from asset_manager import asset_manager
+from typing import Optional, List
+from config import MUSIC_VOLUME, SFX_VOLUME, ASSET_PATHS, MUSIC_CROSSFADE_TIME
+from voice_manager import voice_manager
+from audio_timeline import audio_timeline
 
 class SoundManager:
     def __init__(self):
@@ -11,7 +12,6 @@ class SoundManager:
         self.music_enabled = True
         self.sfx_enabled = True
         self.current_music = None
-        self.sound_channels: Dict[str, pygame.mixer.Channel] = {}
         
         # Initialize mixer if not already done
         try:
@@ -22,56 +22,26 @@ class SoundManager:
             self.sfx_enabled = False
             self.music_enabled = False
         
-        # Reserve channels for different types of sounds
+        # Mixer channels are handed out per sound category by the voice manager
         try:
-            pygame.mixer.set_num_channels(16)
-            self.ui_channel = pygame.mixer.Channel(0)
-            self.player_channel = pygame.mixer.Channel(1)
-            self.enemy_channel = pygame.mixer.Channel(2)
-            self.explosion_channel = pygame.mixer.Channel(3)
-            self.powerup_channel = pygame.mixer.Channel(4)
-            self.ambient_channel = pygame.mixer.Channel(5)
+            voice_manager.init_channels()
         except Exception as e:
             print(f"Warning: Could not create sound channels: {e}")
-            # Create dummy channels that do nothing
-            self.ui_channel = None
-            self.player_channel = None
-            self.enemy_channel = None
-            self.explosion_channel = None
-            self.powerup_channel = None
-            self.ambient_channel = None
     
     def play_sound(self, sound_name: str, volume: Optional[float] = None, channel: Optional[str] = None):
+        # Queued for the voice manager, which starts this step's sounds together
         if not self.sfx_enabled:
             return
         
-        sound = asset_manager.get_sound(sound_name)
-        if sound:
-            if volume is None:
-                volume = self.sfx_volume
-            else:
-                volume = min(1.0, volume * self.sfx_volume)
-            
-            sound.set_volume(volume)
-            
-            if channel:
-                self.play_on_channel(sound, channel)
-            else:
-                sound.play()
-    
-    def play_on_channel(self, sound: pygame.mixer.Sound, channel_name: str):
-        channel_map = {
-            "ui": self.ui_channel,
-            "player": self.player_channel,
-            "enemy": self.enemy_channel,
-            "explosion": self.explosion_channel,
-            "powerup": self.powerup_channel,
-            "ambient": self.ambient_channel
-        }
-        
-        channel = channel_map.get(channel_name)
-        if channel:
-            channel.play(sound)
+        if volume is None:
+            volume = self.sfx_volume
+        else:
+            volume = min(1.0, volume * self.sfx_volume)
+        voice_manager.play(sound_name, volume, channel or "effects")
+    
+    def play_sound_later(self, sound_name: str, delay: float, volume: Optional[float] = None,
+                         channel: Optional[str] = None):
+        audio_timeline.call_later(delay * 1000, lambda: self.play_sound(sound_name, volume, channel))
     
     def play_music(self, music_name: str, loops: int = -1, fade_in: float = 0):
         if not self.music_enabled:
@@ -94,6 +64,7 @@ class SoundManager:
                 print(f"Error playing music {music_name}: {e}")
     
     def stop_music(self, fade_out: float = 0):
+        audio_timeline.cancel("music")
         if fade_out > 0:
             pygame.mixer.music.fadeout(int(fade_out * 1000))
         else:
@@ -107,9 +78,18 @@ class SoundManager:
         pygame.mixer.music.unpause()
     
     def set_music_volume(self, volume: float):
+        # Setting the volume outright ends any fade in progress
+        audio_timeline.cancel("music")
         self.music_volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.music_volume)
     
+    def apply_music_volume(self, volume: float):
+        # Fade steps change the stream volume without touching the music_volume setting
+        try:
+            pygame.mixer.music.set_volume(volume)
+        except pygame.error:
+            pass
+    
     def set_sfx_volume(self, volume: float):
         self.sfx_volume = max(0.0, min(1.0, volume))
     
@@ -126,48 +106,28 @@ class SoundManager:
             self.stop_all_sounds()
     
     def stop_all_sounds(self):
+        voice_manager.stop_all()
         pygame.mixer.stop()
     
     def stop_channel(self, channel_name: str):
-        channel_map = {
-            "ui": self.ui_channel,
-            "player": self.player_channel,
-            "enemy": self.enemy_channel,
-            "explosion": self.explosion_channel,
-            "powerup": self.powerup_channel,
-            "ambient": self.ambient_channel
-        }
-        
-        channel = channel_map.get(channel_name)
-        if channel:
-            channel.stop()
+        voice_manager.stop_category(channel_name)
     
     def is_music_playing(self) -> bool:
         return pygame.mixer.music.get_busy()
     
     def is_channel_busy(self, channel_name: str) -> bool:
-        channel_map = {
-            "ui": self.ui_channel,
-            "player": self.player_channel,
-            "enemy": self.enemy_channel,
-            "explosion": self.explosion_channel,
-            "powerup": self.powerup_channel,
-            "ambient": self.ambient_channel
-        }
-        
-        channel = channel_map.get(channel_name)
-        return channel.get_busy() if channel else False
+        return voice_manager.is_category_busy(channel_name)
     
     def play_shoot_sound(self, weapon_type: str = "basic"):
         sound_variations = {
             "basic": "shoot",
-            "laser": "shoot",
+            "laser": "laser",
             "rapid": "shoot",
             "spread": "shoot"
         }
         
         sound_name = sound_variations.get(weapon_type, "shoot")
-        self.play_sound(sound_name, channel="player")
+        self.play_sound(sound_name, channel="weapon")
     
     def play_explosion_sound(self, size: str = "normal"):
         volume_variations = {
@@ -195,15 +155,15 @@ class SoundManager:
         self.play_sound(sound_name, channel="powerup")
     
     def play_ui_sound(self, ui_action: str):
-        # For UI sounds, we'll use the basic sounds for now
+        # UI sounds are synthesized at load time (SYNTH_SOUNDS)
         ui_sounds = {
-            "select": "shoot",
-            "confirm": "powerup_sound",
-            "back": "explosion",
-            "error": "explosion"
+            "select": "ui_select",
+            "confirm": "ui_confirm",
+            "back": "ui_back",
+            "error": "ui_back"
         }
         
-        sound_name = ui_sounds.get(ui_action, "shoot")
+        sound_name = ui_sounds.get(ui_action, "ui_select")
         self.play_sound(sound_name, volume=0.3, channel="ui")
     
     def play_ambient_sound(self, ambient_type: str):
@@ -248,30 +208,42 @@ class SoundManager:
     
     def create_sound_sequence(self, sounds: List[tuple], delay: float = 0.1):
         # For playing multiple sounds in sequence
-        # sounds: List of (sound_name, volume, channel) tuples
-        current_time = pygame.time.get_ticks()
-        
+        # sounds: List of (sound_name, volume, channel) tuples, started delay seconds apart
         for i, (sound_name, volume, channel) in enumerate(sounds):
-            # Schedule sound to play after delay
-            def play_delayed_sound():
-                self.play_sound(sound_name, volume, channel)
-            
-            # For simplicity, we'll just play them immediately
-            # In a real implementation, you'd use pygame.time.set_timer
-            play_delayed_sound()
+            self.play_sound_later(sound_name, i * delay, volume, channel)
     
     def get_music_position(self) -> float:
         return pygame.mixer.music.get_pos() / 1000.0 if self.is_music_playing() else 0.0
     
     def fade_music(self, target_volume: float, duration: float):
-        # Simple fade implementation
-        current_volume = self.music_volume
-        steps = int(duration * 60)  # Assuming 60 FPS
-        volume_step = (target_volume - current_volume) / steps
+        # Ramp the stream volume on the audio timeline, then keep the target as the setting
+        target_volume = max(0.0, min(1.0, target_volume))
+        audio_timeline.ramp(duration * 1000, self.get_stream_volume(), target_volume, self.apply_music_volume,
+                            on_done=lambda: self.set_music_volume(target_volume), tag="music")
+    
+    def crossfade_music(self, music_name: str, duration: float = MUSIC_CROSSFADE_TIME):
+        # pygame streams one music track at a time, so fade the old one out before the new one comes in
+        if not self.music_enabled or music_name == self.current_music:
+            return
+        if not self.is_music_playing():
+            self.play_music(music_name, fade_in=duration)
+            return
         
-        # In a real implementation, you'd use a timer or coroutine
-        # For now, just set the target volume
-        self.set_music_volume(target_volume)
+        half = duration * 500
+        self.current_music = music_name
+        audio_timeline.ramp(half, self.get_stream_volume(), 0.0, self.apply_music_volume,
+                            on_done=lambda: self.fade_in_music(music_name, half), tag="music")
+    
+    def fade_in_music(self, music_name: str, duration_ms: float):
+        self.play_music(music_name)
+        self.apply_music_volume(0.0)
+        audio_timeline.ramp(duration_ms, 0.0, self.music_volume, self.apply_music_volume, tag="music")
+    
+    def get_stream_volume(self) -> float:
+        try:
+            return pygame.mixer.music.get_volume()
+        except pygame.error:
+            return self.music_volume
     
     def save_settings(self) -> dict:
         return {
@@ -0,0 +1,118 @@
+import pygame
+from typing import Any, Dict, Optional
+from config import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# pygame mixer sample size -> NumPy sample type; a 32-bit mixer always holds floats
+SAMPLE_TYPES = {8: "uint8", -8: "int8", 16: "uint16", -16: "int16", 32: "float32", -32: "float32"}
+
+class SoundSynth:
+    """Batch NumPy synthesis of short sound effects.
+
+    A recipe (see SYNTH_SOUNDS) picks an oscillator, an optional frequency
+    sweep and noise mix, an ADSR envelope and simple box filters; render()
+    builds the whole buffer with array operations and make_sound() converts
+    it to the mixer's format through pygame.sndarray. Without NumPy or an
+    initialized mixer, create() returns None and the sound is skipped.
+    """
+
+    def __init__(self, seed: int = SYNTH_SEED):
+        self.seed = seed
+
+    def get_sample_rate(self) -> int:
+        mixer_format = pygame.mixer.get_init()
+        return mixer_format[0] if mixer_format else 22050
+
+    # Building blocks
+
+    def oscillator(self, wave: str, freq: float, end_freq: float, length: int, sample_rate: int):
+        # An exponential glide sounds even across octaves; the phase integrates the frequency
+        position = np.arange(length) / max(1, length)
+        frequency = freq * (end_freq / freq) ** position
+        cycles = np.cumsum(frequency) / sample_rate
+        if wave == "sine":
+            return np.sin(2 * np.pi * cycles)
+        if wave == "square":
+            return np.where(cycles % 1.0 < 0.5, 1.0, -1.0)
+        saw = 2.0 * (cycles % 1.0) - 1.0
+        if wave == "saw":
+            return saw
+        if wave == "triangle":
+            return 2.0 * np.abs(saw) - 1.0
+        raise ValueError(f"Unknown wave {wave}")
+
+    def noise(self, length: int, rng):
+        return rng.uniform(-1.0, 1.0, length)
+
+    def envelope(self, length: int, sample_rate: int, attack: float = 0.0, decay: float = 0.0,
+                 sustain: float = 1.0, release: float = 0.0):
+        duration = length / sample_rate
+        attack = min(attack, duration)
+        decay = min(decay, duration - attack)
+        release = min(release, duration - attack - decay)
+        times = [0.0, attack, attack + decay, duration - release, duration]
+        levels = [0.0 if attack > 0 else 1.0, 1.0, sustain, sustain, 0.0 if release > 0 else sustain]
+        return np.interp(np.arange(length) / sample_rate, times, levels)
+
+    def lowpass(self, signal, cutoff: float, sample_rate: int):
+        # A moving average whose window spans one period of the cutoff
+        width = max(1, int(sample_rate / cutoff))
+        return np.convolve(signal, np.full(width, 1.0 / width), mode="same")
+
+    def highpass(self, signal, cutoff: float, sample_rate: int):
+        return signal - self.lowpass(signal, cutoff, sample_rate)
+
+    # Recipes
+
+    def render(self, recipe: Dict[str, Any], sample_rate: int):
+        """Float samples in [-1, 1] for one recipe"""
+        length = max(1, int(recipe["duration"] * sample_rate))
+        freq = recipe.get("freq", 440)
+        wave = recipe.get("wave", "sine")
+        rng = np.random.default_rng(self.seed)
+
+        if wave == "noise":
+            signal = self.noise(length, rng)
+        else:
+            signal = self.oscillator(wave, freq, recipe.get("end_freq", freq), length, sample_rate)
+            noise = recipe.get("noise", 0.0)
+            if noise:
+                signal = signal * (1.0 - noise) + self.noise(length, rng) * noise
+
+        if "lowpass" in recipe:
+            signal = self.lowpass(signal, recipe["lowpass"], sample_rate)
+        if "highpass" in recipe:
+            signal = self.highpass(signal, recipe["highpass"], sample_rate)
+
+        signal = signal * self.envelope(length, sample_rate, recipe.get("attack", 0.0), recipe.get("decay", 0.0),
+                                        recipe.get("sustain", 1.0), recipe.get("release", 0.0))
+        return np.clip(signal * recipe.get("volume", 1.0), -1.0, 1.0)
+
+    def make_sound(self, samples) -> pygame.mixer.Sound:
+        _, size, channels = pygame.mixer.get_init()
+        sample_type = np.dtype(SAMPLE_TYPES[size])
+        if sample_type.kind == "f":
+            data = samples.astype(sample_type)
+        else:
+            info = np.iinfo(sample_type)
+            middle = (int(info.max) + int(info.min) + 1) // 2
+            data = (samples * (info.max - middle) + middle).astype(sample_type)
+        if channels > 1:
+            data = np.repeat(data[:, None], channels, axis=1)
+        return pygame.sndarray.make_sound(np.ascontiguousarray(data))
+
+    def create(self, recipe: Dict[str, Any]) -> Optional[pygame.mixer.Sound]:
+        if np is None or not pygame.mixer.get_init():
+            return None
+        try:
+            return self.make_sound(self.render(recipe, self.get_sample_rate()))
+        except Exception as e:
+            print(f"Error synthesizing sound: {e}")
+            return None
+
+# Global sound synthesizer instance
+sound_synth = SoundSynth()
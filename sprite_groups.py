@@ -1,5 +1,7 @@
 import pygame
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from config import INTERPOLATION_SNAP_DISTANCE
+from sprite_pools import sprite_pools
 
 class SpriteGroups:
     def __init__(self):
@@ -16,6 +18,9 @@ class SpriteGroups:
         self.obstacles = pygame.sprite.Group()
         self.collectibles = pygame.sprite.Group()
         
+        # Positions before the last simulation step, for render interpolation
+        self.previous_positions: Dict[pygame.sprite.Sprite, Tuple[int, int]] = {}
+        
         # Dictionary for easy access
         self.groups = {
             "all": self.all_sprites,
@@ -33,6 +38,7 @@ class SpriteGroups:
         }
     
     def add_sprite(self, sprite: pygame.sprite.Sprite, group_names: List[str]):
+        sprite_pools.claim(sprite)
         for group_name in group_names:
             if group_name in self.groups:
                 self.groups[group_name].add(sprite)
@@ -44,20 +50,28 @@ class SpriteGroups:
         for group_name in group_names:
             if group_name in self.groups:
                 self.groups[group_name].remove(sprite)
+        
+        sprite_pools.release_orphans([sprite])
     
     def get_group(self, group_name: str) -> pygame.sprite.Group:
         return self.groups.get(group_name, pygame.sprite.Group())
     
     def clear_group(self, group_name: str):
         if group_name in self.groups:
+            sprites = self.groups[group_name].sprites()
             self.groups[group_name].empty()
+            sprite_pools.release_orphans(sprites)
     
     def clear_all_except(self, exceptions: List[str]):
+        sprites = []
         for group_name, group in self.groups.items():
             if group_name not in exceptions:
+                sprites.extend(group.sprites())
                 group.empty()
+        sprite_pools.release_orphans(sprites)
     
     def update_all(self):
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
         self.all_sprites.update()
     
     def update_group(self, group_name: str):
@@ -68,8 +82,29 @@ class SpriteGroups:
         if group_name in self.groups:
             self.groups[group_name].draw(surface)
     
-    def draw_all(self, surface: pygame.Surface):
-        self.all_sprites.draw(surface)
+    def draw_all(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+                 alpha: float = 1.0) -> List[pygame.Rect]:
+        if alpha < 1.0:
+            return surface.blits([(sprite.image, self.get_interpolated_rect(sprite, offset, alpha))
+                                  for sprite in self.all_sprites])
+        if offset == (0, 0):
+            return surface.blits([(sprite.image, sprite.rect) for sprite in self.all_sprites])
+        # Shift each blit instead of moving the finished frame
+        return surface.blits([(sprite.image, sprite.rect.move(offset)) for sprite in self.all_sprites])
+    
+    def get_interpolated_rect(self, sprite: pygame.sprite.Sprite, offset: Tuple[int, int] = (0, 0),
+                              alpha: float = 1.0) -> pygame.Rect:
+        """Sprite rect placed alpha of the way from its previous to its current position"""
+        rect = sprite.rect
+        previous = self.previous_positions.get(sprite)
+        if previous is None or alpha >= 1.0:
+            return rect.move(offset)
+        
+        dx = rect.x - previous[0]
+        dy = rect.y - previous[1]
+        if abs(dx) > INTERPOLATION_SNAP_DISTANCE or abs(dy) > INTERPOLATION_SNAP_DISTANCE:
+            return rect.move(offset)
+        return rect.move(offset[0] - round(dx * (1 - alpha)), offset[1] - round(dy * (1 - alpha)))
     
     def get_sprite_count(self, group_name: str) -> int:
         if group_name in self.groups:
@@ -82,8 +117,10 @@ class SpriteGroups:
         return []
     
     def reset_all(self):
+        sprites = self.all_sprites.sprites()
         for group in self.groups.values():
             group.empty()
+        sprite_pools.release_orphans(sprites)
     
     def get_collision_candidates(self, sprite: pygame.sprite.Sprite, group_name: str) -> List[pygame.sprite.Sprite]:
         if group_name in self.groups:
@@ -0,0 +1,87 @@
+import pygame
+from typing import Dict, List, Iterable
+from config import SPRITE_POOL_MAX_FREE
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite whose instances are recycled through sprite_pools.
+
+    Subclasses must keep __init__ safe to call again on a recycled instance:
+    it doubles as the reset hook, and should reuse any surface it already owns.
+    """
+    pool_released = False
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        return sprite_pools.acquire(cls, *args, **kwargs)
+
+    def kill(self):
+        super().kill()
+        sprite_pools.release(self)
+
+class SpritePools:
+    def __init__(self, max_free: int = SPRITE_POOL_MAX_FREE):
+        self.max_free = max_free
+        self.free: Dict[type, List[PooledSprite]] = {}
+        self.stats: Dict[type, Dict[str, int]] = {}
+
+    def get_class_stats(self, cls: type) -> Dict[str, int]:
+        stats = self.stats.get(cls)
+        if stats is None:
+            stats = {"hits": 0, "misses": 0, "released": 0, "discarded": 0}
+            self.stats[cls] = stats
+        return stats
+
+    def acquire(self, cls: type, *args, **kwargs) -> PooledSprite:
+        stats = self.get_class_stats(cls)
+        free = self.free.get(cls)
+
+        if free:
+            sprite = free.pop()
+            sprite.pool_released = False
+            sprite.__init__(*args, **kwargs)
+            stats["hits"] += 1
+            return sprite
+
+        stats["misses"] += 1
+        return cls(*args, **kwargs)
+
+    def release(self, sprite: PooledSprite):
+        if sprite.pool_released or sprite.alive():
+            return
+
+        stats = self.get_class_stats(type(sprite))
+        free = self.free.setdefault(type(sprite), [])
+        if len(free) >= self.max_free:
+            stats["discarded"] += 1
+            return
+
+        sprite.pool_released = True
+        free.append(sprite)
+        stats["released"] += 1
+
+    def release_orphans(self, sprites: Iterable[pygame.sprite.Sprite]):
+        # Group.empty() bypasses kill(), so recycle anything left without a group
+        for sprite in sprites:
+            if isinstance(sprite, PooledSprite) and not sprite.alive():
+                self.release(sprite)
+
+    def claim(self, sprite: pygame.sprite.Sprite):
+        # A released sprite re-added by an old reference must not be handed out again
+        if getattr(sprite, "pool_released", False):
+            self.free[type(sprite)].remove(sprite)
+            sprite.pool_released = False
+
+    def get_free_count(self, cls: type) -> int:
+        return len(self.free.get(cls, []))
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            cls.__name__: {**stats, "free": self.get_free_count(cls)}
+            for cls, stats in self.stats.items()
+        }
+
+    def clear(self):
+        self.free.clear()
+
+# Global sprite pools instance
+sprite_pools = SpritePools()
@@ -0,0 +1,123 @@
+import json
+import time
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+from config import TRACE_BUFFER_EVENTS
+
+class TraceSpan:
+    """Context manager recording its block as one complete trace event"""
+    __slots__ = ("recorder", "name", "args", "start")
+
+    def __init__(self, recorder, name: str, args: Optional[Dict[str, Any]] = None):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.complete(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+class NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_SPAN = NullSpan()
+
+class TraceRecorder:
+    """Chrome trace-event recording of engine phases and notable moments.
+
+    Events go into a bounded ring buffer, so a long session keeps only its
+    most recent TRACE_BUFFER_EVENTS events. Phases are stored as complete
+    ("X") events, which carry their begin and end together and cannot be
+    split apart when the oldest events fall out of the buffer. The file is
+    written on stop() and opens in chrome://tracing or Perfetto.
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_EVENTS):
+        self.events: deque = deque(maxlen=capacity)
+        self.recorded = 0
+        self.path: Optional[str] = None
+        self.origin = 0.0
+        self.thread_names: Dict[int, str] = {}
+        self.active = False
+
+    def start(self, path: str):
+        self.events.clear()
+        self.recorded = 0
+        self.thread_names = {}
+        self.path = path
+        self.origin = time.perf_counter()
+        self.active = True
+
+    def get_thread_id(self) -> int:
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        return thread_id
+
+    def complete(self, name: str, start: float, end: float, args: Optional[Dict[str, Any]] = None):
+        """Record a span from perf_counter() readings start to end"""
+        if not self.active:
+            return
+        # deque.append is atomic, so worker threads can record too
+        self.events.append(("X", name, (start - self.origin) * 1e6, (end - start) * 1e6,
+                            self.get_thread_id(), args))
+        self.recorded += 1
+
+    def instant(self, name: str, args: Optional[Dict[str, Any]] = None):
+        if not self.active:
+            return
+        self.events.append(("i", name, (time.perf_counter() - self.origin) * 1e6, 0,
+                            self.get_thread_id(), args))
+        self.recorded += 1
+
+    def span(self, name: str, args: Optional[Dict[str, Any]] = None):
+        return TraceSpan(self, name, args) if self.active else NULL_SPAN
+
+    def build_trace(self) -> Dict[str, Any]:
+        trace_events = [{"ph": "M", "name": "process_name", "pid": 1, "tid": 0,
+                         "args": {"name": "ShooTar"}}]
+        for thread_id, thread_name in self.thread_names.items():
+            trace_events.append({"ph": "M", "name": "thread_name", "pid": 1, "tid": thread_id,
+                                 "args": {"name": thread_name}})
+
+        for phase, name, timestamp, duration, thread_id, args in list(self.events):
+            event = {"ph": phase, "name": name, "pid": 1, "tid": thread_id, "ts": round(timestamp, 1)}
+            if phase == "X":
+                event["dur"] = round(duration, 1)
+            else:
+                event["s"] = "g"  # Instant events span every thread of the timeline
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"recorded_events": self.recorded,
+                          "dropped_events": self.recorded - len(self.events)}
+        }
+
+    def stop(self) -> Optional[str]:
+        if not self.active:
+            return None
+        self.active = False
+
+        path, self.path = self.path, None
+        with open(path, "w") as f:
+            json.dump(self.build_trace(), f, separators=(",", ":"))
+        return path
+
+# Global trace recorder instance
+trace_recorder = TraceRecorder()
@@ -1,6 +1,12 @@
 import pygame
-import json
+import re
+from collections import OrderedDict
 from config import *
+from session import game_clock
+from effects import effect_manager
+from score_store import score_store
+
+DIGIT_RUN = re.compile(r"([0-9]+)")
 
 class UIManager:
     def __init__(self):
@@ -8,10 +14,11 @@ class UIManager:
         self.font_medium = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 48)
         self.font_title = pygame.font.Font(None, 72)
+        self.sized_fonts = {}
         
-        self.screen_shake_offset = (0, 0)
-        self.shake_timer = 0
-        self.shake_intensity = 0
+        # Rendered text: LRU of whole strings plus one digit atlas per font and color
+        self.text_cache = OrderedDict()
+        self.digit_atlases = {}
         
         # Menu state
         self.menu_selection = 0
@@ -20,19 +27,83 @@ class UIManager:
         # Achievement notifications
         self.achievement_notifications = []
         
-    def draw_text(self, surface, text, size, x, y, color=WHITE, center=True):
+    def get_font(self, size):
         if size == "small":
-            font = self.font_small
+            return self.font_small
         elif size == "medium":
-            font = self.font_medium
+            return self.font_medium
         elif size == "large":
-            font = self.font_large
+            return self.font_large
         elif size == "title":
-            font = self.font_title
-        else:
+            return self.font_title
+        
+        font = self.sized_fonts.get(size)
+        if font is None:
             font = pygame.font.Font(None, size)
+            self.sized_fonts[size] = font
+        return font
+        
+    def render_cached_text(self, text, size, color):
+        key = (text, size, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is not None:
+            self.text_cache.move_to_end(key)
+            return text_surface
             
-        text_surface = font.render(str(text), True, color)
+        parts = DIGIT_RUN.split(text)
+        if len(parts) == 1:
+            text_surface = self.get_font(size).render(text, True, color)
+        else:
+            text_surface = self.compose_text(parts, size, color)
+            
+        self.text_cache[key] = text_surface
+        if len(self.text_cache) > TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return text_surface
+        
+    def get_digit_atlas(self, size, color):
+        # All ten digits rendered once into one strip, with the area of each
+        key = (size, color)
+        atlas = self.digit_atlases.get(key)
+        if atlas is None:
+            font = self.get_font(size)
+            glyphs = [font.render(str(digit), True, color) for digit in range(10)]
+            strip = pygame.Surface((sum(glyph.get_width() for glyph in glyphs),
+                                    max(glyph.get_height() for glyph in glyphs)), pygame.SRCALPHA)
+            areas = []
+            x = 0
+            for glyph in glyphs:
+                areas.append(strip.blit(glyph, (x, 0)))
+                x += glyph.get_width()
+            atlas = (strip, areas)
+            self.digit_atlases[key] = atlas
+        return atlas
+        
+    def compose_text(self, parts, size, color):
+        # Numbers are stitched from the digit atlas; the labels around them come from the cache
+        strip, areas = self.get_digit_atlas(size, color)
+        pieces = []
+        for index, part in enumerate(parts):
+            if not part:
+                continue
+            if index % 2:
+                pieces.extend((strip, areas[ord(char) - 48]) for char in part)
+            else:
+                label = self.render_cached_text(part, size, color)
+                pieces.append((label, label.get_rect()))
+                
+        text_surface = pygame.Surface((sum(area.width for _, area in pieces),
+                                       max(area.height for _, area in pieces)), pygame.SRCALPHA)
+        x = 0
+        blit_sequence = []
+        for source, area in pieces:
+            blit_sequence.append((source, (x, 0), area))
+            x += area.width
+        text_surface.blits(blit_sequence, doreturn=False)
+        return text_surface
+        
+    def draw_text(self, surface, text, size, x, y, color=WHITE, center=True):
+        text_surface = self.render_cached_text(str(text), size, tuple(color))
         text_rect = text_surface.get_rect()
         
         if center:
@@ -62,45 +133,45 @@ class UIManager:
             
         # Border
         pygame.draw.rect(surface, WHITE, background_rect, 2)
+        return background_rect
         
     def draw_hud(self, surface, player, level=1, score=0):
-        # Apply screen shake
-        shake_x, shake_y = self.get_screen_shake()
+        # Every draw returns its rect so the dirty-rect renderer knows what changed
+        rects = []
         
         # Player stats
-        self.draw_text(surface, f"Score: {score}", "small", 10 + shake_x, 10 + shake_y, WHITE, False)
-        self.draw_text(surface, f"Level: {level}", "small", 10 + shake_x, 30 + shake_y, WHITE, False)
-        self.draw_text(surface, f"Lives: {player.lives}", "small", 10 + shake_x, 50 + shake_y, WHITE, False)
+        rects.append(self.draw_text(surface, f"Score: {score}", "small", 10, 10, WHITE, False))
+        rects.append(self.draw_text(surface, f"Level: {level}", "small", 10, 30, WHITE, False))
+        rects.append(self.draw_text(surface, f"Lives: {player.lives}", "small", 10, 50, WHITE, False))
         
         # Health bar
-        self.draw_health_bar(surface, 10 + shake_x, 70 + shake_y, player.health, player.max_health, 150, 12)
+        rects.append(self.draw_health_bar(surface, 10, 70, player.health, player.max_health, 150, 12))
         
         # Weapon info
         weapon_text = f"Weapon: {player.weapon_type.name}"
-        self.draw_text(surface, weapon_text, "small", 10 + shake_x, 90 + shake_y, WHITE, False)
+        rects.append(self.draw_text(surface, weapon_text, "small", 10, 90, WHITE, False))
         
         # Active power-ups
         y_offset = 110
         for powerup in player.active_powerups:
-            self.draw_text(surface, f"{powerup.upper()}", "small", 10 + shake_x, y_offset + shake_y, YELLOW, False)
+            rects.append(self.draw_text(surface, f"{powerup.upper()}", "small", 10, y_offset, YELLOW, False))
             y_offset += 20
             
         # Shield indicator
         if player.shield:
-            self.draw_text(surface, "SHIELD ACTIVE", "medium", SCREEN_WIDTH // 2 + shake_x, 50 + shake_y, BLUE)
+            rects.append(self.draw_text(surface, "SHIELD ACTIVE", "medium", SCREEN_WIDTH // 2, 50, BLUE))
             
         # Achievement notifications
-        self.draw_achievement_notifications(surface)
+        rects.extend(self.draw_achievement_notifications(surface))
+        return rects
         
     def draw_boss_hud(self, surface, boss):
         if not boss.active:
-            return
+            return []
             
-        shake_x, shake_y = self.get_screen_shake()
-        
         # Boss name and phase
         boss_name = f"BOSS - Phase {boss.phase}"
-        self.draw_text(surface, boss_name, "medium", SCREEN_WIDTH // 2 + shake_x, 30 + shake_y, RED)
+        name_rect = self.draw_text(surface, boss_name, "medium", SCREEN_WIDTH // 2, 30, RED)
         
         # Boss health bar
         bar_width = 300
@@ -108,8 +179,9 @@ class UIManager:
         bar_x = SCREEN_WIDTH // 2 - bar_width // 2
         bar_y = 50
         
-        self.draw_health_bar(surface, bar_x + shake_x, bar_y + shake_y, 
-                           boss.health, boss.max_health, bar_width, bar_height, RED)
+        bar_rect = self.draw_health_bar(surface, bar_x, bar_y, 
+                                      boss.health, boss.max_health, bar_width, bar_height, RED)
+        return [name_rect, bar_rect]
         
     def draw_menu(self, surface, title, options, selected_index=0):
         surface.fill(BLACK)
@@ -231,28 +303,24 @@ class UIManager:
         self.draw_text(surface, percent_text, "medium", SCREEN_WIDTH // 2, bar_y + 40, WHITE)
         
     def screen_shake(self, intensity, duration):
-        self.shake_intensity = intensity
-        self.shake_timer = pygame.time.get_ticks() + duration
+        # Duration in milliseconds; the shake itself lives in effect_manager
+        effect_manager.start_screen_shake(intensity, duration)
         
     def get_screen_shake(self):
-        if pygame.time.get_ticks() < self.shake_timer:
-            import random
-            offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
-            return offset_x, offset_y
-        return 0, 0
+        return effect_manager.get_shake_offset()
         
     def add_achievement_notification(self, achievement_name, description):
         notification = {
             'name': achievement_name,
             'description': description,
-            'timer': pygame.time.get_ticks() + 3000,  # Show for 3 seconds
+            'timer': game_clock.get_ticks() + 3000,  # Show for 3 seconds
             'y_pos': len(self.achievement_notifications) * 60
         }
         self.achievement_notifications.append(notification)
         
     def draw_achievement_notifications(self, surface):
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
+        rects = []
         
         for notification in self.achievement_notifications[:]:
             if current_time > notification['timer']:
@@ -263,12 +331,14 @@ class UIManager:
             notification_rect = pygame.Rect(SCREEN_WIDTH - 320, notification['y_pos'], 300, 50)
             pygame.draw.rect(surface, (0, 0, 0, 180), notification_rect)
             pygame.draw.rect(surface, GOLD, notification_rect, 2)
+            rects.append(notification_rect)
             
             # Notification text
-            self.draw_text(surface, "Achievement Unlocked!", "small", 
-                          SCREEN_WIDTH - 170, notification['y_pos'] + 10, GOLD, False)
-            self.draw_text(surface, notification['name'], "small", 
-                          SCREEN_WIDTH - 170, notification['y_pos'] + 30, WHITE, False)
+            rects.append(self.draw_text(surface, "Achievement Unlocked!", "small", 
+                                        SCREEN_WIDTH - 170, notification['y_pos'] + 10, GOLD, False))
+            rects.append(self.draw_text(surface, notification['name'], "small", 
+                                        SCREEN_WIDTH - 170, notification['y_pos'] + 30, WHITE, False))
+        return rects
                           
     def draw_mini_map(self, surface, player, enemies, powerups):
         # Mini-map in top-right corner
@@ -305,7 +375,7 @@ class UIManager:
     def draw_fps_counter(self, surface, clock):
         fps = int(clock.get_fps())
         color = GREEN if fps >= 50 else YELLOW if fps >= 30 else RED
-        self.draw_text(surface, f"FPS: {fps}", "small", SCREEN_WIDTH - 60, SCREEN_HEIGHT - 20, color, False)
+        return self.draw_text(surface, f"FPS: {fps}", "small", SCREEN_WIDTH - 60, SCREEN_HEIGHT - 20, color, False)
         
     def create_button(self, surface, text, x, y, width, height, color=GREY, text_color=WHITE, border_color=WHITE):
         button_rect = pygame.Rect(x, y, width, height)
@@ -348,28 +418,11 @@ class UIManager:
         return None
         
     def save_high_score(self, score):
-        try:
-            with open(SAVE_PATHS["highscores"], 'r') as f:
-                scores = json.load(f)
-        except:
-            scores = []
-            
-        scores.append(score)
-        scores.sort(reverse=True)
-        scores = scores[:10]  # Keep top 10
-        
-        try:
-            with open(SAVE_PATHS["highscores"], 'w') as f:
-                json.dump(scores, f)
-        except:
-            pass
+        score_store.record_run({"score": score})
             
     def load_high_scores(self):
-        try:
-            with open(SAVE_PATHS["highscores"], 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        # Served from the store's in-memory leaderboard, so drawing never reads the disk
+        return score_store.get_high_scores()
             
     def draw_high_scores(self, surface):
         surface.fill(BLACK)
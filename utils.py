@@ -1,10 +1,10 @@
 import pygame
 import math
-import random
 import json
 import os
-from typing import Tuple, List, Optional, Dict, Any
+from typing import Tuple, List, Optional, Dict, Any, Union
 from config import *
+from session import session_random, game_clock
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(value, max_val))
@@ -43,21 +43,21 @@ def point_in_rect(point: Tuple[float, float], rect: pygame.Rect) -> bool:
     return rect.collidepoint(point)
 
 def random_color() -> Tuple[int, int, int]:
-    return (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+    return (session_random.randint(0, 255), session_random.randint(0, 255), session_random.randint(0, 255))
 
 def random_position_in_rect(rect: pygame.Rect) -> Tuple[int, int]:
-    return (random.randint(rect.left, rect.right), random.randint(rect.top, rect.bottom))
+    return (session_random.randint(rect.left, rect.right), session_random.randint(rect.top, rect.bottom))
 
 def random_position_offscreen(screen_width: int, screen_height: int, margin: int = 50) -> Tuple[int, int]:
-    side = random.randint(0, 3)
+    side = session_random.randint(0, 3)
     if side == 0:  # Top
-        return (random.randint(0, screen_width), -margin)
+        return (session_random.randint(0, screen_width), -margin)
     elif side == 1:  # Right
-        return (screen_width + margin, random.randint(0, screen_height))
+        return (screen_width + margin, session_random.randint(0, screen_height))
     elif side == 2:  # Bottom
-        return (random.randint(0, screen_width), screen_height + margin)
+        return (session_random.randint(0, screen_width), screen_height + margin)
     else:  # Left
-        return (-margin, random.randint(0, screen_height))
+        return (-margin, session_random.randint(0, screen_height))
 
 def wrap_position(pos: Tuple[float, float], screen_width: int, screen_height: int) -> Tuple[float, float]:
     x, y = pos
@@ -122,10 +122,18 @@ def create_gradient_surface(width: int, height: int, color1: Tuple[int, int, int
     
     return surface
 
+def write_file_atomic(filename: str, data: Union[str, bytes]):
+    # Write beside the target and rename over it, so a crash never leaves a half-written file
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, 'wb' if isinstance(data, bytes) else 'w') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_filename, filename)
+
 def save_json(data: Dict[str, Any], filename: str) -> bool:
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_file_atomic(filename, json.dumps(data, indent=2))
         return True
     except Exception as e:
         print(f"Error saving JSON to {filename}: {e}")
@@ -188,7 +196,7 @@ def create_outlined_text(text: str, font: pygame.font.Font, color: Tuple[int, in
 
 def screen_shake(intensity: int, duration: int) -> Tuple[int, int]:
     if duration > 0:
-        return (random.randint(-intensity, intensity), random.randint(-intensity, intensity))
+        return (session_random.randint(-intensity, intensity), session_random.randint(-intensity, intensity))
     return (0, 0)
 
 def calculate_level_multiplier(level: int) -> float:
@@ -199,7 +207,7 @@ def calculate_spawn_rate(base_rate: int, level: int) -> int:
 
 def weighted_choice(choices: List[Tuple[Any, float]]) -> Any:
     total_weight = sum(weight for _, weight in choices)
-    r = random.uniform(0, total_weight)
+    r = session_random.uniform(0, total_weight)
     
     current_weight = 0
     for choice, weight in choices:
@@ -251,12 +259,12 @@ class Timer:
     def __init__(self, duration: float, callback=None):
         self.duration = duration
         self.callback = callback
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.is_active = True
     
     def update(self):
         if self.is_active:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.start_time >= self.duration:
                 self.is_active = False
                 if self.callback:
@@ -265,19 +273,19 @@ class Timer:
         return False
     
     def reset(self):
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.is_active = True
     
     def get_remaining_time(self) -> float:
         if not self.is_active:
             return 0
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = game_clock.get_ticks() - self.start_time
         return max(0, self.duration - elapsed)
     
     def get_progress(self) -> float:
         if not self.is_active:
             return 1.0
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = game_clock.get_ticks() - self.start_time
         return min(1.0, elapsed / self.duration)
 
 class Cooldown:
@@ -286,15 +294,15 @@ class Cooldown:
         self.last_use = 0
     
     def can_use(self) -> bool:
-        return pygame.time.get_ticks() - self.last_use >= self.duration
+        return game_clock.get_ticks() - self.last_use >= self.duration
     
     def use(self):
-        self.last_use = pygame.time.get_ticks()
+        self.last_use = game_clock.get_ticks()
     
     def get_remaining_time(self) -> float:
-        elapsed = pygame.time.get_ticks() - self.last_use
+        elapsed = game_clock.get_ticks() - self.last_use
         return max(0, self.duration - elapsed)
     
     def get_progress(self) -> float:
-        elapsed = pygame.time.get_ticks() - self.last_use
+        elapsed = game_clock.get_ticks() - self.last_use
         return min(1.0, elapsed / self.duration)
\ No newline at end of file
@@ -0,0 +1,133 @@
+import pygame
+from typing import Dict, List, Optional
+from config import *
+from asset_manager import asset_manager
+
+class Voice:
+    """One mixer channel and what is playing on it"""
+    __slots__ = ("channel", "category", "priority", "order")
+
+    def __init__(self, channel: pygame.mixer.Channel):
+        self.channel = channel
+        self.category: Optional[str] = None
+        self.priority = -1
+        self.order = 0  # Higher started later
+
+class VoiceManager:
+    """Plays the pre-decoded sounds from asset_manager on a fixed set of voices.
+
+    play() only queues a request; flush() runs once per simulation step and
+    starts them, highest priority first. Identical sounds requested in the
+    same step become one voice that is louder by VOICE_DEDUP_VOLUME_STEP for
+    each extra copy. A category that has used up its voices restarts its
+    oldest one. When every channel is busy, the oldest voice of the lowest
+    priority at or below the new sound's priority is stolen; otherwise the
+    new sound is dropped. Volume is set on the channel, never on the shared
+    Sound.
+    """
+
+    def __init__(self):
+        self.voices: List[Voice] = []
+        self.pending: Dict[str, list] = {}  # sound name -> [volume, count, category]
+        self.order = 0
+        self.stats = {"played": 0, "merged": 0, "stolen": 0, "dropped": 0}
+
+    def init_channels(self) -> bool:
+        if self.voices:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+        self.voices = [Voice(pygame.mixer.Channel(index)) for index in range(MIXER_CHANNELS)]
+        return True
+
+    def play(self, sound_name: str, volume: float = 1.0, category: str = "effects"):
+        request = self.pending.get(sound_name)
+        if request is None:
+            self.pending[sound_name] = [volume, 1, category]
+        else:
+            request[0] = max(request[0], volume)
+            request[1] += 1
+            if self.get_priority(category) > self.get_priority(request[2]):
+                request[2] = category
+
+    def flush(self):
+        if not self.pending:
+            return
+        requests = sorted(self.pending.items(), key=lambda item: -self.get_priority(item[1][2]))
+        self.pending.clear()
+        if not self.init_channels():
+            return
+
+        for sound_name, (volume, count, category) in requests:
+            sound = asset_manager.get_sound(sound_name)
+            if sound is None:
+                continue
+            if count > 1:
+                volume *= 1 + VOICE_DEDUP_VOLUME_STEP * (count - 1)
+                self.stats["merged"] += count - 1
+
+            voice = self.find_voice(category)
+            if voice is None:
+                self.stats["dropped"] += 1
+                continue
+
+            voice.channel.play(sound)
+            voice.channel.set_volume(min(1.0, volume))
+            voice.category = category
+            voice.priority = self.get_priority(category)
+            self.order += 1
+            voice.order = self.order
+            self.stats["played"] += 1
+
+    def get_priority(self, category: str) -> int:
+        return SOUND_CATEGORIES.get(category, SOUND_CATEGORIES["effects"])["priority"]
+
+    def find_voice(self, category: str) -> Optional[Voice]:
+        free = None
+        oldest_in_category = None
+        in_category = 0
+        steal = None
+        priority = self.get_priority(category)
+
+        for voice in self.voices:
+            if not voice.channel.get_busy():
+                if free is None:
+                    free = voice
+                continue
+            if voice.category == category:
+                in_category += 1
+                if oldest_in_category is None or voice.order < oldest_in_category.order:
+                    oldest_in_category = voice
+            if voice.priority <= priority and (steal is None or (voice.priority, voice.order) < (steal.priority, steal.order)):
+                steal = voice
+
+        limit = SOUND_CATEGORIES.get(category, SOUND_CATEGORIES["effects"])["voices"]
+        if in_category >= limit:
+            return oldest_in_category
+        if free is not None:
+            return free
+        if steal is not None:
+            self.stats["stolen"] += 1
+        return steal
+
+    def stop_category(self, category: str):
+        for voice in self.voices:
+            if voice.category == category:
+                voice.channel.stop()
+
+    def is_category_busy(self, category: str) -> bool:
+        return any(voice.category == category and voice.channel.get_busy() for voice in self.voices)
+
+    def stop_all(self):
+        self.pending.clear()
+        for voice in self.voices:
+            voice.channel.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = dict(self.stats)
+        stats["busy"] = sum(1 for voice in self.voices if voice.channel.get_busy())
+        return stats
+
+# Global voice manager instance
+voice_manager = VoiceManager()